@@ -18,18 +18,24 @@ from transcriptions import (
     format_duration,  # Function to format duration in MM:SS format
     SUPPORTED_AUDIO_TYPES,  # List of supported audio file types
 )
+# Import the shared tokenized document used by scoring and profiling
+from document import Document
 # Import text analysis and interest scoring functions from interests module
 from interests import (
-    clean_text,  # Function to clean and normalize text
     score_interests,  # Function to score text against interest categories
+    score_timeline,  # Function to score interests per timestamped segment
+    TIMELINE_WINDOW_SECONDS,  # Default timeline window length
     get_top_interests,  # Function to get top N interest categories
     format_interest_table,  # Function to format scores for display
+    reload_taxonomy,  # Function to hot-swap an external keyword taxonomy
 )
 # Import user profiling functions from profiles module
 from profiles import (
     create_profile,  # Function to generate anonymous user profile
     format_profile_for_display,  # Function to format profile for display
 )
+# Import the shared result cache to report its hit rate
+from result_cache import RESULT_CACHE
 
 
 # Demo profiles with pre-made interest scores
@@ -246,6 +252,32 @@ def display_profile_section(interest_scores: Dict[str, float]) -> None:
             st.write(f"{i}. {suggestion}")
 
 
+def display_timeline_section(doc: Document, fuzzy: bool, window_seconds: float) -> None:
+    """Display how interest shares change over the recording."""
+    import pandas as pd
+    
+    # Score every segment once; window sizes are cheap differences afterwards
+    timeline = score_timeline(doc, fuzzy=fuzzy)
+    windows = timeline.windows(window_seconds)
+    if not windows:
+        return
+    
+    st.markdown('<div class="section-title">⏱️ Interest Timeline</div>', unsafe_allow_html=True)
+    st.write(f"*Share of each interest per {window_seconds:.0f}-second window*")
+    
+    # One column per category that appears anywhere, indexed by window start (MM:SS)
+    df = pd.DataFrame(
+        [w["scores"] for w in windows],
+        index=[format_duration(w["start"]) for w in windows],
+    )
+    df = df.loc[:, (df > 0).any()]
+    if df.empty:
+        st.write("No interest keywords found in any window.")
+        return
+    df.index.name = "Time"
+    st.area_chart(df)
+
+
 # Main application function that runs the Streamlit app
 def main() -> None:
     # Configure page title and icon
@@ -292,11 +324,29 @@ def main() -> None:
     # Display description
     st.markdown('<div class="subtitle">Upload audio to transcribe and discover interest categories</div>', unsafe_allow_html=True)
 
+    # Pick up taxonomy file edits without a restart (no-op unless INTEREST_TAXONOMY_PATH is set)
+    reload_taxonomy()
+
     # Display settings sidebar and get user configuration
     settings = render_transcription_sidebar()
     
-    # Add demo mode toggle in sidebar
+    # Add demo mode and scoring toggles in sidebar
     with st.sidebar:
+        st.divider()
+        st.subheader("Interest scoring")
+        # Fuzzy matching catches keywords Whisper mis-hears (e.g. "valor ant" → "valorant")
+        fuzzy = st.checkbox("🔤 Tolerate mis-heard keywords", value=False)
+        # Window length for the interest timeline chart
+        window_seconds = st.slider(
+            "Timeline window (seconds)", min_value=10, max_value=120,
+            value=int(TIMELINE_WINDOW_SECONDS), step=10,
+        )
+        # Reruns with an unchanged transcript are served from the result cache
+        cache_stats = RESULT_CACHE.stats()
+        st.caption(
+            f"Result cache: {cache_stats['hit_rate'] * 100:.0f}% hit rate "
+            f"({cache_stats['entries']} entries, {cache_stats['bytes'] / 1024:.0f} KB)"
+        )
         st.divider()
         st.subheader("Demo Mode")
         demo_mode = st.checkbox("🎮 Try Demo Mode (no audio needed)", value=False)
@@ -344,10 +394,11 @@ def main() -> None:
         # Display metadata separated by bullet points
         st.caption(" • ".join(parts))
 
-    # Clean transcribed text (lowercase and remove special characters)
-    cleaned = clean_text(transcript)
+    # Clean and tokenize the transcript once; all analysis shares this document
+    segments = meta.get("segments")
+    doc = Document.from_segments(segments) if segments else Document(transcript)
     # Score the text against interest categories
-    interest_scores = score_interests(cleaned)
+    interest_scores = score_interests(doc, fuzzy=fuzzy)
     # Create collapsible section for raw transcript
     with st.expander("Transcript (raw)", expanded=False):
         # Display transcript text or placeholder if empty
@@ -368,6 +419,10 @@ def main() -> None:
     # Display top 3 interests or message if no matches found
     st.write(top3 if top3 else ["No clear matches — add more keywords to your taxonomy."])
 
+    # Display interests over time when segment timestamps are available
+    if doc.segments:
+        display_timeline_section(doc, fuzzy, window_seconds)
+
     # Display the profile section
     display_profile_section(interest_scores)
 
@@ -0,0 +1,149 @@
+"""
+Tokenized Document
+
+Normalizes a transcript once and caches the cleaned text, token array and
+token offsets so the keyword scorer, chunker and classifier can share them.
+
+The classifier was trained on text that was only lowercased (see
+ml_preprocessing.clean_text), so it reads `vectorizer_view` instead of the
+keyword scorer's `cleaned` text.
+"""
+
+import hashlib
+import re
+from functools import cached_property
+from typing import Dict, List, Optional, Union
+
+
+# Text cleaning regex
+CLEAN_RE = re.compile(r"[^a-z0-9\s'+#]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def clean_text(text: str) -> str:
+    """Clean and normalize text to lowercase and remove special characters."""
+    text = text.lower()
+    text = CLEAN_RE.sub(" ", text)
+    text = WHITESPACE_RE.sub(" ", text).strip()
+    return text
+
+
+def lowercase_text(text: str) -> str:
+    """Lowercase and collapse whitespace only, as the classifier's training data is cleaned."""
+    return " ".join(text.lower().split())
+
+
+class Document:
+    """
+    A transcript that is cleaned and tokenized at most once.
+
+    Attributes:
+        text: Original (raw) text
+        cleaned: Lowercased text with special characters removed
+        tokens: Cleaned text split into tokens
+        offsets: Character offset of each token in `cleaned`
+        digest: SHA-256 of the raw text, used as a cache key
+        vectorizer_view: The same text cleaned the way classifier training data is
+        segments: Optional timestamped segments ({"start", "end", "text"})
+        segment_bounds: Token index where each segment starts (plus a final end)
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.segments: Optional[List[Dict]] = None
+        self.segment_bounds: Optional[List[int]] = None
+
+    @classmethod
+    def from_segments(cls, segments: List[Dict]) -> "Document":
+        """
+        Build a document from timestamped transcript segments.
+
+        Each segment is cleaned on its own so token ranges per segment are
+        known without a second pass over the joined text.
+
+        Args:
+            segments: List of {"start": seconds, "end": seconds, "text": str}
+
+        Returns:
+            Document whose tokens[segment_bounds[i]:segment_bounds[i + 1]]
+            belong to segments[i]
+        """
+        doc = cls(" ".join(seg["text"] for seg in segments).strip())
+
+        tokens = []
+        bounds = [0]
+        for seg in segments:
+            tokens.extend(clean_text(seg["text"]).split())
+            bounds.append(len(tokens))
+
+        # Pre-populate the cached properties; cleaning is per-character so this
+        # matches what cleaning the joined text would produce
+        doc.__dict__["tokens"] = tokens
+        doc.__dict__["cleaned"] = " ".join(tokens)
+        doc.segments = list(segments)
+        doc.segment_bounds = bounds
+        return doc
+
+    @cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(self.text.encode("utf-8")).hexdigest()
+
+    @cached_property
+    def cleaned(self) -> str:
+        return clean_text(self.text)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        return self.cleaned.split()
+
+    @cached_property
+    def offsets(self) -> List[int]:
+        # Cleaned text is single-space separated, so offsets follow from token lengths
+        offsets = []
+        pos = 0
+        for tok in self.tokens:
+            offsets.append(pos)
+            pos += len(tok) + 1
+        return offsets
+
+    @cached_property
+    def vectorizer_view(self) -> "Document":
+        """
+        Document over the same text with `cleaned` only lowercased.
+
+        Accents and punctuation are kept ("café" stays "café"), so the
+        features match the ones the classifier was trained on. Tokens,
+        offsets and span() all refer to this lowercased text.
+        """
+        view = Document(self.text)
+        view.__dict__["digest"] = self.digest
+        view.__dict__["cleaned"] = lowercase_text(self.text)
+        view.__dict__["vectorizer_view"] = view
+        return view
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def span(self, start: int, end: int) -> str:
+        """
+        Return the cleaned text covering tokens[start:end] without re-joining.
+
+        Args:
+            start: Index of the first token
+            end: Index one past the last token
+
+        Returns:
+            Substring of `cleaned`
+        """
+        start = max(0, start)
+        end = min(len(self.tokens), end)
+        if start >= end:
+            return ""
+        return self.cleaned[self.offsets[start]:self.offsets[end - 1] + len(self.tokens[end - 1])]
+
+
+def as_document(text: Union[str, Document]) -> Document:
+    """Wrap raw text in a Document, passing existing Documents through."""
+    if isinstance(text, Document):
+        return text
+    return Document(text)
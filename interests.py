@@ -1,6 +1,19 @@
-import re
-from collections import Counter, defaultdict
-from typing import Dict, Tuple, Set, List, Optional
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from itertools import accumulate
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple, Set, List, Optional, FrozenSet, Union
+
+from document import Document, as_document, clean_text
+from result_cache import RESULT_CACHE, content_key
 
 
 # Enhanced interest taxonomy with weighted keywords
@@ -133,145 +146,594 @@ CONTEXT_BOOSTERS = {
     },
 }
 
-# Text cleaning regex
-CLEAN_RE = re.compile(r"[^a-z0-9\s'+#]")
-
 # Configuration
 MIN_SCORE_THRESHOLD = 3.0  # Minimum percentage to include in results
 NEGATION_WINDOW = 3  # Words before keyword to check for negation
 CONTEXT_WINDOW = 5  # Words around keyword to check for context
 CONTEXT_BOOST = 1.3  # Multiplier when context words found
 
+# External taxonomy configuration
+TAXONOMY_PATH_ENV = "INTEREST_TAXONOMY_PATH"  # JSON taxonomy file loaded instead of the built-in one
+TAXONOMY_CACHE_DIR = ".taxonomy_cache"  # Compiled index of the last loaded file, stored next to it
+TAXONOMY_INDEX_FORMAT = 4  # Bump when the serialized CompiledTaxonomy changes shape
+
+# Fuzzy (ASR-tolerant) matching configuration
+FUZZY_MIN_LENGTH = 6  # Shorter keywords are too ambiguous to match fuzzily
+FUZZY_LONG_WORD = 8  # Keywords at least this long tolerate 2 edits, shorter ones 1 substitution
+FUZZY_MAX_DISTANCE = 2  # Deletes precomputed per keyword
+FUZZY_MAX_TOKEN_LENGTH = 24  # Longer tokens are never looked up, keeping lookups bounded
+FUZZY_WEIGHT = 0.6  # Multiplier applied to keywords matched through a variant
+ENGLISH_WORDS_PATH = Path(__file__).with_name("english_words.txt.gz")  # Real words, never matched fuzzily
+
+# Inflection suffixes stripped to find a word's base form, with what replaces them
+INFLECTIONS = (
+    ("ies", "y"), ("ied", "y"), ("es", ""), ("s", ""), ("'s", ""),
+    ("ed", ""), ("ed", "e"), ("d", ""), ("ing", ""), ("ing", "e"),
+    ("er", ""), ("er", "e"), ("ers", ""), ("ers", "e"), ("ly", ""),
+)
+
+# Timeline configuration
+TIMELINE_WINDOW_SECONDS = 30.0  # Default window length for interest timelines
+
+
+@dataclass(frozen=True)
+class CompiledTaxonomy:
+    """Immutable, pre-indexed taxonomy used by the scorer."""
+    version: str  # Content hash of the taxonomy source
+    categories: Tuple[str, ...]  # Category names in display order
+    token_index: Dict[str, Tuple[Tuple[str, float], ...]]  # token -> ((category, weight), ...)
+    phrase_index: Dict[str, Tuple[Tuple[Tuple[str, ...], str, float], ...]]  # first token -> ((phrase tokens, category, weight), ...)
+    negations: FrozenSet[str]
+    context_boosters: Dict[str, FrozenSet[str]]
+    fuzzy_index: Dict[str, Tuple[str, ...]]  # deletion variant -> keywords it can come from
+    exact_words: FrozenSet[str]  # Words never matched fuzzily on top of the English vocabulary
+
+
+def _taxonomy_version(weighted_keywords: Dict, negations, context_boosters: Dict, exact_words) -> str:
+    """Hash taxonomy contents so identical taxonomies share a version."""
+    payload = json.dumps(
+        {
+            "categories": weighted_keywords,
+            "negations": sorted(negations),
+            "context_boosters": {cat: sorted(words) for cat, words in context_boosters.items()},
+            "exact_words": sorted(exact_words),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
 
-def clean_text(text: str) -> str:
-    """Clean and normalize text to lowercase and remove special characters."""
-    text = text.lower()
-    text = CLEAN_RE.sub(" ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+def _max_edits(keyword: str) -> int:
+    """Edit distance a keyword tolerates, based on its length."""
+    if len(keyword) < FUZZY_MIN_LENGTH:
+        return 0
+    return FUZZY_MAX_DISTANCE if len(keyword) >= FUZZY_LONG_WORD else 1
 
 
-def build_keyword_index() -> Tuple[Dict[str, Dict[str, float]], Dict[str, List]]:
-    """Build indexed keyword structure for fast matching."""
-    token_keywords = {}
-    phrase_patterns = {}
+def _deletes(word: str, depth: int) -> Set[str]:
+    """All strings reachable from word by deleting up to depth characters."""
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance, returning limit + 1 once it is exceeded."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev2, prev = prev, cur
+    return prev[-1]
+
+
+def build_fuzzy_index(keywords) -> Dict[str, Tuple[str, ...]]:
+    """
+    Build a SymSpell-style deletion index over single-token keywords.
     
-    for cat, kw_weights in WEIGHTED_KEYWORDS.items():
-        tokens = {}
-        patterns = []
-        
+    Every keyword is stored under each string reachable by deleting up to
+    its allowed number of characters, so a lookup only needs the deletes of
+    the query token instead of a distance computation against every keyword.
+    """
+    fuzzy_index = defaultdict(set)
+    for kw in keywords:
+        for variant in _deletes(kw, _max_edits(kw)):
+            if len(variant) >= FUZZY_MIN_LENGTH - FUZZY_MAX_DISTANCE:
+                fuzzy_index[variant].add(kw)
+    return {variant: tuple(sorted(kws)) for variant, kws in fuzzy_index.items()}
+
+
+@lru_cache(maxsize=1)
+def english_vocabulary() -> FrozenSet[str]:
+    """Common English words (Zipf frequency >= 2.0), loaded from ENGLISH_WORDS_PATH on first use."""
+    with gzip.open(ENGLISH_WORDS_PATH, "rt", encoding="utf-8") as f:
+        return frozenset(line.strip() for line in f if line.strip() and not line.startswith("#"))
+
+
+def base_forms(token: str) -> List[str]:
+    """Candidate uninflected forms of token ("interviews" -> "interview", "managed" -> "manage")."""
+    forms = []
+    for suffix, replacement in INFLECTIONS:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            stem = token[:-len(suffix)]
+            forms.append(stem + replacement)
+            # Doubled final consonant: "swimming" -> "swim", "stopped" -> "stop"
+            if not replacement and len(stem) > 3 and stem[-1] == stem[-2]:
+                forms.append(stem[:-1])
+    return forms
+
+
+def is_known_word(token: str, taxonomy: "CompiledTaxonomy") -> bool:
+    """
+    True if token is a real word that must not be fuzzed: it, its base form,
+    or another inflection of that base ("colorizes" via "colorized") is in
+    the English vocabulary or the taxonomy's exact_words.
+    """
+    known = english_vocabulary()
+    extra = taxonomy.exact_words
+    if token in known or token in extra:
+        return True
+    for form in base_forms(token):
+        for related in (form, *(form + suffix for suffix in ("s", "es", "d", "ed", "ing", "er"))):
+            if related in known or related in extra:
+                return True
+    return False
+
+
+def _fuzzy_allowed(token: str, keyword: str) -> bool:
+    """
+    Shape check a fuzzy candidate must pass before the distance check.
+    
+    Short keywords sit one edit away from many words, so keywords under
+    FUZZY_LONG_WORD only tolerate a same-length substitution or transposition.
+    Two-edit matches must also keep the first letter ("catchin" is not
+    "watching").
+    """
+    if len(keyword) < FUZZY_LONG_WORD:
+        return len(token) == len(keyword)
+    return token[0] == keyword[0] or _edit_distance(token, keyword, 1) <= 1
+
+
+def fuzzy_lookup(token: str, taxonomy: "CompiledTaxonomy") -> Optional[Tuple[str, int]]:
+    """
+    Find the closest keyword within its allowed edit distance of token.
+    
+    Only out-of-vocabulary tokens are looked up: a real English word (see
+    english_vocabulary), an inflection of one, or a word in the taxonomy's
+    exact_words is never rewritten into a keyword. Cost is bounded by the
+    token's own deletes (token length is capped), not by the number of
+    keywords in the taxonomy.
+    
+    Returns:
+        Tuple of (keyword, distance), or None if nothing is close enough
+    """
+    if not FUZZY_MIN_LENGTH - 1 <= len(token) <= FUZZY_MAX_TOKEN_LENGTH:
+        return None
+    if is_known_word(token, taxonomy):
+        return None
+    
+    best = None
+    seen = set()
+    for variant in _deletes(token, FUZZY_MAX_DISTANCE):
+        for kw in taxonomy.fuzzy_index.get(variant, ()):
+            if kw in seen:
+                continue
+            seen.add(kw)
+            if not _fuzzy_allowed(token, kw):
+                continue
+            distance = _edit_distance(token, kw, _max_edits(kw))
+            if distance <= _max_edits(kw) and (best is None or (distance, kw) < best[::-1]):
+                best = (kw, distance)
+    return best
+
+
+def compile_taxonomy(
+    weighted_keywords: Dict[str, Dict[str, float]],
+    negations=NEGATIONS,
+    context_boosters: Optional[Dict[str, Set[str]]] = None,
+    version: Optional[str] = None,
+    exact_words=(),
+) -> CompiledTaxonomy:
+    """
+    Compile a keyword taxonomy into inverted indices for fast matching.
+    
+    Keywords are keyed by token rather than by category, so scoring walks the
+    transcript once and does one dict lookup per token regardless of how many
+    keywords or categories the taxonomy holds. A deletion index for fuzzy
+    matching is built alongside it.
+    
+    Args:
+        weighted_keywords: Mapping of category -> {keyword: weight}
+        negations: Words that negate a following keyword
+        context_boosters: Mapping of category -> words that boost its keywords
+        version: Optional version string (defaults to a content hash)
+        exact_words: Words never matched fuzzily, on top of the English
+            vocabulary (negations and context words are always included)
+    
+    Returns:
+        CompiledTaxonomy ready to pass to score_interests
+    """
+    if context_boosters is None:
+        context_boosters = CONTEXT_BOOSTERS
+    
+    token_index = defaultdict(list)
+    phrase_index = defaultdict(list)
+    
+    for cat, kw_weights in weighted_keywords.items():
         for kw, weight in kw_weights.items():
             normalized = clean_text(kw)
             if not normalized:
                 continue
             
-            # Multi-word keywords become regex patterns
-            if " " in normalized:
-                patterns.append((re.compile(rf"\b{re.escape(normalized)}\b"), weight))
+            # Multi-word keywords are indexed by their first token
+            words = tuple(normalized.split())
+            if len(words) > 1:
+                phrase_index[words[0]].append((words, cat, float(weight)))
             else:
-                tokens[normalized] = weight
-        
-        token_keywords[cat] = tokens
-        phrase_patterns[cat] = patterns
+                token_index[normalized].append((cat, float(weight)))
     
-    return token_keywords, phrase_patterns
+    return CompiledTaxonomy(
+        version=version or _taxonomy_version(weighted_keywords, negations, context_boosters, exact_words),
+        categories=tuple(weighted_keywords),
+        token_index={tok: tuple(entries) for tok, entries in token_index.items()},
+        phrase_index={tok: tuple(entries) for tok, entries in phrase_index.items()},
+        negations=frozenset(clean_text(word) for word in negations),
+        context_boosters={cat: frozenset(words) for cat, words in context_boosters.items()},
+        fuzzy_index=build_fuzzy_index(token_index),
+        exact_words=frozenset(clean_text(word) for word in exact_words).union(
+            clean_text(word) for word in negations
+        ).union(*context_boosters.values()),
+    )
+
+
+def _taxonomy_to_json(taxonomy: CompiledTaxonomy) -> Dict:
+    """Plain-JSON form of a compiled taxonomy (see _taxonomy_from_json)."""
+    return {
+        "format": TAXONOMY_INDEX_FORMAT,
+        "version": taxonomy.version,
+        "categories": list(taxonomy.categories),
+        "token_index": taxonomy.token_index,
+        "phrase_index": taxonomy.phrase_index,
+        "negations": sorted(taxonomy.negations),
+        "context_boosters": {cat: sorted(words) for cat, words in taxonomy.context_boosters.items()},
+        # Millions of variants: newline-joined strings parse far faster than a JSON object
+        "fuzzy_variants": "\n".join(taxonomy.fuzzy_index),
+        "fuzzy_keywords": "\n".join("\t".join(kws) for kws in taxonomy.fuzzy_index.values()),
+        "exact_words": sorted(taxonomy.exact_words),
+    }
+
+
+def _taxonomy_from_json(data: Dict) -> CompiledTaxonomy:
+    """Rebuild a CompiledTaxonomy from _taxonomy_to_json output, without recompiling."""
+    if data.get("format") != TAXONOMY_INDEX_FORMAT:
+        raise ValueError(f"Compiled taxonomy format {data.get('format')}, expected {TAXONOMY_INDEX_FORMAT}")
+    return CompiledTaxonomy(
+        version=data["version"],
+        categories=tuple(data["categories"]),
+        token_index={
+            tok: tuple((cat, weight) for cat, weight in entries)
+            for tok, entries in data["token_index"].items()
+        },
+        phrase_index={
+            tok: tuple((tuple(words), cat, weight) for words, cat, weight in entries)
+            for tok, entries in data["phrase_index"].items()
+        },
+        negations=frozenset(data["negations"]),
+        context_boosters={cat: frozenset(words) for cat, words in data["context_boosters"].items()},
+        fuzzy_index=dict(zip(
+            data["fuzzy_variants"].split("\n"),
+            [tuple(kws.split("\t")) for kws in data["fuzzy_keywords"].split("\n")],
+        )) if data["fuzzy_variants"] else {},
+        exact_words=frozenset(data["exact_words"]),
+    )
+
+
+def load_taxonomy(path: str, cache_dir: Optional[str] = None) -> CompiledTaxonomy:
+    """
+    Load a taxonomy from a JSON file, reusing its compiled index when possible.
+    
+    The file holds a "categories" mapping of category -> {keyword: weight},
+    plus optional "negations" (list), "context_boosters" (category -> list)
+    and "exact_words" (list of extra words never matched fuzzily, e.g. names).
+    The compiled index (including the fuzzy deletion index) is cached as
+    <sha256 of the file>.json under cache_dir, so reloading a file that was
+    compiled before skips compilation. Only the newest index is kept.
+    
+    Args:
+        path: Path to the taxonomy JSON file
+        cache_dir: Directory for the compiled index (defaults to a
+            .taxonomy_cache directory next to the taxonomy file)
+    
+    Returns:
+        CompiledTaxonomy for the file contents
+    
+    Raises:
+        OSError: If the file can't be read
+        ValueError: If the file is not valid JSON or has the wrong shape
+    """
+    source = Path(path)
+    raw = source.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    
+    cache_root = Path(cache_dir) if cache_dir else source.parent / TAXONOMY_CACHE_DIR
+    cache_file = cache_root / f"{digest}.json"
+    
+    if cache_file.exists():
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return _taxonomy_from_json(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # Corrupt or outdated index, recompile below
+    
+    spec = json.loads(raw.decode("utf-8"))
+    if not isinstance(spec, dict) or not isinstance(spec.get("categories"), dict):
+        raise ValueError(f"Taxonomy file {path} must contain a 'categories' mapping.")
+    if not all(isinstance(kw_weights, dict) for kw_weights in spec["categories"].values()):
+        raise ValueError(f"Taxonomy file {path}: every category must map keywords to weights.")
+    
+    taxonomy = compile_taxonomy(
+        spec["categories"],
+        negations=spec.get("negations", NEGATIONS),
+        context_boosters={cat: set(words) for cat, words in spec.get("context_boosters", {}).items()},
+        exact_words=spec.get("exact_words", ()),
+        version=digest[:16],
+    )
+    
+    # Write to a temp file first so readers never see a half-written index,
+    # then drop the indices of earlier versions of the file
+    try:
+        cache_root.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=cache_root, suffix=".tmp", delete=False) as tmp:
+            json.dump(_taxonomy_to_json(taxonomy), tmp)
+        os.replace(tmp.name, cache_file)
+        for stale in cache_root.glob("*.json"):
+            if stale != cache_file:
+                stale.unlink()
+    except OSError:
+        pass  # Caching is best-effort; a read-only location just means recompiling next time
+    
+    return taxonomy
+
+
+def dump_taxonomy(path: str) -> None:
+    """Write the built-in taxonomy to a JSON file as a starting point for edits."""
+    spec = {
+        "categories": WEIGHTED_KEYWORDS,
+        "negations": sorted(NEGATIONS),
+        "context_boosters": {cat: sorted(words) for cat, words in CONTEXT_BOOSTERS.items()},
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(spec, f, indent=2)
+
+
+# Active taxonomy, swapped as a single reference so readers always see a complete index
+_active_taxonomy: Optional[CompiledTaxonomy] = None
+_taxonomy_source: Optional[Tuple[str, float]] = None  # (path, mtime) of the loaded file
+_taxonomy_error: Optional[Tuple[str, Optional[float]]] = None  # (path, mtime) of the last file that failed to load
+_taxonomy_lock = threading.Lock()
 
 
-# Pre-build indices
-TOKEN_KEYWORDS, PHRASE_PATTERNS = build_keyword_index()
+def get_taxonomy() -> CompiledTaxonomy:
+    """Return the active taxonomy, compiling the built-in one on first use."""
+    global _active_taxonomy
+    taxonomy = _active_taxonomy
+    if taxonomy is None:
+        with _taxonomy_lock:
+            if _active_taxonomy is None:
+                _active_taxonomy = compile_taxonomy(WEIGHTED_KEYWORDS, NEGATIONS, CONTEXT_BOOSTERS)
+            taxonomy = _active_taxonomy
+    return taxonomy
 
 
-def check_negation(tokens: List[str], index: int, window: int = NEGATION_WINDOW) -> bool:
-    """Check if keyword at index is negated by nearby negation words."""
-    start = max(0, index - window)
-    return any(tokens[i] in NEGATIONS for i in range(start, index))
+def set_taxonomy(taxonomy: CompiledTaxonomy) -> CompiledTaxonomy:
+    """
+    Atomically replace the active taxonomy.
+    
+    Calls already in progress keep scoring with the taxonomy they started with.
+    
+    Returns:
+        The previously active taxonomy
+    """
+    global _active_taxonomy
+    with _taxonomy_lock:
+        previous = _active_taxonomy
+        _active_taxonomy = taxonomy
+    return previous
 
 
-def check_context_boost(tokens: List[str], index: int, category: str, 
-                        window: int = CONTEXT_WINDOW) -> bool:
-    """Check if keyword has supporting context words nearby."""
-    context_words = CONTEXT_BOOSTERS.get(category, set())
-    if not context_words:
+def reload_taxonomy(path: Optional[str] = None, cache_dir: Optional[str] = None) -> bool:
+    """
+    Hot-swap the active taxonomy if its source file changed.
+    
+    Cheap to call on every request: when the file's mtime is unchanged this
+    is a single stat. The new index is loaded before the swap, so scoring
+    never waits on compilation. A missing, half-written or malformed file
+    keeps the current taxonomy active (with a warning) until it is fixed.
+    
+    Args:
+        path: Taxonomy JSON file (defaults to $INTEREST_TAXONOMY_PATH)
+        cache_dir: Directory for the compiled index (see load_taxonomy)
+    
+    Returns:
+        True if a new taxonomy was activated
+    """
+    global _taxonomy_source, _taxonomy_error
+    path = path or os.environ.get(TAXONOMY_PATH_ENV)
+    if not path:
         return False
     
-    start = max(0, index - window)
-    end = min(len(tokens), index + window + 1)
+    mtime = None
+    try:
+        mtime = os.stat(path).st_mtime
+        if _taxonomy_source == (path, mtime):
+            return False
+        taxonomy = load_taxonomy(path, cache_dir=cache_dir)
+    except (OSError, ValueError) as e:
+        # Warn once per broken file state rather than on every rerun
+        if _taxonomy_error != (path, mtime):
+            _taxonomy_error = (path, mtime)
+            print(f"⚠️  Could not load taxonomy {path}, keeping the current one: {e}")
+        return False
+    
+    current = _active_taxonomy
+    _taxonomy_source = (path, mtime)
+    _taxonomy_error = None
+    if current is not None and current.version == taxonomy.version:
+        return False
     
-    nearby_words = set(tokens[start:index] + tokens[index+1:end])
-    return bool(nearby_words & context_words)
+    set_taxonomy(taxonomy)
+    return True
 
 
-def score_interests(text: str, include_details: bool = False) -> Dict[str, any]:
+def score_interests(text: Union[str, Document], include_details: bool = False,
+                    taxonomy: Optional[CompiledTaxonomy] = None,
+                    fuzzy: bool = False) -> Dict[str, any]:
     """
     Score text against interest categories and return normalized percentages.
     
+    Runs in a single pass over the tokens, so cost grows with transcript
+    length and matches rather than with taxonomy size. Results are memoized
+    in RESULT_CACHE by content hash and taxonomy version, so repeated calls
+    on the same text skip text processing entirely.
+    
     Args:
-        text: Input text to analyze
+        text: Input text or an already tokenized Document
         include_details: If True, return matched keywords and confidence levels
+        taxonomy: Taxonomy to score against (defaults to the active one)
+        fuzzy: If True, also match inflected keywords ("interviews") at full
+            weight, and mis-transcribed ones (split words like "valor ant",
+            misspellings within 1-2 edits that are not real English words)
+            at FUZZY_WEIGHT. Mis-hearings into other real words ("cooper
+            netties" for "kubernetes") are out of scope: they are neither
+            out-of-vocabulary nor within 2 edits
     
     Returns:
         Dictionary with scores (and optionally details)
     """
-    cleaned = clean_text(text)
-    tokens = cleaned.split()
-    token_counts = Counter(tokens)
+    # Snapshot the taxonomy once so a concurrent hot-swap can't mix indices
+    taxonomy = taxonomy or get_taxonomy()
+    key = ("score_interests", content_key(text), taxonomy.version, include_details, fuzzy)
+    return RESULT_CACHE.get_or_compute(
+        key, lambda: _score_interests(text, include_details, taxonomy, fuzzy)
+    )
 
-    scores = {}
-    matched_keywords = defaultdict(list) if include_details else None
+
+def _iter_matches(tokens: List[str], taxonomy: CompiledTaxonomy, fuzzy: bool):
+    """
+    Walk the tokens once, yielding every scored keyword match.
+    
+    Yields:
+        Tuples of (token index, category, matched keyword, score)
+    """
+    token_index = taxonomy.token_index
+    phrase_index = taxonomy.phrase_index
+    
+    # Prefix counts of negation words: any window check becomes an O(1) difference
+    negation_prefix = [0]
+    for tok in tokens:
+        negation_prefix.append(negation_prefix[-1] + (tok in taxonomy.negations))
+    
+    def is_negated(idx: int) -> bool:
+        return negation_prefix[idx] > negation_prefix[max(0, idx - NEGATION_WINDOW)]
+    
+    def is_boosted(idx: int, cat: str) -> bool:
+        context_words = taxonomy.context_boosters.get(cat)
+        if not context_words:
+            return False
+        start = max(0, idx - CONTEXT_WINDOW)
+        end = min(len(tokens), idx + CONTEXT_WINDOW + 1)
+        return any(tokens[i] in context_words for i in range(start, end) if i != idx)
+    
+    def is_exact(tok: str) -> bool:
+        return tok in token_index or tok in phrase_index
+    
+    fuzzy_cache = {}
     
-    for cat in WEIGHTED_KEYWORDS:
-        score = 0.0
+    def match_variant(idx: int) -> Optional[Tuple[str, str, int, bool]]:
+        # Returns (heard text, keyword, tokens consumed, exact) for an inflected
+        # or mis-transcribed keyword
+        tok = tokens[idx]
         
-        # Score single-token keywords
-        for kw, weight in TOKEN_KEYWORDS.get(cat, {}).items():
-            if kw in token_counts:
-                # Find all positions of this keyword
-                indices = [i for i, t in enumerate(tokens) if t == kw]
-                
-                for idx in indices:
-                    # Check for negation
-                    if check_negation(tokens, idx):
-                        continue
-                    
-                    # Apply base weight
-                    kw_score = weight
-                    
-                    # Apply context boost if applicable
-                    if check_context_boost(tokens, idx, cat):
-                        kw_score *= CONTEXT_BOOST
-                    
-                    score += kw_score
-                    
-                    if include_details:
-                        matched_keywords[cat].append((kw, kw_score))
+        # Inflections of a keyword ("interviews") count as the keyword itself
+        for form in base_forms(tok):
+            if form in token_index:
+                return tok, form, 1, True
+        
+        # ASR often splits one word in two ("valor ant")
+        nxt = tokens[idx + 1] if idx + 1 < len(tokens) else None
+        joined = tok + nxt if nxt is not None and not is_exact(nxt) else None
+        if joined in token_index:
+            return f"{tok} {nxt}", joined, 2, False
         
-        # Score multi-word phrase patterns
-        for pattern, weight in PHRASE_PATTERNS.get(cat, []):
-            matches = pattern.finditer(cleaned)
-            for match in matches:
-                # Calculate token position for negation check
-                match_start = match.start()
-                tokens_before = cleaned[:match_start].split()
-                token_idx = len(tokens_before)
-                
-                # Check for negation
-                if check_negation(tokens, token_idx):
-                    continue
-                
-                # Apply base weight
-                phrase_score = weight
-                
-                # Apply context boost if applicable
-                if check_context_boost(tokens, token_idx, cat):
-                    phrase_score *= CONTEXT_BOOST
-                
-                score += phrase_score
-                
-                if include_details:
-                    matched_keywords[cat].append((match.group(), phrase_score))
+        for candidate, consumed in ((tok, 1), (joined, 2)):
+            if candidate is None:
+                continue
+            if candidate not in fuzzy_cache:
+                fuzzy_cache[candidate] = fuzzy_lookup(candidate, taxonomy)
+            if fuzzy_cache[candidate]:
+                return " ".join(tokens[idx:idx + consumed]), fuzzy_cache[candidate][0], consumed, False
+        return None
+    
+    skip_until = 0
+    
+    for idx, tok in enumerate(tokens):
+        if idx < skip_until:
+            continue
         
-        scores[cat] = score
+        hits = token_index.get(tok, ())
+        phrases = phrase_index.get(tok, ())
+        heard = None
+        exact = True
+        if not hits and not phrases:
+            variant = match_variant(idx) if fuzzy else None
+            if variant is None:
+                continue
+            heard, keyword, consumed, exact = variant
+            hits = token_index[keyword]
+            skip_until = idx + consumed
+        
+        # Check for negation
+        if is_negated(idx):
+            continue
+        
+        # Score single-token keywords
+        for cat, weight in hits:
+            kw_score = weight * CONTEXT_BOOST if is_boosted(idx, cat) else weight
+            if not exact:
+                kw_score *= FUZZY_WEIGHT
+            yield idx, cat, (tok if heard is None else f"{heard} ({keyword})"), kw_score
+        
+        # Score multi-word phrases starting at this token
+        for words, cat, weight in phrases:
+            if tuple(tokens[idx:idx + len(words)]) != words:
+                continue
+            phrase_score = weight * CONTEXT_BOOST if is_boosted(idx, cat) else weight
+            yield idx, cat, " ".join(words), phrase_score
+
 
+def _score_interests(text: Union[str, Document], include_details: bool,
+                     taxonomy: CompiledTaxonomy, fuzzy: bool) -> Dict[str, any]:
+    """Uncached implementation of score_interests."""
+    scores = {cat: 0.0 for cat in taxonomy.categories}
+    matched_keywords = defaultdict(list) if include_details else None
+    
+    for _, cat, keyword, kw_score in _iter_matches(as_document(text).tokens, taxonomy, fuzzy):
+        scores[cat] += kw_score
+        if include_details:
+            matched_keywords[cat].append((keyword, kw_score))
+    
     # Calculate percentages
     total = sum(scores.values())
     if total == 0:
@@ -323,18 +785,20 @@ def format_interest_table(scores: Dict[str, float]) -> List[Dict]:
     return [{"Category": k, "Score (%)": v} for k, v in sorted_items]
 
 
-def analyze_text(text: str, verbose: bool = False) -> Dict:
+def analyze_text(text: Union[str, Document], verbose: bool = False, fuzzy: bool = False) -> Dict:
     """
     Main analysis function with optional verbose output.
     
     Args:
-        text: Input text to analyze
+        text: Input text or an already tokenized Document
         verbose: If True, includes matched keywords and confidence levels
+        fuzzy: If True, also match mis-transcribed keywords
     
     Returns:
-        Analysis results with scores and optional details
+        Analysis results with scores and optional details (scoring is
+        memoized by score_interests, so there is no separate cache here)
     """
-    results = score_interests(text, include_details=verbose)
+    results = score_interests(text, include_details=verbose, fuzzy=fuzzy)
     
     if verbose:
         scores = results["scores"]
@@ -354,6 +818,123 @@ def analyze_text(text: str, verbose: bool = False) -> Dict:
     return analysis
 
 
+def _share_of_total(scores: Dict[str, float]) -> Dict[str, float]:
+    """Convert raw scores to percentages of their total."""
+    total = sum(scores.values())
+    if total == 0:
+        return {k: 0.0 for k in scores}
+    return {k: round(v / total * 100, 1) for k, v in scores.items()}
+
+
+@dataclass(frozen=True)
+class InterestTimeline:
+    """
+    Per-segment interest scores for a timestamped transcript.
+    
+    Scores are stored as cumulative sums over segments, so the score of any
+    run of segments (and therefore any time window) is a single difference
+    per category instead of a re-scoring pass.
+    """
+    categories: Tuple[str, ...]
+    starts: Tuple[float, ...]  # Segment start times in seconds (ascending)
+    ends: Tuple[float, ...]  # Segment end times in seconds
+    cumulative: Dict[str, Tuple[float, ...]]  # category -> prefix sums (len = segments + 1)
+    
+    def range_scores(self, first: int, last: int) -> Dict[str, float]:
+        """Raw scores for segments[first:last]."""
+        return {cat: self.cumulative[cat][last] - self.cumulative[cat][first] for cat in self.categories}
+    
+    def window_scores(self, start: float, end: float) -> Dict[str, float]:
+        """Raw scores for segments starting within [start, end) seconds."""
+        return self.range_scores(bisect_left(self.starts, start), bisect_left(self.starts, end))
+    
+    def segment_scores(self) -> List[Dict]:
+        """Raw scores for every segment with its timestamps."""
+        return [
+            {"start": self.starts[i], "end": self.ends[i], "scores": self.range_scores(i, i + 1)}
+            for i in range(len(self.starts))
+        ]
+    
+    def windows(self, window_seconds: float = TIMELINE_WINDOW_SECONDS,
+                step_seconds: Optional[float] = None) -> List[Dict]:
+        """
+        Percentage share of each interest per time window.
+        
+        Args:
+            window_seconds: Length of each window
+            step_seconds: Distance between window starts (defaults to window_seconds)
+        
+        Returns:
+            List of {"start", "end", "scores"} dicts, scores in percent
+        
+        Raises:
+            ValueError: If window_seconds or step_seconds is not positive
+        """
+        if step_seconds is None:
+            step_seconds = window_seconds
+        if window_seconds <= 0 or step_seconds <= 0:
+            raise ValueError(
+                f"window_seconds and step_seconds must be positive (got {window_seconds}, {step_seconds})"
+            )
+        if not self.starts:
+            return []
+        duration = max(self.ends)
+        
+        windows = []
+        t = 0.0
+        while t < duration:
+            windows.append({
+                "start": t,
+                "end": t + window_seconds,
+                "scores": _share_of_total(self.window_scores(t, t + window_seconds)),
+            })
+            t += step_seconds
+        return windows
+
+
+def score_timeline(doc: Document, fuzzy: bool = False,
+                   taxonomy: Optional[CompiledTaxonomy] = None) -> InterestTimeline:
+    """
+    Score a timestamped transcript into a per-segment interest timeline.
+    
+    The whole transcript is matched in one pass (so negation and context
+    windows still span segment boundaries); each match is attributed to the
+    segment its token falls in.
+    
+    Args:
+        doc: Document built with Document.from_segments
+        fuzzy: If True, also match mis-transcribed keywords
+        taxonomy: Taxonomy to score against (defaults to the active one)
+    
+    Returns:
+        InterestTimeline supporting O(1) window queries
+    """
+    if doc.segment_bounds is None:
+        raise ValueError("score_timeline needs a Document built with Document.from_segments().")
+    
+    taxonomy = taxonomy or get_taxonomy()
+    # The digest covers only the joined text: timestamps and segmentation are keyed separately
+    timing = tuple((seg["start"], seg["end"]) for seg in doc.segments)
+    key = ("score_timeline", doc.digest, timing, tuple(doc.segment_bounds), taxonomy.version, fuzzy)
+    return RESULT_CACHE.get_or_compute(key, lambda: _score_timeline(doc, fuzzy, taxonomy))
+
+
+def _score_timeline(doc: Document, fuzzy: bool, taxonomy: CompiledTaxonomy) -> InterestTimeline:
+    """Uncached implementation of score_timeline."""
+    bounds = doc.segment_bounds
+    per_segment = {cat: [0.0] * len(doc.segments) for cat in taxonomy.categories}
+    
+    for idx, cat, _, kw_score in _iter_matches(doc.tokens, taxonomy, fuzzy):
+        per_segment[cat][bisect_right(bounds, idx) - 1] += kw_score
+    
+    return InterestTimeline(
+        categories=taxonomy.categories,
+        starts=tuple(float(seg["start"]) for seg in doc.segments),
+        ends=tuple(float(seg["end"]) for seg in doc.segments),
+        cumulative={cat: tuple(accumulate(values, initial=0.0)) for cat, values in per_segment.items()},
+    )
+
+
 # Example usage
 if __name__ == "__main__":
     # Test examples
@@ -0,0 +1,199 @@
+"""
+Cascade Inference Module
+========================
+
+This module handles:
+1. Scoring a transcript with the keyword scorer first (interests.score_interests)
+2. Accepting that result when its top interest is confident enough
+3. Falling back to the TF-IDF classifier only for the rest
+4. Per-stage hit rates and the latency the cascade saved
+
+Why?
+- The keyword scorer is a single pass over the tokens; the classifier adds
+  vectorization and a model call on top of that
+- Most transcripts mention their topic's keywords often enough that the
+  keyword result alone is "High" confidence; running the classifier on
+  them as well only costs time
+- Both stages share one Document, so the transcript is cleaned and
+  tokenized once whichever stage answers
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from document import Document, as_document
+from interests import score_interests
+from ml_inference import InterestPredictor
+
+
+STAGES = ('keyword', 'ml')
+DEFAULT_ACCEPT_LEVELS = ('High',)  # score_interests confidence levels the keyword stage may answer with
+
+
+class CascadePredictor:
+    """
+    Keyword scorer first; the ML classifier only when the keywords are inconclusive.
+
+    Results have the same shape as InterestPredictor.predict_single, plus
+    'stage' (which stage answered) and 'keyword_scores'.
+    """
+
+    def __init__(self, predictor: InterestPredictor, accept_levels: Sequence[str] = DEFAULT_ACCEPT_LEVELS,
+                 fuzzy: bool = False):
+        """
+        Args:
+            predictor: InterestPredictor used for the ML stage
+            accept_levels: Keyword confidence levels ("High", "Medium", "Low")
+                           accepted without running the classifier
+            fuzzy: Passed to score_interests
+        """
+        self.predictor = predictor
+        self.accept_levels = frozenset(accept_levels)
+        self.fuzzy = fuzzy
+        self.reset_stats()
+
+
+    def reset_stats(self) -> None:
+        """Clear the per-stage counters and timings."""
+        self.stats = {
+            'texts': 0,
+            'answered': {stage: 0 for stage in STAGES},
+            'seconds': {stage: 0.0 for stage in STAGES},
+            'ml_low_confidence': 0,
+        }
+
+
+    def predict(self, text: Union[str, Document], top_n: int = 3) -> Dict:
+        """
+        Predict interests, running the classifier only if needed.
+
+        Args:
+            text: Input text or an already tokenized Document
+            top_n: Number of top predictions to return
+
+        Returns:
+            Prediction dictionary with 'stage' set to 'keyword' or 'ml'
+        """
+
+        doc = as_document(text)
+        self.stats['texts'] += 1
+
+        start = time.perf_counter()
+        keyword = score_interests(doc, include_details=True, fuzzy=self.fuzzy)
+        self.stats['seconds']['keyword'] += time.perf_counter() - start
+
+        scores = keyword['scores']
+        if scores:
+            top = max(scores, key=scores.get)
+            if keyword['confidence'][top] in self.accept_levels:
+                self.stats['answered']['keyword'] += 1
+                return self._keyword_prediction(keyword, top_n)
+
+        start = time.perf_counter()
+        result = self.predictor.predict_single(doc, top_n)
+        self.stats['seconds']['ml'] += time.perf_counter() - start
+
+        self.stats['answered']['ml'] += 1
+        if result['primary'] == "Unknown / Low Signal":
+            self.stats['ml_low_confidence'] += 1
+        return dict(result, stage='ml', keyword_scores=scores)
+
+
+    def predict_batch(self, texts: Iterable[Union[str, Document]], top_n: int = 3) -> List[Dict]:
+        """Cascade prediction for each text."""
+        return [self.predict(text, top_n) for text in texts]
+
+
+    def _keyword_prediction(self, keyword: Dict, top_n: int) -> Dict:
+        """Keyword scores as a prediction dictionary (percentages -> 0-1 confidences)."""
+
+        ranked = sorted(keyword['scores'].items(), key=lambda x: x[1], reverse=True)[:top_n]
+        predictions = [
+            {
+                'interest': interest,
+                'confidence': score / 100,
+                'confidence_level': keyword['confidence'][interest].lower(),
+            }
+            for interest, score in ranked
+        ]
+        return {
+            'primary': predictions[0]['interest'],
+            'confidence': predictions[0]['confidence'],
+            'all_predictions': predictions,
+            'interpretation': f"Keyword match: {keyword['confidence'][ranked[0][0]]} confidence in {ranked[0][0]}.",
+            'stage': 'keyword',
+            'keyword_scores': keyword['scores'],
+        }
+
+
+    def report(self) -> Dict:
+        """
+        Per-stage hit rates and latency, versus running both stages on every text.
+
+        The classifier time avoided is estimated from the mean classifier
+        latency of the texts that did reach it.
+
+        Returns:
+            Dictionary of rates and milliseconds
+        """
+
+        stats = self.stats
+        texts = max(1, stats['texts'])
+        ml_calls = stats['answered']['ml']
+        ml_ms = stats['seconds']['ml'] * 1000 / ml_calls if ml_calls else 0.0
+        cascade_ms = (stats['seconds']['keyword'] + stats['seconds']['ml']) * 1000 / texts
+        both_ms = stats['seconds']['keyword'] * 1000 / texts + ml_ms
+
+        report = {
+            'texts': stats['texts'],
+            'keyword_hit_rate': stats['answered']['keyword'] / texts,
+            'ml_call_rate': ml_calls / texts,
+            'ml_low_confidence_rate': stats['ml_low_confidence'] / texts,
+            'keyword_ms': stats['seconds']['keyword'] * 1000 / texts,
+            'ml_ms_per_call': ml_ms,
+            'cascade_ms': cascade_ms,
+            'both_stages_ms': both_ms,
+            'saved_ms': both_ms - cascade_ms,
+        }
+
+        print("\n🪜 Cascade report:")
+        print(f"  Keyword stage answered: {report['keyword_hit_rate']:.1%}")
+        print(f"  Classifier called:      {report['ml_call_rate']:.1%} "
+              f"(still low confidence: {report['ml_low_confidence_rate']:.1%})")
+        print(f"  Latency: {report['cascade_ms']:.2f} ms/text vs {report['both_stages_ms']:.2f} ms running both "
+              f"({report['saved_ms']:.2f} ms saved)")
+        return report
+
+
+def evaluate_cascade(predictor: InterestPredictor, texts: Sequence[str], labels: Optional[Sequence[str]] = None,
+                     accept_levels: Sequence[str] = DEFAULT_ACCEPT_LEVELS) -> Dict:
+    """
+    Run the cascade over labeled texts and compare it with the classifier alone.
+
+    Args:
+        predictor: InterestPredictor used for the ML stage
+        texts: Texts to predict
+        labels: True interests (optional) for accuracy per stage
+        accept_levels: Keyword confidence levels the cascade accepts
+
+    Returns:
+        CascadePredictor.report() plus accuracies when labels are given
+    """
+
+    cascade = CascadePredictor(predictor, accept_levels)
+    docs = [as_document(text) for text in texts]
+    results = cascade.predict_batch(docs)
+    report = cascade.report()
+
+    if labels is not None:
+        ml_only = predictor.predict_batch(docs)
+        report['cascade_accuracy'] = sum(r['primary'] == y for r, y in zip(results, labels)) / max(1, len(docs))
+        report['ml_accuracy'] = sum(r['primary'] == y for r, y in zip(ml_only, labels)) / max(1, len(docs))
+
+        keyword_hits = [(r, y) for r, y in zip(results, labels) if r['stage'] == 'keyword']
+        report['keyword_stage_accuracy'] = sum(r['primary'] == y for r, y in keyword_hits) / max(1, len(keyword_hits))
+
+        print(f"  Accuracy: cascade {report['cascade_accuracy']:.3f} vs classifier alone {report['ml_accuracy']:.3f} "
+              f"(keyword-answered texts: {report['keyword_stage_accuracy']:.3f})")
+
+    return report
@@ -8,6 +8,10 @@ This module handles:
 3. Model evaluation (accuracy, precision, recall, F1)
 4. Confusion matrix visualization
 5. Feature importance analysis
+6. Vocabulary pruning (chi² or coefficient magnitude) for a smaller serving model
+7. Post-training int8 quantization of the coefficients
+8. Incremental updates from newly labeled texts, behind an evaluation gate
+9. Data-parallel sharded training with parameter averaging
 
 Model Architecture:
 - Vectorizer: TfidfVectorizer
@@ -17,11 +21,30 @@ Model Architecture:
   - max_df: 0.9 (ignore words in >90% of documents)
   - max_features: ~50,000 (limit vocabulary size)
   
+- Vectorizer (feature_mode='hashing'): HashingTfidfVectorizer
+  - n_features: 2**18 hash buckets (configurable)
+  - IDF can be accumulated batch by batch (partial_fit)
+  - Same n-grams, stop words and TF-IDF weighting, but no fitted vocabulary:
+    memory is constant and any process can vectorize without one
+  - min_df / max_df / max_features don't apply (nothing is counted up front)
+  
 - Classifier: LogisticRegression
   - max_iter: 1000+ (ensure convergence)
   - class_weight: 'balanced' (handle imbalanced classes)
   - random_state: 42 (reproducibility)
 
+Streaming (train_streaming, feature_mode='hashing' only):
+  - Mini-batches read from disk -> hashed -> SGDClassifier(loss='log_loss').partial_fit
+  - Holdout evaluation and a checkpoint after every epoch; resumable
+
+Sharded (train_sharded, feature_mode='hashing' only):
+  - N local worker processes, one shard of the corpus each, one global IDF
+  - Per-shard SGD epochs combined by iterative parameter mixing or averaging
+
+Incremental updates (update, any fitted model):
+  - New rows only, same vectorizer; weights refit from the current ones with
+    the L2 penalty centered on them, then kept only if eval F1 holds
+
 Why these parameters?
 - TF-IDF: Captures topic-specific vocabulary effectively
 - Balanced weights: Prevents model from biasing toward majority class
@@ -30,19 +53,164 @@ Why these parameters?
 
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+import scipy.sparse as sp
+from scipy.optimize import minimize
+from scipy.special import expit, logsumexp
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from sklearn.base import clone
+from sklearn.feature_selection import chi2
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import (
     accuracy_score, precision_score, recall_score, f1_score,
-    confusion_matrix, classification_report
+    confusion_matrix, classification_report, log_loss
 )
+import copy
+import json
+import multiprocessing
+import os
 import pickle
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, List, Optional, Union
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from ml_runtime import (
+    HashedVocabulary, RuntimeClassifier, RuntimeLinearModel, artifact_path, model_version, multi_class_mode,
+    quantize_model, save_artifact,
+)
+from ml_features import vectorize_cached
+from ml_inference import top_k
+from ml_preprocessing import iter_labeled_batches
+from ml_windows import apply_tfidf, normalize_rows
+
+
+FEATURE_MODES = ('vocabulary', 'hashing')
+MIXING_MODES = ('ipm', 'average')  # train_sharded: iterative parameter mixing, one-shot averaging
+DEFAULT_HASH_FEATURES = 2 ** 18
+STREAM_BATCH_SIZE = 10000
+
+# Default TfidfVectorizer settings (feature_mode='vocabulary')
+VECTORIZER_PARAMS = {
+    'lowercase': True,
+    'ngram_range': (1, 2),  # Unigrams and bigrams
+    'min_df': 2,
+    'max_df': 0.9,
+    'max_features': 50000,
+    'stop_words': 'english',
+}
+
+# Default LogisticRegression settings
+MODEL_PARAMS = {
+    'max_iter': 1000,
+    'class_weight': 'balanced',
+    'random_state': 42,
+    'n_jobs': -1,  # Use all CPU cores
+}
+
+
+class HashingTfidfVectorizer:
+    """
+    HashingVectorizer + smoothed TF-IDF with the TfidfVectorizer interface.
+    
+    Terms are mapped to columns by hashing, so only the IDF vector is
+    fitted - and it can be accumulated batch by batch with partial_fit().
+    Exposes the attributes the window engine and model artifact read
+    (vocabulary_, idf_, ngram_range, token_pattern, ...).
+    """
+    
+    def __init__(self, n_features: int = DEFAULT_HASH_FEATURES, ngram_range: Tuple[int, int] = (1, 2),
+                 stop_words: str = 'english', lowercase: bool = True):
+        """
+        Args:
+            n_features: Number of hash buckets (columns)
+            ngram_range: N-gram orders to extract
+            stop_words: Stop word list passed to HashingVectorizer
+            lowercase: Lowercase text before tokenizing
+        """
+        # alternate_sign=False and norm=None keep raw counts for TF-IDF
+        self.hasher = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=ngram_range,
+            stop_words=stop_words,
+            lowercase=lowercase,
+            alternate_sign=False,
+            norm=None,
+        )
+        
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.lowercase = lowercase
+        self.token_pattern = self.hasher.token_pattern
+        self.analyzer = self.hasher.analyzer
+        self.tokenizer = self.hasher.tokenizer
+        self.preprocessor = self.hasher.preprocessor
+        self.strip_accents = self.hasher.strip_accents
+        self.dtype = self.hasher.dtype
+        self.binary = self.hasher.binary
+        
+        # TfidfTransformer defaults
+        self.norm = 'l2'
+        self.use_idf = True
+        self.sublinear_tf = False
+        
+        self.doc_freq = np.zeros(n_features, dtype=np.int64)
+        self.num_docs = 0
+    
+    
+    @property
+    def vocabulary_(self) -> HashedVocabulary:
+        if not hasattr(self, 'idf_'):
+            raise AttributeError("vocabulary_ is available after fitting")
+        return HashedVocabulary(self.n_features)
+    
+    
+    def get_stop_words(self):
+        return self.hasher.get_stop_words()
+    
+    
+    def partial_fit(self, raw_documents):
+        """
+        Add one batch of documents to the IDF statistics.
+        
+        Args:
+            raw_documents: Iterable of strings
+        
+        Returns:
+            Raw hashed term counts for the batch
+        """
+        counts = self.hasher.transform(raw_documents)
+        self.add_document_frequencies(np.bincount(counts.indices, minlength=self.n_features), counts.shape[0])
+        return counts
+    
+    
+    def add_document_frequencies(self, doc_freq: np.ndarray, num_docs: int) -> None:
+        """
+        Add document frequencies counted elsewhere (e.g. by a shard worker) and refresh the IDF.
+        
+        Args:
+            doc_freq: Documents containing each hash bucket
+            num_docs: Documents counted
+        """
+        self.doc_freq += doc_freq
+        self.num_docs += num_docs
+        
+        # Smoothed IDF, as TfidfTransformer(smooth_idf=True) computes it
+        self.idf_ = np.log((1 + self.num_docs) / (1 + self.doc_freq)) + 1
+    
+    
+    def fit_transform(self, raw_documents):
+        self.doc_freq[:] = 0
+        self.num_docs = 0
+        return apply_tfidf(self.partial_fit(raw_documents), self)
+    
+    
+    def transform(self, raw_documents):
+        return apply_tfidf(self.hasher.transform(raw_documents), self)
+
 
 class InterestClassifier:
     """
@@ -52,45 +220,53 @@ class InterestClassifier:
         vectorizer: TfidfVectorizer instance
         model: LogisticRegression instance
         label_info: Dictionary with label encoding/decoding
+        model_version: Content hash of the fitted weights (None until trained);
+                       InterestPredictor drops cached predictions when it changes
     """
     
-    def __init__(self, label_info: Dict):
+    def __init__(self, label_info: Dict, feature_mode: str = 'vocabulary',
+                 n_features: int = DEFAULT_HASH_FEATURES,
+                 vectorizer_params: Optional[Dict] = None, model_params: Optional[Dict] = None):
         """
         Initialize the classifier.
         
         Args:
             label_info: Dictionary from preprocessing module with label metadata
+            feature_mode: 'vocabulary' (fitted TfidfVectorizer) or 'hashing'
+                          (stateless HashingTfidfVectorizer)
+            n_features: Hash buckets when feature_mode='hashing'
+            vectorizer_params: Overrides for the vectorizer defaults (e.g. min_df)
+            model_params: Overrides for the LogisticRegression defaults (e.g. C)
         """
+        if feature_mode not in FEATURE_MODES:
+            raise ValueError(f"feature_mode must be one of {FEATURE_MODES}, got {feature_mode!r}")
+        
         self.label_info = label_info
+        self.feature_mode = feature_mode
         
         # Initialize TF-IDF vectorizer
-        self.vectorizer = TfidfVectorizer(
-            lowercase=True,
-            ngram_range=(1, 2),  # Unigrams and bigrams
-            min_df=2,
-            max_df=0.9,
-            max_features=50000,
-            stop_words='english'
-        )
+        if feature_mode == 'hashing':
+            self.vectorizer = HashingTfidfVectorizer(n_features=n_features, **(vectorizer_params or {}))
+        else:
+            self.vectorizer = TfidfVectorizer(**{**VECTORIZER_PARAMS, **(vectorizer_params or {})})
         
         # Initialize classifier
-        self.model = LogisticRegression(
-            max_iter=1000,
-            class_weight='balanced',
-            random_state=42,
-            n_jobs=-1  # Use all CPU cores
-        )
+        self.model = LogisticRegression(**{**MODEL_PARAMS, **(model_params or {})})
         
         self.is_fitted = False
+        self.model_version = None
     
     
-    def train(self, X_train: pd.Series, y_train: pd.Series) -> Dict[str, float]:
+    def train(self, X_train: pd.Series, y_train: pd.Series,
+              vectors: Optional[sp.csr_matrix] = None) -> Dict[str, float]:
         """
         Train the model on labeled data.
         
         Args:
             X_train: Training texts
             y_train: Training labels
+            vectors: Precomputed TF-IDF rows for X_train; the vectorizer must
+                     already be fitted (e.g. restored by ml_features)
         
         Returns:
             Dictionary with training metrics
@@ -102,14 +278,18 @@ class InterestClassifier:
         y_train_encoded = y_train.map(self.label_info['label_to_idx'])
         
         # Vectorize training text
-        print("  → Vectorizing training texts...")
-        X_train_vectors = self.vectorizer.fit_transform(X_train)
+        if vectors is None:
+            print("  → Vectorizing training texts...")
+            X_train_vectors = self.vectorizer.fit_transform(X_train)
+        else:
+            X_train_vectors = vectors
         print(f"    ✓ Created {X_train_vectors.shape[1]} features")
         
         # Train classifier
         print("  → Fitting Logistic Regression...")
         self.model.fit(X_train_vectors, y_train_encoded)
         self.is_fitted = True
+        self.model_version = model_version(self)
         
         # Calculate training accuracy
         train_pred = self.model.predict(X_train_vectors)
@@ -120,13 +300,323 @@ class InterestClassifier:
         return {'accuracy': train_accuracy}
     
     
-    def evaluate(self, X_test: pd.Series, y_test: pd.Series) -> Dict[str, Any]:
+    def train_streaming(self, train_path: str, epochs: int = 3, batch_size: int = STREAM_BATCH_SIZE,
+                        holdout: Optional[Union[str, pd.DataFrame]] = None,
+                        checkpoint_path: Optional[str] = None, resume: bool = False,
+                        alpha: float = 1e-6) -> List[Dict[str, float]]:
+        """
+        Train out-of-core: stream mini-batches from disk into SGD.
+        
+        Each epoch reads train_path batch by batch, hashes the text and calls
+        SGDClassifier(loss='log_loss').partial_fit, so memory depends on
+        batch_size rather than corpus size. One extra pass first accumulates
+        the IDF. SGD only shuffles within a batch, so shuffle the file first.
+        
+        Args:
+            train_path: Labeled corpus (see ml_preprocessing.iter_labeled_batches)
+            epochs: Total passes over the corpus
+            batch_size: Rows per mini-batch
+            holdout: Corpus path or DataFrame evaluated after every epoch
+            checkpoint_path: Save the model here after every epoch
+            resume: Continue from the checkpoint at checkpoint_path, if any
+            alpha: SGD regularization strength
+        
+        Returns:
+            Per-epoch history (samples, seconds, holdout accuracy and log loss)
+        """
+        
+        if self.feature_mode != 'hashing':
+            raise ValueError("Streaming training needs a stateless vectorizer: use feature_mode='hashing'.")
+        
+        label_to_idx = self.label_info['label_to_idx']
+        classes = np.arange(len(label_to_idx))
+        
+        state = self._load_checkpoint(checkpoint_path) if resume and checkpoint_path else None
+        if state is not None:
+            history = state['history']
+            print(f"↩️  Resuming from {checkpoint_path} after epoch {len(history)}")
+        else:
+            history = []
+            self.model = SGDClassifier(
+                loss='log_loss',
+                alpha=alpha,
+                class_weight=self._balanced_class_weight(),
+                random_state=42,
+            )
+            
+            print("🔄 Counting document frequencies...")
+            for batch in iter_labeled_batches(train_path, batch_size):
+                self.vectorizer.partial_fit(batch['text'])
+            print(f"  ✓ {self.vectorizer.num_docs:,} documents")
+        
+        for epoch in range(len(history) + 1, epochs + 1):
+            print(f"🔄 Epoch {epoch}/{epochs}...")
+            start = time.perf_counter()
+            samples = 0
+            skipped = 0
+            
+            for batch in iter_labeled_batches(train_path, batch_size):
+                y = batch['label'].map(label_to_idx)
+                known = y.notna()
+                skipped += int((~known).sum())
+                if not known.any():
+                    continue
+                
+                X = self.vectorizer.transform(batch['text'][known])
+                self.model.partial_fit(X, y[known].astype(int), classes=classes)
+                samples += int(known.sum())
+                self.is_fitted = True
+            
+            record = {'epoch': epoch, 'samples': samples, 'seconds': time.perf_counter() - start}
+            if self.is_fitted:
+                self.model_version = model_version(self)
+            if skipped:
+                print(f"  ⚠️  Skipped {skipped:,} rows with labels not in label_info")
+            if holdout is not None:
+                record.update(self._evaluate_stream(holdout, batch_size))
+            history.append(record)
+            
+            summary = f"  ✓ {samples:,} samples in {record['seconds']:.1f}s"
+            if 'holdout_accuracy' in record:
+                summary += f" | holdout accuracy {record['holdout_accuracy']:.3f}, log loss {record['holdout_log_loss']:.3f}"
+            print(summary)
+            
+            if checkpoint_path:
+                self._save_checkpoint(checkpoint_path, history, alpha)
+        
+        return history
+    
+    
+    def train_sharded(self, train_path: str, num_shards: Optional[int] = None, rounds: int = 5,
+                      mixing: str = 'ipm', batch_size: int = STREAM_BATCH_SIZE,
+                      holdout: Optional[Union[str, pd.DataFrame]] = None,
+                      alpha: float = 1e-6) -> List[Dict[str, float]]:
+        """
+        Data-parallel training: one SGD model per shard, combined by parameter averaging.
+        
+        train_path is read and cleaned once, dealt round-robin into one
+        temporary file per shard, and each of num_shards local worker
+        processes loads only its own file, hashed into the shared feature
+        space. Their document frequencies are summed into one global IDF,
+        so all shards see the same TF-IDF columns. Each round, every worker runs one
+        SGDClassifier(loss='log_loss').partial_fit epoch over its shard, and
+        the shard weights are averaged (weighted by shard size):
+        - mixing='ipm' (iterative parameter mixing): the average is sent back
+          and every shard starts the next round from it
+        - mixing='average': shards never sync; the average of their current
+          weights is only taken for the model (one-shot averaging)
+        
+        Args:
+            train_path: Labeled corpus (see ml_preprocessing.iter_labeled_batches)
+            num_shards: Worker processes (default: one per CPU)
+            rounds: Epochs per shard (= mixing rounds for 'ipm')
+            mixing: 'ipm' or 'average'
+            batch_size: Rows per batch when reading train_path
+            holdout: Corpus path or DataFrame evaluated after every round
+            alpha: SGD regularization strength
+        
+        Returns:
+            Per-round history (samples, seconds, holdout accuracy and log loss)
+        """
+        
+        if self.feature_mode != 'hashing':
+            raise ValueError("Sharded training needs a shared hashed feature space: use feature_mode='hashing'.")
+        if mixing not in MIXING_MODES:
+            raise ValueError(f"mixing must be one of {MIXING_MODES}, got {mixing!r}")
+        
+        num_shards = max(1, num_shards or os.cpu_count() or 1)
+        label_to_idx = self.label_info['label_to_idx']
+        classes = np.arange(len(label_to_idx))
+        
+        # Read and clean the corpus once here; each worker parses only its own shard
+        shard_dir = tempfile.mkdtemp(prefix='shards-')
+        connections = []
+        workers = []
+        history = []
+        try:
+            print(f"🔄 Splitting {train_path} into {num_shards} shards...")
+            shard_paths = _split_corpus(train_path, num_shards, shard_dir, batch_size)
+            
+            print(f"🔄 Starting {num_shards} shard workers ({mixing})...")
+            context = multiprocessing.get_context()
+            for shard, shard_path in enumerate(shard_paths):
+                connection, worker_connection = context.Pipe()
+                worker = context.Process(
+                    target=_shard_worker,
+                    args=(worker_connection, shard_path, shard, batch_size, self.vectorizer.n_features,
+                          label_to_idx, self._balanced_class_weight(), alpha),
+                    daemon=True,
+                )
+                worker.start()
+                worker_connection.close()
+                connections.append(connection)
+                workers.append(worker)
+            
+            # Global IDF from the per-shard document frequencies
+            self.vectorizer.doc_freq[:] = 0
+            self.vectorizer.num_docs = 0
+            for connection in connections:
+                self.vectorizer.add_document_frequencies(*connection.recv())
+            for connection in connections:
+                connection.send(self.vectorizer.idf_)
+            print(f"  ✓ {self.vectorizer.num_docs:,} documents")
+            
+            self.model = SGDClassifier(
+                loss='log_loss',
+                alpha=alpha,
+                class_weight=self._balanced_class_weight(),
+                random_state=42,
+            )
+            self.model.classes_ = classes
+            coef = intercept = None
+            
+            for round_number in range(1, rounds + 1):
+                start = time.perf_counter()
+                for connection in connections:
+                    connection.send((coef, intercept) if mixing == 'ipm' else (None, None))
+                results = [connection.recv() for connection in connections]
+                
+                sizes = np.array([samples for _, _, samples in results], dtype=np.float64)
+                if not sizes.sum():
+                    raise ValueError(f"No rows in {train_path} have labels in label_info.")
+                shares = sizes / sizes.sum()
+                coef = sum(share * shard_coef for share, (shard_coef, _, _) in zip(shares, results))
+                intercept = sum(share * shard_intercept for share, (_, shard_intercept, _) in zip(shares, results))
+                
+                self.model.coef_ = coef
+                self.model.intercept_ = intercept
+                self.model.n_features_in_ = coef.shape[1]
+                self.is_fitted = True
+                self.model_version = model_version(self)
+                
+                record = {'round': round_number, 'samples': int(sizes.sum()), 'seconds': time.perf_counter() - start}
+                if holdout is not None:
+                    record.update(self._evaluate_stream(holdout, batch_size))
+                history.append(record)
+                
+                summary = f"  ✓ Round {round_number}/{rounds}: {record['samples']:,} samples in {record['seconds']:.1f}s"
+                if 'holdout_accuracy' in record:
+                    summary += f" | holdout accuracy {record['holdout_accuracy']:.3f}, log loss {record['holdout_log_loss']:.3f}"
+                print(summary)
+        finally:
+            for connection in connections:
+                try:
+                    connection.send(None)
+                except OSError:
+                    pass  # worker already gone
+            for worker in workers:
+                worker.join(timeout=10)
+                if worker.is_alive():
+                    worker.terminate()
+            shutil.rmtree(shard_dir, ignore_errors=True)
+        
+        return history
+    
+    
+    def _balanced_class_weight(self) -> Optional[Dict[int, float]]:
+        """class_weight='balanced' computed from label_info (partial_fit can't infer it)."""
+        distribution = self.label_info.get('label_distribution')
+        if not distribution:
+            return None
+        
+        label_to_idx = self.label_info['label_to_idx']
+        total = sum(distribution.values())
+        return {
+            label_to_idx[label]: total / (len(label_to_idx) * count)
+            for label, count in distribution.items()
+            if label in label_to_idx and count
+        }
+    
+    
+    def _evaluate_stream(self, holdout: Union[str, pd.DataFrame], batch_size: int) -> Dict[str, float]:
+        """Accuracy and mean log loss over a holdout set, one batch at a time."""
+        
+        label_to_idx = self.label_info['label_to_idx']
+        classes = np.arange(len(label_to_idx))
+        batches = [holdout] if isinstance(holdout, pd.DataFrame) else iter_labeled_batches(holdout, batch_size)
+        
+        correct = 0
+        total = 0
+        loss = 0.0
+        for batch in batches:
+            y = batch['label'].map(label_to_idx)
+            known = y.notna()
+            if not known.any():
+                continue
+            
+            y_true = y[known].astype(int).to_numpy()
+            probabilities = self.model.predict_proba(self.vectorizer.transform(batch['text'][known]))
+            correct += int((probabilities.argmax(axis=1) == y_true).sum())
+            loss += log_loss(y_true, probabilities, labels=classes, normalize=False)
+            total += len(y_true)
+        
+        if not total:
+            return {}
+        return {'holdout_accuracy': correct / total, 'holdout_log_loss': loss / total}
+    
+    
+    def _save_checkpoint(self, filepath: str, history: List[Dict], alpha: float) -> None:
+        """Save the model artifact plus the optimizer state needed to resume."""
+        
+        self.save_model(filepath)
+        
+        state = {
+            'history': history,
+            'alpha': alpha,
+            't': float(self.model.t_),
+            'num_docs': self.vectorizer.num_docs,
+        }
+        state_file = Path(f"{filepath}.state.json")
+        with tempfile.NamedTemporaryFile('w', dir=state_file.parent, suffix=".tmp", delete=False) as tmp:
+            json.dump(state, tmp, indent=2)
+        os.replace(tmp.name, state_file)
+    
+    
+    def _load_checkpoint(self, filepath: str) -> Optional[Dict]:
+        """Restore model and IDF from a checkpoint; None if there isn't one."""
+        
+        state_file = Path(f"{filepath}.state.json")
+        if not state_file.exists() or not Path(artifact_path(filepath)).exists():
+            return None
+        
+        state = json.loads(state_file.read_text())
+        runtime = RuntimeClassifier.load(filepath)
+        if len(runtime.vectorizer.vocabulary_) != self.vectorizer.n_features:
+            raise ValueError(
+                f"Checkpoint has {len(runtime.vectorizer.vocabulary_)} features, "
+                f"classifier has {self.vectorizer.n_features}."
+            )
+        
+        self.vectorizer.idf_ = np.array(runtime.vectorizer.idf_)
+        self.vectorizer.num_docs = state['num_docs']
+        
+        # Set the fitted attributes partial_fit continues from (copies: the artifact is read-only)
+        self.model = SGDClassifier(
+            loss='log_loss',
+            alpha=state['alpha'],
+            class_weight=self._balanced_class_weight(),
+            random_state=42,
+        )
+        self.model.classes_ = np.array(runtime.model.classes_)
+        self.model.coef_ = np.array(runtime.model.coef_)
+        self.model.intercept_ = np.array(runtime.model.intercept_)
+        self.model.t_ = state['t']
+        self.model.n_features_in_ = self.model.coef_.shape[1]
+        self.is_fitted = True
+        self.model_version = runtime.model_version
+        
+        return state
+    
+    
+    def evaluate(self, X_test: pd.Series, y_test: pd.Series,
+                 vectors: Optional[sp.csr_matrix] = None) -> Dict[str, Any]:
         """
         Evaluate model on test data.
         
         Args:
             X_test: Test texts
             y_test: Test labels
+            vectors: Precomputed TF-IDF rows for X_test
         
         Returns:
             Dictionary with evaluation metrics
@@ -141,7 +631,7 @@ class InterestClassifier:
         y_test_encoded = y_test.map(self.label_info['label_to_idx'])
         
         # Vectorize test texts
-        X_test_vectors = self.vectorizer.transform(X_test)
+        X_test_vectors = self.vectorizer.transform(X_test) if vectors is None else vectors
         
         # Get predictions
         y_pred = self.model.predict(X_test_vectors)
@@ -215,28 +705,18 @@ class InterestClassifier:
     
     def save_model(self, filepath: str) -> None:
         """
-        Save trained model and vectorizer to disk.
+        Save trained model and vectorizer to a single artifact file.
+        
+        See ml_runtime for the format: raw arrays plus a sorted vocabulary
+        table that load_model() memory-maps instead of unpickling.
         
         Args:
             filepath: Path to save model (without extension)
         """
         
-        if not self.is_fitted:
-            raise ValueError("Cannot save untrained model.")
+        path = save_artifact(self, filepath)
         
-        # Save vectorizer
-        with open(f"{filepath}_vectorizer.pkl", 'wb') as f:
-            pickle.dump(self.vectorizer, f)
-        
-        # Save model
-        with open(f"{filepath}_model.pkl", 'wb') as f:
-            pickle.dump(self.model, f)
-        
-        # Save label info
-        with open(f"{filepath}_labels.pkl", 'wb') as f:
-            pickle.dump(self.label_info, f)
-        
-        print(f"✓ Model saved to {filepath}_*.pkl")
+        print(f"✓ Model saved to {path}")
     
     
     @staticmethod
@@ -244,6 +724,11 @@ class InterestClassifier:
         """
         Load trained model and vectorizer from disk.
         
+        The returned classifier is memory-mapped and inference-only
+        (predict, evaluate, feature importance); train a new instance to
+        retrain. Models saved by older versions as three pickle files are
+        still loaded, but only load pickles from sources you trust.
+        
         Args:
             filepath: Path to model files (without extension)
         
@@ -251,6 +736,27 @@ class InterestClassifier:
             Loaded InterestClassifier instance
         """
         
+        if not Path(artifact_path(filepath)).exists() and Path(f"{filepath}_model.pkl").exists():
+            return InterestClassifier._load_pickled_model(filepath)
+        
+        runtime = RuntimeClassifier.load(filepath)
+        
+        classifier = InterestClassifier(runtime.label_info)
+        classifier.vectorizer = runtime.vectorizer
+        if isinstance(runtime.vectorizer.vocabulary_, HashedVocabulary):
+            classifier.feature_mode = 'hashing'
+        classifier.model = runtime.model
+        classifier.is_fitted = True
+        classifier.model_version = runtime.model_version
+        
+        print(f"✓ Model loaded from {artifact_path(filepath)}")
+        return classifier
+    
+    
+    @staticmethod
+    def _load_pickled_model(filepath: str) -> 'InterestClassifier':
+        """Load the legacy three-pickle format ({filepath}_*.pkl)."""
+        
         # Load label info first
         with open(f"{filepath}_labels.pkl", 'rb') as f:
             label_info = pickle.load(f)
@@ -267,6 +773,7 @@ class InterestClassifier:
             classifier.model = pickle.load(f)
         
         classifier.is_fitted = True
+        classifier.model_version = model_version(classifier)
         
         print(f"✓ Model loaded from {filepath}_*.pkl")
         return classifier
@@ -286,17 +793,26 @@ class InterestClassifier:
         if not self.is_fitted:
             raise ValueError("Model not trained yet.")
         
-        feature_names = np.array(self.vectorizer.get_feature_names_out())
+        # Hashed columns have no stored term; they are reported by bucket
+        if self.feature_mode == 'hashing':
+            feature_names = None
+        else:
+            feature_names = np.array(self.vectorizer.get_feature_names_out())
         
         # Coefficients shape: (num_classes, num_features)
         coefficients = self.model.coef_
         
+        # Top positive coefficients of every class at once (argpartition, not a full sort)
+        top_per_class = top_k(coefficients, top_n)
+        
         feature_importance = {}
         
         for idx, label in self.label_info['idx_to_label'].items():
-            # Get top positive and negative coefficients
-            top_indices = np.argsort(coefficients[idx])[-top_n:][::-1]
-            top_features = feature_names[top_indices]
+            top_indices = top_per_class[idx]
+            if feature_names is None:
+                top_features = np.array([f"<hash {i}>" for i in top_indices])
+            else:
+                top_features = feature_names[top_indices]
             top_scores = coefficients[idx][top_indices]
             
             feature_importance[label] = {
@@ -305,10 +821,391 @@ class InterestClassifier:
             }
         
         return feature_importance
+    
+    
+    def prune_features(self, X_train: pd.Series, y_train: pd.Series,
+                       X_test: pd.Series, y_test: pd.Series,
+                       n_features: int = 5000, method: str = 'chi2', max_f1_drop: float = 0.01,
+                       train_vectors: Optional[sp.csr_matrix] = None,
+                       test_vectors: Optional[sp.csr_matrix] = None,
+                       latency_samples: int = 200) -> Tuple['InterestClassifier', Dict[str, Any]]:
+        """
+        Keep the n_features most useful terms and refit a smaller model.
+        
+        The pruned TF-IDF rows are the kept columns of the current rows,
+        re-normalized, so the training texts are not re-tokenized. This
+        classifier is left unchanged.
+        
+        Args:
+            X_train: Training texts
+            y_train: Training labels
+            X_test: Test texts (for the accuracy/F1 delta)
+            y_test: Test labels
+            n_features: Vocabulary size to keep
+            method: 'chi2' (chi-squared vs. the labels) or 'coef'
+                    (largest absolute coefficient across classes)
+            max_f1_drop: F1 loss still considered acceptable (0.01 = one point)
+            train_vectors: Precomputed TF-IDF rows for X_train
+            test_vectors: Precomputed TF-IDF rows for X_test
+            latency_samples: Test texts timed one at a time
+        
+        Returns:
+            (pruned classifier, report dict)
+        """
+        
+        if not self.is_fitted:
+            raise ValueError("Model not trained yet.")
+        if not isinstance(self.vectorizer, TfidfVectorizer):
+            raise ValueError("Pruning needs a fitted TfidfVectorizer (feature_mode='vocabulary').")
+        if method not in ('chi2', 'coef'):
+            raise ValueError(f"method must be 'chi2' or 'coef', got {method!r}")
+        
+        label_to_idx = self.label_info['label_to_idx']
+        y_train_encoded = y_train.map(label_to_idx)
+        y_test_encoded = y_test.map(label_to_idx)
+        X_train_vectors = self.vectorizer.transform(X_train) if train_vectors is None else train_vectors
+        X_test_vectors = self.vectorizer.transform(X_test) if test_vectors is None else test_vectors
+        
+        # Score every feature and keep the best, in original column order
+        if method == 'chi2':
+            scores, _ = chi2(X_train_vectors, y_train_encoded)
+            scores = np.nan_to_num(scores)
+        else:
+            scores = np.abs(self.model.coef_).max(axis=0)
+        keep = np.sort(np.argsort(scores)[::-1][:n_features])
+        
+        # Fixed-vocabulary vectorizer with the kept terms and their IDF weights
+        terms = self.vectorizer.get_feature_names_out()[keep]
+        params = dict(self.vectorizer.get_params(), vocabulary={term: i for i, term in enumerate(terms)})
+        
+        pruned = InterestClassifier(self.label_info)
+        pruned.vectorizer = TfidfVectorizer(**params)
+        pruned.vectorizer.idf_ = self.vectorizer.idf_[keep]
+        pruned.model = clone(self.model)
+        
+        print(f"✂️  Pruning {len(scores)} → {len(keep)} features ({method}) and refitting...")
+        pruned.model.fit(self._prune_columns(X_train_vectors, keep), y_train_encoded)
+        pruned.is_fitted = True
+        pruned.model_version = model_version(pruned)
+        
+        report = {'method': method, 'features_before': len(scores), 'features_after': len(keep)}
+        latency_texts = list(X_test[:latency_samples])
+        for name, classifier, vectors in (
+            ('before', self, X_test_vectors),
+            ('after', pruned, self._prune_columns(X_test_vectors, keep)),
+        ):
+            y_pred = classifier.model.predict(vectors)
+            report[f'accuracy_{name}'] = accuracy_score(y_test_encoded, y_pred)
+            report[f'f1_{name}'] = f1_score(y_test_encoded, y_pred, average='weighted', zero_division=0)
+            report[f'bytes_{name}'] = _artifact_size(classifier)
+            
+            start = time.perf_counter()
+            for text in latency_texts:
+                classifier.model.predict_proba(classifier.vectorizer.transform([text]))
+            report[f'latency_ms_{name}'] = (time.perf_counter() - start) * 1000 / max(1, len(latency_texts))
+        
+        report['accuracy_delta'] = report['accuracy_after'] - report['accuracy_before']
+        report['f1_delta'] = report['f1_after'] - report['f1_before']
+        report['bytes_saved'] = report['bytes_before'] - report['bytes_after']
+        report['latency_gain_ms'] = report['latency_ms_before'] - report['latency_ms_after']
+        report['within_budget'] = -report['f1_delta'] <= max_f1_drop
+        
+        print(f"  Accuracy:   {report['accuracy_before']:.3f} → {report['accuracy_after']:.3f} ({report['accuracy_delta']:+.3f})")
+        print(f"  F1 Score:   {report['f1_before']:.3f} → {report['f1_after']:.3f} ({report['f1_delta']:+.3f})")
+        print(f"  Model size: {report['bytes_before'] / 1e6:.2f} MB → {report['bytes_after'] / 1e6:.2f} MB "
+              f"({report['bytes_saved'] / max(1, report['bytes_before']):.0%} smaller)")
+        print(f"  Latency:    {report['latency_ms_before']:.3f} → {report['latency_ms_after']:.3f} ms/text")
+        if report['within_budget']:
+            print(f"✓ F1 drop within {max_f1_drop:.3f}")
+        else:
+            print(f"⚠️  F1 drop exceeds {max_f1_drop:.3f}")
+        
+        return pruned, report
+    
+    
+    def _prune_columns(self, X: sp.csr_matrix, keep: np.ndarray) -> sp.csr_matrix:
+        """TF-IDF rows restricted to the kept columns, as the pruned vectorizer would produce them."""
+        X = sp.csr_matrix(X[:, keep])
+        if self.vectorizer.norm:
+            X = normalize_rows(X, self.vectorizer.norm)
+        return X
+    
+    
+    def quantize(self, min_weight_ratio: float = 0.02) -> 'InterestClassifier':
+        """
+        Copy of this classifier that scores with sparse int8 coefficients.
+        
+        Weights below min_weight_ratio of their class's largest weight are
+        dropped; the rest are stored as int8 with one scale per class. Like
+        load_model(), the result is inference-only; save_model() keeps it
+        quantized.
+        
+        Args:
+            min_weight_ratio: Relative magnitude below which weights are zeroed
+        
+        Returns:
+            Quantized InterestClassifier
+        """
+        
+        if not self.is_fitted:
+            raise ValueError("Model not trained yet.")
+        
+        classifier = InterestClassifier(self.label_info, feature_mode=self.feature_mode)
+        classifier.vectorizer = self.vectorizer
+        classifier.model = quantize_model(self.model, min_weight_ratio)
+        classifier.is_fitted = True
+        classifier.model_version = model_version(classifier)
+        return classifier
+    
+    
+    def update(self, X_new: pd.Series, y_new: pd.Series, X_eval: pd.Series, y_eval: pd.Series,
+               stiffness: float = 1.0, max_iter: int = 200,
+               max_f1_drop: float = 0.0) -> Tuple['InterestClassifier', Dict[str, Any]]:
+        """
+        Fold newly labeled texts into the model without a full retrain.
+        
+        The vectorizer is reused unchanged (same vocabulary or hash buckets,
+        same IDF), so every feature keeps its column. The weights are refit
+        on the new rows only, warm-started from the current weights, with
+        the usual L2 penalty centered on those weights instead of on zero
+        (see _proximal_fit). Features the new rows don't contain keep their
+        weights exactly, and the rest move only as far as the new rows justify.
+        
+        Both models are then scored on X_eval / y_eval and the update is only
+        kept if weighted F1 dropped by at most max_f1_drop. This classifier
+        is never modified.
+        
+        Args:
+            X_new: Newly labeled texts
+            y_new: Their labels (labels not in label_info are skipped)
+            X_eval: Texts for the before/after gate (include recent ones)
+            y_eval: Their labels
+            stiffness: Strength of the pull toward the current weights
+                       (1.0 = the default LogisticRegression C=1 penalty)
+            max_iter: L-BFGS iterations
+            max_f1_drop: Largest weighted-F1 drop the gate accepts
+        
+        Returns:
+            (classifier, report): the updated classifier if it passed the gate,
+            otherwise this one; report has before/after metrics and 'accepted'
+        """
+        
+        if not self.is_fitted:
+            raise ValueError("Model not trained yet.")
+        
+        start = time.perf_counter()
+        label_to_idx = self.label_info['label_to_idx']
+        new = pd.DataFrame({'text': list(X_new), 'label': list(y_new)})
+        known = new['label'].isin(label_to_idx)
+        if not known.all():
+            print(f"  ⚠️  Skipped {int((~known).sum()):,} rows with labels not in label_info")
+        new = new[known]
+        if new.empty:
+            raise ValueError("No new rows with known labels to update from.")
+        
+        print(f"🔄 Updating model with {len(new):,} new rows...")
+        X = sp.csr_matrix(self.vectorizer.transform(new['text']))
+        y = new['label'].map(label_to_idx).to_numpy()
+        
+        # Same class weighting as training ('balanced' over the training distribution)
+        class_weight = self._balanced_class_weight() or {}
+        sample_weight = np.array([class_weight.get(label, 1.0) for label in y])
+        
+        mode = multi_class_mode(self.model)
+        coef, intercept, n_iter = _proximal_fit(
+            X, y, sample_weight, np.array(self.model.coef_, dtype=np.float64),
+            np.array(self.model.intercept_, dtype=np.float64), mode, stiffness, max_iter,
+        )
+        
+        # Same estimator type as before, so saving and serving work unchanged
+        if isinstance(self.model, RuntimeLinearModel):
+            model = RuntimeLinearModel(coef, intercept, np.array(self.model.classes_), mode)
+        else:
+            model = copy.deepcopy(self.model)
+            model.coef_ = coef
+            model.intercept_ = intercept
+        
+        distribution = dict(self.label_info.get('label_distribution', {}))
+        for label, count in new['label'].value_counts().items():
+            distribution[label] = distribution.get(label, 0) + int(count)
+        
+        updated = InterestClassifier(dict(self.label_info, label_distribution=distribution),
+                                     feature_mode=self.feature_mode)
+        updated.vectorizer = self.vectorizer
+        updated.model = model
+        updated.is_fitted = True
+        updated.model_version = model_version(updated)
+        
+        report = {'new_rows': len(new), 'iterations': n_iter, 'update_seconds': time.perf_counter() - start}
+        
+        # Both models share the vectorizer, so the eval set is vectorized once
+        eval_df = pd.DataFrame({'text': list(X_eval), 'label': list(y_eval)})
+        eval_df = eval_df[eval_df['label'].isin(label_to_idx)]
+        X_eval_vectors = self.vectorizer.transform(eval_df['text'])
+        y_eval_encoded = eval_df['label'].map(label_to_idx)
+        for name, classifier in (('before', self), ('after', updated)):
+            y_pred = classifier.model.predict(X_eval_vectors)
+            report[f'accuracy_{name}'] = accuracy_score(y_eval_encoded, y_pred)
+            report[f'f1_{name}'] = f1_score(y_eval_encoded, y_pred, average='weighted', zero_division=0)
+        
+        report['accuracy_delta'] = report['accuracy_after'] - report['accuracy_before']
+        report['f1_delta'] = report['f1_after'] - report['f1_before']
+        report['accepted'] = -report['f1_delta'] <= max_f1_drop
+        
+        print(f"  Updated in {report['update_seconds']:.1f}s ({n_iter} iterations)")
+        print(f"  Accuracy:   {report['accuracy_before']:.3f} → {report['accuracy_after']:.3f} ({report['accuracy_delta']:+.3f})")
+        print(f"  F1 Score:   {report['f1_before']:.3f} → {report['f1_after']:.3f} ({report['f1_delta']:+.3f})")
+        if report['accepted']:
+            print(f"✓ Update accepted (model version {updated.model_version})")
+            return updated, report
+        print(f"⚠️  Update rejected: F1 dropped more than {max_f1_drop:.3f}; keeping the current model")
+        return self, report
+
+
+def _proximal_fit(X: sp.csr_matrix, y: np.ndarray, sample_weight: np.ndarray, coef: np.ndarray,
+                  intercept: np.ndarray, mode: str, stiffness: float, max_iter: int) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Minimize the weighted log loss on (X, y) + stiffness/2 * ||W - coef||², starting from coef.
+    
+    The loss matches how the model turns scores into probabilities (softmax
+    for 'multinomial', a sigmoid per class for 'ovr' and 'binary'), and
+    only the columns present in X are optimized: the others have no loss
+    gradient, so their optimum is the current weight.
+    
+    Returns:
+        (coef, intercept, L-BFGS iterations)
+    """
+    
+    active = np.unique(X.indices)
+    X_active = X[:, active]
+    W0 = coef[:, active]
+    k, d = W0.shape
+    
+    rows = np.arange(len(y))
+    if mode == 'binary':
+        targets = (y == 1).astype(np.float64)[:, None]
+    else:
+        targets = np.zeros((len(y), k))
+        targets[rows, y] = 1.0
+    
+    def objective(theta: np.ndarray) -> Tuple[float, np.ndarray]:
+        W = theta[:k * d].reshape(k, d)
+        scores = np.asarray(X_active @ W.T) + theta[k * d:]
+        if mode == 'multinomial':
+            norm = logsumexp(scores, axis=1)
+            loss = np.dot(sample_weight, norm - scores[rows, y])
+            residual = np.exp(scores - norm[:, None]) - targets
+        else:
+            loss = np.dot(sample_weight, (np.logaddexp(0, scores) - targets * scores).sum(axis=1))
+            residual = expit(scores) - targets
+        residual *= sample_weight[:, None]
+        shift = W - W0
+        grad_W = np.asarray((X_active.T @ residual).T) + stiffness * shift
+        value = loss + stiffness / 2 * np.sum(shift * shift)
+        return value, np.concatenate([grad_W.ravel(), residual.sum(axis=0)])
+    
+    result = minimize(objective, np.concatenate([W0.ravel(), intercept]), jac=True,
+                      method='L-BFGS-B', options={'maxiter': max_iter})
+    
+    coef = coef.copy()
+    coef[:, active] = result.x[:k * d].reshape(k, d)
+    return coef, result.x[k * d:], int(result.nit)
+
+
+def _split_corpus(train_path: str, num_shards: int, out_dir: str, batch_size: int) -> List[str]:
+    """
+    Deal the cleaned rows of a corpus round-robin into num_shards JSON Lines files.
+    
+    Args:
+        train_path: Labeled corpus (see ml_preprocessing.iter_labeled_batches)
+        num_shards: Number of shard files
+        out_dir: Directory the shards are written to
+        batch_size: Rows per batch when reading train_path
+    
+    Returns:
+        Paths of the shard files, in shard order
+    """
+    
+    paths = [os.path.join(out_dir, f"shard-{shard}.jsonl") for shard in range(num_shards)]
+    files = [open(path, 'w', encoding='utf-8') for path in paths]
+    try:
+        row = 0
+        for batch in iter_labeled_batches(train_path, batch_size):
+            for shard, f in enumerate(files):
+                rows = batch.iloc[(shard - row) % num_shards::num_shards]
+                if len(rows):
+                    f.write(rows.to_json(orient='records', lines=True, force_ascii=False).rstrip('\n') + '\n')
+            row += len(batch)
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _shard_worker(connection, shard_path: str, shard: int, batch_size: int, n_features: int,
+                  label_to_idx: Dict[str, int], class_weight: Optional[Dict[int, float]], alpha: float) -> None:
+    """
+    One shard of train_sharded, run in its own process.
+    
+    Reads only its own shard file (already cleaned by _split_corpus).
+    Protocol over the pipe: send (doc_freq, num_docs); receive the global
+    IDF; then per round receive (coef, intercept), or (None, None) to
+    continue from its own weights, train one epoch and send back
+    (coef, intercept, samples); None ends the worker.
+    """
+    
+    vectorizer = HashingTfidfVectorizer(n_features=n_features)
+    texts = []
+    labels = []
+    if os.path.getsize(shard_path):
+        with pd.read_json(shard_path, lines=True, dtype=False, chunksize=batch_size) as reader:
+            for batch in reader:
+                texts.extend(batch['text'])
+                labels.extend(batch['label'])
+    
+    # Hashed once; the counts are re-weighted when the global IDF arrives
+    counts = vectorizer.partial_fit(texts) if texts else sp.csr_matrix((0, n_features))
+    connection.send((vectorizer.doc_freq, vectorizer.num_docs))
+    vectorizer.idf_ = connection.recv()
+    
+    y = pd.Series(labels, dtype=object).map(label_to_idx)
+    known = y.notna().to_numpy()
+    X = apply_tfidf(counts[known], vectorizer)
+    y = y[known].astype(int).to_numpy()
+    
+    classes = np.arange(len(label_to_idx))
+    model = SGDClassifier(loss='log_loss', alpha=alpha, class_weight=class_weight, random_state=42 + shard)
+    rng = np.random.default_rng(shard)
+    
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        coef, intercept = message
+        if coef is not None:
+            model.coef_ = coef.copy()
+            model.intercept_ = intercept.copy()
+        
+        if len(y):
+            order = rng.permutation(len(y))
+            for begin in range(0, len(y), batch_size):
+                rows = order[begin:begin + batch_size]
+                model.partial_fit(X[rows], y[rows], classes=classes)
+            connection.send((model.coef_, model.intercept_, len(y)))
+        else:
+            connection.send((np.zeros((len(classes), n_features)), np.zeros(len(classes)), 0))
+    connection.close()
+
+
+def _artifact_size(classifier: InterestClassifier) -> int:
+    """Bytes of the classifier's serving artifact (see ml_runtime)."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        return os.path.getsize(save_artifact(classifier, os.path.join(tmp_dir, 'model')))
 
 
 def train_and_evaluate_model(train_df: pd.DataFrame, test_df: pd.DataFrame, 
-                            label_info: Dict) -> Tuple[InterestClassifier, Dict]:
+                            label_info: Dict, feature_cache_dir: Optional[str] = None,
+                            **classifier_kwargs) -> Tuple[InterestClassifier, Dict]:
     """
     Complete training and evaluation pipeline.
     
@@ -316,6 +1213,9 @@ def train_and_evaluate_model(train_df: pd.DataFrame, test_df: pd.DataFrame,
         train_df: Training DataFrame with 'text' and 'label' columns
         test_df: Test DataFrame with 'text' and 'label' columns
         label_info: Label metadata dictionary
+        feature_cache_dir: Where to cache TF-IDF matrices, e.g. ml_features.FEATURE_CACHE_DIR
+            (default None: always re-vectorize)
+        **classifier_kwargs: Passed to InterestClassifier (e.g. feature_mode='hashing')
     
     Returns:
         Trained classifier and evaluation results
@@ -326,17 +1226,189 @@ def train_and_evaluate_model(train_df: pd.DataFrame, test_df: pd.DataFrame,
     print("="*60)
     
     # Create classifier
-    classifier = InterestClassifier(label_info)
+    classifier = InterestClassifier(label_info, **classifier_kwargs)
+    
+    # Vectorize (or reuse cached features for this exact data + vectorizer config)
+    X_train_vectors, X_test_vectors = vectorize_cached(
+        classifier.vectorizer, train_df['text'], test_df['text'], cache_dir=feature_cache_dir
+    )
     
     # Train
-    classifier.train(train_df['text'], train_df['label'])
+    classifier.train(train_df['text'], train_df['label'], vectors=X_train_vectors)
     
     # Evaluate
-    eval_results = classifier.evaluate(test_df['text'], test_df['label'])
+    eval_results = classifier.evaluate(test_df['text'], test_df['label'], vectors=X_test_vectors)
     
     return classifier, eval_results
 
 
+def compare_feature_modes(train_df: pd.DataFrame, test_df: pd.DataFrame, label_info: Dict,
+                          n_features: int = DEFAULT_HASH_FEATURES, latency_samples: int = 200) -> pd.DataFrame:
+    """
+    Train one classifier per feature mode and report accuracy and latency.
+    
+    Args:
+        train_df: Training DataFrame with 'text' and 'label' columns
+        test_df: Test DataFrame with 'text' and 'label' columns
+        label_info: Label metadata dictionary
+        n_features: Hash buckets for the hashing mode
+        latency_samples: Test texts predicted one at a time for single-text latency
+    
+    Returns:
+        DataFrame with one row per mode
+    """
+    
+    y_test = test_df['label'].map(label_info['label_to_idx'])
+    single_texts: List[str] = list(test_df['text'][:latency_samples])
+    rows = []
+    
+    for mode in FEATURE_MODES:
+        print(f"\n⚖️  Feature mode: {mode}")
+        classifier = InterestClassifier(label_info, feature_mode=mode, n_features=n_features)
+        
+        start = time.perf_counter()
+        classifier.train(train_df['text'], train_df['label'])
+        fit_seconds = time.perf_counter() - start
+        
+        # Whole test set in one batch
+        start = time.perf_counter()
+        y_pred = classifier.model.predict(classifier.vectorizer.transform(test_df['text']))
+        batch_ms = (time.perf_counter() - start) * 1000 / len(test_df)
+        
+        # One text per call, as the app sees it
+        start = time.perf_counter()
+        for text in single_texts:
+            classifier.model.predict_proba(classifier.vectorizer.transform([text]))
+        single_ms = (time.perf_counter() - start) * 1000 / max(1, len(single_texts))
+        
+        rows.append({
+            'mode': mode,
+            'features': classifier.model.coef_.shape[1],
+            'accuracy': accuracy_score(y_test, y_pred),
+            'f1': f1_score(y_test, y_pred, average='weighted', zero_division=0),
+            'fit_s': fit_seconds,
+            'batch_ms_per_text': batch_ms,
+            'single_ms_per_text': single_ms,
+            'vectorizer_kb': len(pickle.dumps(classifier.vectorizer)) / 1024,
+        })
+    
+    results = pd.DataFrame(rows)
+    print("\n📊 Feature mode comparison:")
+    print(results.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+    return results
+
+
+def compare_sharded_training(train_path: str, label_info: Dict, holdout: Union[str, pd.DataFrame],
+                             num_shards: Optional[int] = None, rounds: int = 5,
+                             n_features: int = DEFAULT_HASH_FEATURES,
+                             batch_size: int = STREAM_BATCH_SIZE) -> pd.DataFrame:
+    """
+    Holdout convergence of sharded training vs single-process train_streaming.
+    
+    Trains the single-process baseline and both mixing modes for the same
+    number of epochs over the same hashed features.
+    
+    Args:
+        train_path: Labeled corpus (CSV or JSON Lines)
+        label_info: Label metadata dictionary
+        holdout: Corpus path or DataFrame evaluated after every epoch / round
+        num_shards: Worker processes (default: one per CPU)
+        rounds: Epochs (baseline) and rounds (sharded)
+        n_features: Hash buckets
+        batch_size: Rows per batch
+    
+    Returns:
+        DataFrame with one row per method and epoch: holdout accuracy,
+        log loss, and cumulative seconds
+    """
+    
+    rows = []
+    runs = [('single process', None)] + [(f'{mixing} x{num_shards or os.cpu_count() or 1}', mixing) for mixing in MIXING_MODES]
+    for method, mixing in runs:
+        classifier = InterestClassifier(label_info, feature_mode='hashing', n_features=n_features)
+        start = time.perf_counter()
+        if mixing is None:
+            history = classifier.train_streaming(train_path, epochs=rounds, batch_size=batch_size, holdout=holdout)
+        else:
+            history = classifier.train_sharded(train_path, num_shards, rounds, mixing, batch_size, holdout)
+        total = time.perf_counter() - start
+        
+        elapsed = 0.0
+        for epoch, record in enumerate(history, start=1):
+            elapsed += record['seconds']
+            rows.append({
+                'method': method,
+                'epoch': epoch,
+                'holdout_accuracy': record.get('holdout_accuracy'),
+                'holdout_log_loss': record.get('holdout_log_loss'),
+                'seconds': elapsed,
+            })
+        rows[-1]['total_seconds'] = total  # including setup (IDF pass, worker start-up)
+    
+    results = pd.DataFrame(rows)
+    print("\n📊 Sharded training convergence:")
+    print(results.to_string(index=False, float_format=lambda x: f"{x:.3f}", na_rep=''))
+    return results
+
+
+def compare_quantization(classifier: InterestClassifier, test_df: pd.DataFrame,
+                         min_weight_ratio: float = 0.02, latency_samples: int = 200) -> pd.DataFrame:
+    """
+    Compare a trained classifier with its int8-quantized copy.
+    
+    Args:
+        classifier: Trained InterestClassifier
+        test_df: Test DataFrame with 'text' and 'label' columns
+        min_weight_ratio: See InterestClassifier.quantize
+        latency_samples: Test texts predicted one at a time for single-text latency
+    
+    Returns:
+        DataFrame with one row for the dense and one for the quantized model
+        (single_ms_per_text includes vectorizing, model_ms_per_text is
+        predict_proba alone)
+    """
+    
+    y_test = test_df['label'].map(classifier.label_info['label_to_idx'])
+    X_test = classifier.vectorizer.transform(test_df['text'])
+    single_texts: List[str] = list(test_df['text'][:latency_samples])
+    quantized = classifier.quantize(min_weight_ratio)
+    rows = []
+    
+    single_vectors = [classifier.vectorizer.transform([text]) for text in single_texts]
+    
+    for name, candidate in (('dense', classifier), ('int8', quantized)):
+        y_pred = candidate.model.predict(X_test)
+        for vector in single_vectors[:20]:
+            candidate.model.predict_proba(vector)  # warm-up
+        
+        # End to end, then the coefficient product alone (vectorizing dominates the former)
+        start = time.perf_counter()
+        for text in single_texts:
+            candidate.model.predict_proba(candidate.vectorizer.transform([text]))
+        single_ms = (time.perf_counter() - start) * 1000 / max(1, len(single_texts))
+        
+        start = time.perf_counter()
+        for vector in single_vectors:
+            candidate.model.predict_proba(vector)
+        model_ms = (time.perf_counter() - start) * 1000 / max(1, len(single_vectors))
+        
+        weights = getattr(candidate.model, 'weights', candidate.model.coef_)
+        rows.append({
+            'model': name,
+            'accuracy': accuracy_score(y_test, y_pred),
+            'f1': f1_score(y_test, y_pred, average='weighted', zero_division=0),
+            'coef_kb': weights.nbytes / 1024,
+            'single_ms_per_text': single_ms,
+            'model_ms_per_text': model_ms,
+        })
+    
+    results = pd.DataFrame(rows)
+    weights = quantized.model.weights
+    print(f"\n📦 Quantized: {len(weights.data):,} of {np.prod(weights.shape):,} weights kept")
+    print(results.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+    return results
+
+
 # Example usage
 if __name__ == "__main__":
     from ml_preprocessing import load_and_prepare_dataset, preprocess_data, show_class_distribution
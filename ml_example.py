@@ -242,6 +242,8 @@ def main():
     # STEP 4: Initialize predictor
     # ============================================================================
     predictor = InterestPredictor(classifier)
+    checked = predictor.check_feature_parity(test_df['text'].head(200))
+    print(f"\n✓ Serving features match training features ({checked} test texts)")
     
     
     # ============================================================================
@@ -0,0 +1,246 @@
+"""
+Feature Cache Module
+====================
+
+This module handles:
+1. Keying a train/test split by its cleaned texts and vectorizer config
+2. Saving the fitted vectorizer state and sparse train/test matrices (.npz)
+3. Restoring both on later runs so vectorization is skipped entirely
+4. Evicting least recently used entries beyond FEATURE_CACHE_MAX_BYTES
+
+Why?
+- Tuning the classifier (C, class weights, solver, ...) doesn't change the
+  features, yet every run re-tokenized the whole dataset
+- The key covers everything the matrices depend on, so changing the data
+  or any vectorizer parameter simply misses the cache
+
+Caching is opt-in (pass a cache_dir). Each entry holds two full TF-IDF
+matrices, so the directory is capped rather than left to grow per
+vectorizer config.
+
+Cache layout (.feature_cache/<key>.npz, no pickled objects):
+- X_train_*, X_test_*: CSR components (data, indices, indptr, shape)
+- idf, plus terms/term_ids (vocabulary mode) or doc_freq/num_docs (hashing)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+import sklearn
+
+from ml_runtime import VocabularyTable
+
+
+FEATURE_CACHE_DIR = ".feature_cache"
+FEATURE_CACHE_FORMAT = 1
+FEATURE_CACHE_MAX_BYTES = 2 * 1024 ** 3  # Least recently used entries are evicted beyond this
+
+
+def vectorizer_config(vectorizer) -> dict:
+    """Every setting that changes what a vectorizer produces."""
+    if hasattr(vectorizer, 'get_params'):
+        params = vectorizer.get_params()
+    else:
+        # HashingTfidfVectorizer: hashing settings plus its TF-IDF options
+        params = dict(vectorizer.hasher.get_params(), norm=vectorizer.norm,
+                      use_idf=vectorizer.use_idf, sublinear_tf=vectorizer.sublinear_tf)
+    return {'class': type(vectorizer).__name__, 'params': params}
+
+
+def feature_cache_key(train_texts: Iterable[str], test_texts: Iterable[str], vectorizer) -> str:
+    """
+    Hash the cleaned dataset and vectorizer configuration.
+
+    Args:
+        train_texts: Cleaned training texts (order matters: it's the row order)
+        test_texts: Cleaned test texts
+        vectorizer: Unfitted vectorizer whose config is part of the key
+
+    Returns:
+        Hex digest used as the cache file name
+    """
+    digest = hashlib.sha256()
+    header = {
+        'format': FEATURE_CACHE_FORMAT,
+        'sklearn': sklearn.__version__,  # tokenization can change between releases
+        'vectorizer': vectorizer_config(vectorizer),
+    }
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+
+    for split, texts in (('train', train_texts), ('test', test_texts)):
+        digest.update(f"\0{split}\0".encode("utf-8"))
+        for text in texts:
+            encoded = text.encode("utf-8")
+            # Length-prefix each text so boundaries can't shift between rows
+            digest.update(len(encoded).to_bytes(8, "little"))
+            digest.update(encoded)
+
+    return digest.hexdigest()
+
+
+def _sparse_arrays(prefix: str, X: sp.csr_matrix) -> dict:
+    X = sp.csr_matrix(X)
+    return {
+        f"{prefix}_data": X.data,
+        f"{prefix}_indices": X.indices,
+        f"{prefix}_indptr": X.indptr,
+        f"{prefix}_shape": np.asarray(X.shape, dtype=np.int64),
+    }
+
+
+def _sparse_from(prefix: str, arrays) -> sp.csr_matrix:
+    return sp.csr_matrix(
+        (arrays[f"{prefix}_data"], arrays[f"{prefix}_indices"], arrays[f"{prefix}_indptr"]),
+        shape=tuple(arrays[f"{prefix}_shape"]),
+    )
+
+
+def save_features(key: str, vectorizer, X_train: sp.csr_matrix, X_test: sp.csr_matrix,
+                  cache_dir: str = FEATURE_CACHE_DIR) -> Optional[Path]:
+    """
+    Store a fitted vectorizer's state and its train/test matrices.
+
+    Args:
+        key: feature_cache_key() of the split and vectorizer
+        vectorizer: Fitted TfidfVectorizer or HashingTfidfVectorizer
+        X_train: Training matrix
+        X_test: Test matrix
+        cache_dir: Cache directory
+
+    Returns:
+        Path of the cache file, or None if it couldn't be written
+    """
+
+    arrays = dict(_sparse_arrays('X_train', X_train), **_sparse_arrays('X_test', X_test))
+    arrays['idf'] = np.asarray(vectorizer.idf_)
+    if hasattr(vectorizer, 'doc_freq'):
+        arrays['doc_freq'] = vectorizer.doc_freq
+        arrays['num_docs'] = np.asarray(vectorizer.num_docs, dtype=np.int64)
+    else:
+        arrays['terms'], arrays['term_ids'] = VocabularyTable.build(vectorizer.vocabulary_)
+
+    # Write to a temp file first so readers never see a half-written cache entry
+    cache_root = Path(cache_dir)
+    cache_file = cache_root / f"{key}.npz"
+    try:
+        cache_root.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_root, suffix=".tmp", delete=False) as tmp:
+            np.savez(tmp, **arrays)
+        os.replace(tmp.name, cache_file)
+    except OSError:
+        return None  # Caching is best-effort; a read-only location just means re-vectorizing
+    evict_features(cache_root, keep=cache_file)
+    return cache_file
+
+
+def evict_features(cache_dir: str = FEATURE_CACHE_DIR, max_bytes: int = FEATURE_CACHE_MAX_BYTES,
+                   keep: Optional[Path] = None) -> int:
+    """
+    Delete least recently used cache entries until the directory fits in max_bytes.
+
+    Hits refresh an entry's mtime (see load_features), so mtime order is use order.
+
+    Args:
+        cache_dir: Cache directory
+        max_bytes: Size budget for all entries together
+        keep: Entry that is never evicted (the one just written)
+
+    Returns:
+        Number of entries deleted
+    """
+
+    entries = []
+    for path in Path(cache_dir).glob("*.npz"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue  # Removed by another process meanwhile
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    deleted = 0
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        if keep is not None and path == keep:
+            continue
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        deleted += 1
+    return deleted
+
+
+def load_features(key: str, vectorizer,
+                  cache_dir: str = FEATURE_CACHE_DIR) -> Optional[Tuple[sp.csr_matrix, sp.csr_matrix]]:
+    """
+    Restore cached matrices and fit the vectorizer from the cached state.
+
+    Args:
+        key: feature_cache_key() of the split and vectorizer
+        vectorizer: Unfitted vectorizer of the same config (fitted in place on a hit)
+        cache_dir: Cache directory
+
+    Returns:
+        (X_train, X_test), or None on a cache miss
+    """
+
+    cache_file = Path(cache_dir) / f"{key}.npz"
+    if not cache_file.exists():
+        return None
+    try:
+        os.utime(cache_file)  # Mark as recently used for evict_features()
+    except OSError:
+        pass  # A read-only cache still serves hits
+
+    with np.load(cache_file, allow_pickle=False) as arrays:
+        X_train = _sparse_from('X_train', arrays)
+        X_test = _sparse_from('X_test', arrays)
+
+        if hasattr(vectorizer, 'doc_freq'):
+            vectorizer.doc_freq = arrays['doc_freq']
+            vectorizer.num_docs = int(arrays['num_docs'])
+        else:
+            terms, term_ids = arrays['terms'], arrays['term_ids']
+            vectorizer.vocabulary_ = dict(zip(np.char.decode(terms, "utf-8").tolist(), term_ids.tolist()))
+        vectorizer.idf_ = arrays['idf']
+
+    return X_train, X_test
+
+
+def vectorize_cached(vectorizer, train_texts, test_texts,
+                     cache_dir: Optional[str] = None) -> Tuple[sp.csr_matrix, sp.csr_matrix]:
+    """
+    Fit the vectorizer and transform a train/test split, via the cache.
+
+    Args:
+        vectorizer: Unfitted vectorizer (fitted in place either way)
+        train_texts: Cleaned training texts
+        test_texts: Cleaned test texts
+        cache_dir: Cache directory (e.g. FEATURE_CACHE_DIR), or None to disable caching
+
+    Returns:
+        (X_train, X_test) sparse matrices
+    """
+
+    if cache_dir is None:
+        return vectorizer.fit_transform(train_texts), vectorizer.transform(test_texts)
+
+    key = feature_cache_key(train_texts, test_texts, vectorizer)
+    cached = load_features(key, vectorizer, cache_dir)
+    if cached is not None:
+        print(f"  ✓ Loaded cached features ({key[:12]})")
+        return cached
+
+    X_train = vectorizer.fit_transform(train_texts)
+    X_test = vectorizer.transform(test_texts)
+    save_features(key, vectorizer, X_train, X_test, cache_dir)
+    return X_train, X_test
@@ -3,10 +3,12 @@ Inference Module
 ================
 
 This module handles making predictions on new text:
-1. Single prediction on a short text
+1. Single and batch prediction on short texts (one model call per batch)
 2. Long transcript handling (chunking + averaging)
 3. Confidence scoring with threshold filtering
 4. User profile generation from predictions
+5. Streaming batch inference (mini-batches, DataFrame / Parquet output)
+6. An LRU cache of predictions for recurring texts
 
 Key Features:
 - Top-3 predictions with probabilities
@@ -14,12 +16,83 @@ Key Features:
 - Long transcript chunking (100-200 words per chunk)
 - Per-chunk predictions with averaging
 - Profile aggregation from multiple chunks
+- Cached predictions keyed by cleaned-text hash + model version
 """
 
+import os
+import tempfile
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Dict, Tuple, Union, Optional
+
 import numpy as np
-import pandas as pd
-from typing import List, Dict, Tuple
-import re
+
+from document import Document, as_document
+from ml_windows import SlidingWindowVectorizer, TokenIndex, window_bounds
+from result_cache import ResultCache, content_key
+
+
+DEFAULT_BATCH_SIZE = 1024
+DEFAULT_CACHE_SIZE = 4096  # cached predictions per InterestPredictor (0 disables)
+
+
+def top_k(probabilities: np.ndarray, k: int) -> np.ndarray:
+    """
+    Column indices of the k largest values in each row, largest first.
+    
+    With many classes, argpartition finds every row's top k in linear time
+    and only those k columns are sorted. With few classes relative to k
+    (7 interests, top 3) one argsort of the whole matrix is cheaper.
+    
+    Args:
+        probabilities: (num_rows x num_classes) matrix (a 1-D row is promoted)
+        k: Number of indices per row (capped at num_classes)
+    
+    Returns:
+        (num_rows x k) array of column indices
+    """
+    
+    probabilities = np.atleast_2d(probabilities)
+    num_classes = probabilities.shape[1]
+    k = max(0, min(k, num_classes))
+    if num_classes <= 4 * k:
+        return np.argsort(-probabilities, axis=1, kind='stable')[:, :k]
+    
+    # Plain fancy indexing; np.take_along_axis costs several times more on small rows
+    rows = np.arange(probabilities.shape[0])[:, None]
+    top = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+    order = np.argsort(-probabilities[rows, top], axis=1, kind='stable')
+    return top[rows, order]
+
+
+def spread_order(n: int) -> List[int]:
+    """
+    Indices 0..n-1 ordered so every prefix is spread across the range.
+    
+    First, last, middle, then the midpoints of each half, and so on
+    (breadth-first bisection), so the first few chunks of a transcript
+    sample its beginning, end and middle rather than just its opening.
+    
+    Args:
+        n: Number of items
+    
+    Returns:
+        Permutation of range(n)
+    """
+    
+    if n <= 2:
+        return list(range(n))
+    
+    order = [0, n - 1]
+    intervals = deque([(0, n - 1)])
+    while intervals:
+        lo, hi = intervals.popleft()
+        if hi - lo > 1:
+            mid = (lo + hi) // 2
+            order.append(mid)
+            intervals.extend([(lo, mid), (mid, hi)])
+    return order
 
 
 class InterestPredictor:
@@ -27,149 +100,494 @@ class InterestPredictor:
     Make predictions using trained interest classifier.
     """
     
-    def __init__(self, classifier):
+    def __init__(self, classifier, cache_size: int = DEFAULT_CACHE_SIZE):
         """
         Initialize predictor with trained classifier.
         
         Args:
             classifier: Trained InterestClassifier instance
+            cache_size: Texts whose class probabilities are kept in an LRU
+                        cache (0 disables the cache)
         """
         self.classifier = classifier
         self.confidence_threshold = 0.45
+        self._window_vectorizer = None
+        self._feature_name_source = None
+        self._feature_name_cache = None
+        self._cache = ResultCache(max_entries=cache_size) if cache_size > 0 else None
+        self._cache_version = None
+        self._cache_invalidations = 0
+        self._hashed_model = None  # Model whose content hash is _hashed_version (see model_version)
+        self._hashed_version = None
     
     
-    def predict_single(self, text: str, top_n: int = 3) -> Dict:
+    def predict_single(self, text: Union[str, Document], top_n: int = 3, explain: int = 0) -> Dict:
         """
         Predict interests from a single text.
         
         Args:
-            text: Input text
+            text: Input text or an already tokenized Document
             top_n: Number of top predictions to return
+            explain: If > 0, add 'explanation': the n-grams of this text that
+                     contributed most to the top prediction (see explain_vectors)
         
         Returns:
             Dictionary with predictions and confidence scores
         """
         
-        # Vectorize text
-        text_vector = self.classifier.vectorizer.transform([text.lower()])
+        return self.predict_batch([text], top_n, explain)[0]
+    
+    
+    def predict_batch(self, texts: List[Union[str, Document]], top_n: int = 3,
+                      explain: int = 0) -> List[Dict]:
+        """
+        Predict interests for many texts with one vectorizer and one model call.
         
-        # Get predictions
-        pred_idx = self.classifier.model.predict(text_vector)[0]
-        pred_label = self.classifier.label_info['idx_to_label'][pred_idx]
+        Args:
+            texts: Input texts or already tokenized Documents
+            top_n: Number of top predictions to return per text
+            explain: If > 0, add this many top contributing n-grams per text
         
-        # Get probabilities for all classes
-        probabilities = self.classifier.model.predict_proba(text_vector)[0]
+        Returns:
+            List of prediction dictionaries, one per text
+        """
         
-        # Get top N predictions
-        top_indices = np.argsort(probabilities)[-top_n:][::-1]
+        if explain <= 0:
+            return self._format_predictions(self._predict_proba(texts), top_n)
         
-        predictions = []
-        for idx in top_indices:
-            label = self.classifier.label_info['idx_to_label'][idx]
-            confidence = float(probabilities[idx])
-            
-            # Check if confidence meets threshold
-            if confidence < self.confidence_threshold:
-                confidence_level = "low"
-            else:
-                confidence_level = "high"
-            
-            predictions.append({
-                'interest': label,
-                'confidence': confidence,
-                'confidence_level': confidence_level,
-            })
-        
-        # Check if top prediction is above threshold
-        if predictions[0]['confidence'] < self.confidence_threshold:
-            return {
-                'primary': "Unknown / Low Signal",
-                'confidence': float(predictions[0]['confidence']),
-                'all_predictions': predictions,
-                'interpretation': "Confidence too low to determine interest profile."
-            }
+        # Explanations need the TF-IDF rows, so this path bypasses the cache
+        text_matrix = self._vectorize(texts)
+        
+        # Probabilities are computed once; the predicted label is their argmax
+        probabilities = self.classifier.model.predict_proba(text_matrix)
+        results = self._format_predictions(probabilities, top_n)
+        
+        explanations = self.explain_vectors(text_matrix, probabilities.argmax(axis=1), explain)
+        for result, explanation in zip(results, explanations):
+            result['explanation'] = explanation
+        return results
+    
+    
+    def explain(self, text: Union[str, Document], k: int = 5, interest: Optional[str] = None) -> List[Dict]:
+        """
+        The n-grams in a text that pushed hardest toward an interest.
+        
+        Args:
+            text: Input text or an already tokenized Document
+            k: Number of n-grams to return
+            interest: Interest to explain (default: the predicted one)
+        
+        Returns:
+            List of {'term', 'contribution'}, largest contribution first
+        """
+        
+        text_matrix = self._vectorize([text])
+        if interest is None:
+            classes = self.classifier.model.predict_proba(text_matrix).argmax(axis=1)
+        else:
+            classes = np.array([self.classifier.label_info['label_to_idx'][interest]])
+        return self.explain_vectors(text_matrix, classes, k)[0]
+    
+    
+    def explain_vectors(self, text_matrix, classes: np.ndarray, k: int = 5) -> List[List[Dict]]:
+        """
+        Top-k contributing n-grams of each TF-IDF row toward a class.
+        
+        Contribution = TF-IDF weight x that class's coefficient, for the
+        row's stored entries only: the cost is the number of n-grams in the
+        batch, the matrix is never densified.
+        
+        Args:
+            text_matrix: Sparse (num_texts x num_features) TF-IDF rows
+            classes: Class index to explain for each row
+            k: Maximum n-grams per row (only positive contributions are kept)
+        
+        Returns:
+            One list of {'term', 'contribution'} per row
+        """
+        
+        X = text_matrix.tocsr()
+        classes = np.asarray(classes)
+        row_of_entry = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+        entry_classes = classes[row_of_entry]
+        
+        # Binary models store one coefficient row, for class 1; class 0 is its negation
+        model = self.classifier.model
+        sign = 1.0
+        if len(model.intercept_) == 1:
+            sign = np.where(entry_classes == 1, 1.0, -1.0)
+            entry_classes = np.zeros_like(entry_classes)
+        
+        coef_at = getattr(model, 'coef_at', None)
+        if coef_at is not None:
+            coefficients = coef_at(entry_classes, X.indices)
+        else:
+            coefficients = model.coef_[entry_classes, X.indices]
+        contributions = X.data * coefficients * sign
+        
+        # Sort each row's entries by contribution (rows stay contiguous), keep the first k
+        order = np.lexsort((-contributions, row_of_entry))
+        rank = np.arange(len(order)) - X.indptr[row_of_entry[order]]
+        order = order[(rank < k) & (contributions[order] > 0)]
+        
+        names = self._feature_names()
+        explanations = [[] for _ in range(X.shape[0])]
+        for row, feature, contribution in zip(row_of_entry[order].tolist(), X.indices[order].tolist(),
+                                              contributions[order].tolist()):
+            term = names[feature] if names is not None else f"<hash {feature}>"
+            explanations[row].append({'term': term, 'contribution': contribution})
+        return explanations
+    
+    
+    def _feature_names(self) -> Optional[np.ndarray]:
+        """Feature id -> n-gram, built once per vectorizer; None for hashed features."""
+        
+        vectorizer = self.classifier.vectorizer
+        if self._feature_name_source is not vectorizer:
+            try:
+                self._feature_name_cache = vectorizer.get_feature_names_out()
+            except (AttributeError, ValueError):
+                self._feature_name_cache = None  # hashed features have no stored names
+            self._feature_name_source = vectorizer
+        return self._feature_name_cache
+    
+    
+    def predict_columns(self, texts: List[Union[str, Document]], top_n: int = 3) -> Dict[str, np.ndarray]:
+        """
+        Predictions for a batch as column arrays, without per-text dicts.
+        
+        Args:
+            texts: Input texts or already tokenized Documents
+            top_n: Number of top interests listed per text
+        
+        Returns:
+            {'primary_interest', 'confidence', 'top_{top_n}'} arrays, one entry per text
+        """
+        
+        probabilities = self._predict_proba(texts)
+        top_indices = top_k(probabilities, top_n)
+        confidence = probabilities[np.arange(len(probabilities)), top_indices[:, 0]]
+        
+        idx_to_label = self.classifier.label_info['idx_to_label']
+        labels = np.array([idx_to_label[i] for i in range(probabilities.shape[1])], dtype=object)
+        
+        primary = labels[top_indices[:, 0]]
+        primary[confidence < self.confidence_threshold] = "Unknown / Low Signal"
+        
+        # Object arrays of str concatenate element-wise
+        top_labels = labels[top_indices[:, 0]]
+        for col in range(1, top_indices.shape[1]):
+            top_labels = top_labels + ", " + labels[top_indices[:, col]]
         
         return {
-            'primary': predictions[0]['interest'],
-            'confidence': predictions[0]['confidence'],
-            'all_predictions': predictions,
-            'interpretation': f"High confidence in {predictions[0]['interest']} interest."
+            'primary_interest': primary,
+            'confidence': confidence,
+            f'top_{top_n}': top_labels,
         }
     
     
-    def split_into_chunks(self, text: str, words_per_chunk: int = 150) -> List[str]:
+    def _predict_proba(self, texts: List[Union[str, Document]]) -> np.ndarray:
+        """
+        Class probabilities for a batch: cached rows, plus one sparse
+        transform and one model call for the texts not in the cache.
+        """
+        
+        if self._cache is None or not texts:
+            return self.classifier.model.predict_proba(self._vectorize(texts))
+        
+        # Texts that clean to the same string get the same prediction, and
+        # each distinct text is looked up (and counted as a hit or miss) once
+        version = self._cached_model_version()
+        cleaned = [as_document(text).vectorizer_view.cleaned for text in texts]
+        keys = [(version, content_key(text)) for text in cleaned]
+        distinct = dict(zip(keys, cleaned))
+        found = {key: self._cache.get(key) for key in distinct}
+        
+        # Each missing text is scored once; rows are cached as float lists,
+        # which pickle ~10x faster than small arrays
+        missing = [key for key, row in found.items() if row is None]
+        if missing:
+            scored = self.classifier.model.predict_proba(
+                self.classifier.vectorizer.transform([distinct[key] for key in missing])
+            )
+            for key, row in zip(missing, scored.tolist()):
+                self._cache.put(key, row)
+                found[key] = row
+        
+        return np.array([found[key] for key in keys])
+    
+    
+    @property
+    def model_version(self) -> str:
+        """Version of the current model (classifier.model_version, else a content hash of its weights)."""
+        version = getattr(self.classifier, 'model_version', None)
+        if version:
+            return version
+        
+        # Hashed once per model object; holding the reference keeps a new
+        # model from being mistaken for it
+        model = self.classifier.model
+        if self._hashed_model is not model:
+            from ml_runtime import model_version
+            self._hashed_model, self._hashed_version = model, model_version(self.classifier)
+        return self._hashed_version
+    
+    
+    def _cached_model_version(self) -> str:
+        """Current model version, emptying the cache first if the model changed since it was filled."""
+        version = self.model_version
+        if version != self._cache_version:
+            if self._cache_version is not None:
+                self._cache.clear()
+                self._cache_invalidations += 1
+            self._cache_version = version
+        return version
+    
+    
+    def cache_stats(self) -> Dict:
+        """
+        Prediction cache hit rate and size.
+        
+        Counts restart whenever a different model is loaded.
+        
+        Returns:
+            ResultCache.stats() plus 'model_version' and 'invalidations'
+            ({'enabled': False} if the cache is disabled)
+        """
+        
+        if self._cache is None:
+            return {'enabled': False}
+        return dict(
+            self._cache.stats(),
+            enabled=True,
+            model_version=self._cache_version,
+            invalidations=self._cache_invalidations,
+        )
+    
+    
+    def _vectorize(self, texts: List[Union[str, Document]]):
+        """TF-IDF rows of the documents, cleaned exactly as the training data was."""
+        return self.classifier.vectorizer.transform([as_document(text).vectorizer_view.cleaned for text in texts])
+    
+    
+    def check_feature_parity(self, texts: Iterable[Union[str, Document]]) -> int:
+        """
+        Check that serving builds the same features training did.
+        
+        Each text is vectorized as training data is (ml_preprocessing.clean_text),
+        as a short text (_vectorize) and as one window spanning the whole text
+        (vectorize_windows).
+        
+        Args:
+            texts: Sample texts, e.g. held-out rows of the training data
+        
+        Returns:
+            Number of texts checked
+        
+        Raises:
+            ValueError: If any serving path produces different features
+        """
+        
+        from ml_preprocessing import clean_text
+        
+        texts = list(texts)
+        docs = [as_document(text) for text in texts]
+        trained = self.classifier.vectorizer.transform([clean_text(doc.text) for doc in docs])
+        served = self._vectorize(docs)
+        
+        for i, doc in enumerate(docs):
+            windowed = self.vectorize_windows(doc, [(0, len(doc.vectorizer_view))])
+            for path, features in (('_vectorize', served[i]), ('vectorize_windows', windowed)):
+                if abs(features - trained[i]).max() > 1e-6:
+                    raise ValueError(
+                        f"Serving features differ from training features ({path}) for text: {doc.text[:100]!r}"
+                    )
+        return len(texts)
+    
+    
+    def _format_predictions(self, probabilities: np.ndarray, top_n: int = 3) -> List[Dict]:
+        """Build prediction dictionaries from a (num_texts x num_classes) probability matrix."""
+        
+        # Top N of every row at once; column 0 is each row's argmax
+        top_indices = top_k(probabilities, top_n)
+        top_confidences = probabilities[np.arange(len(probabilities))[:, None], top_indices]
+        
+        idx_to_label = self.classifier.label_info['idx_to_label']
+        threshold = self.confidence_threshold
+        results = []
+        
+        for indices, confidences in zip(top_indices.tolist(), top_confidences.tolist()):
+            predictions = [
+                {
+                    'interest': idx_to_label[idx],
+                    'confidence': confidence,
+                    'confidence_level': "low" if confidence < threshold else "high",
+                }
+                for idx, confidence in zip(indices, confidences)
+            ]
+            
+            # Check if top prediction is above threshold
+            if confidences[0] < threshold:
+                results.append({
+                    'primary': "Unknown / Low Signal",
+                    'confidence': confidences[0],
+                    'all_predictions': predictions,
+                    'interpretation': "Confidence too low to determine interest profile."
+                })
+            else:
+                results.append({
+                    'primary': predictions[0]['interest'],
+                    'confidence': confidences[0],
+                    'all_predictions': predictions,
+                    'interpretation': f"High confidence in {predictions[0]['interest']} interest."
+                })
+        
+        return results
+    
+    
+    def chunk_bounds(self, num_words: int, words_per_chunk: int = 150,
+                     stride: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Word ranges of the overlapping chunks for a transcript.
+        
+        Args:
+            num_words: Number of words in the transcript
+            words_per_chunk: Target words per chunk (100-200 recommended)
+            stride: Words between chunk starts (default: 75% of words_per_chunk)
+        
+        Returns:
+            List of (start, end) word positions
+        """
+        
+        # Create overlapping chunks, only keeping chunks with ≥20 words
+        stride = stride or int(words_per_chunk * 0.75)  # 75% overlap
+        bounds = window_bounds(num_words, words_per_chunk, stride, min_words=20)
+        
+        # Ensure we don't miss the end
+        if num_words:
+            final_bounds = (max(0, num_words - words_per_chunk // 2), num_words)
+            if final_bounds not in bounds:
+                bounds.append(final_bounds)
+        
+        return bounds
+    
+    
+    def split_into_chunks(self, text: Union[str, Document], words_per_chunk: int = 150) -> List[str]:
         """
         Split long transcript into overlapping chunks.
         
+        Chunks are sliced out of the document's lowercased text
+        (Document.vectorizer_view) by word offset, so words are never
+        re-joined or re-split.
+        
         Args:
-            text: Long transcript text
+            text: Long transcript text or an already tokenized Document
             words_per_chunk: Target words per chunk (100-200 recommended)
         
         Returns:
-            List of text chunks
+            List of cleaned text chunks
         """
         
-        # Split into words
-        words = text.split()
+        doc = as_document(text).vectorizer_view
+        return [doc.span(start, end) for start, end in self.chunk_bounds(len(doc), words_per_chunk)]
+    
+    
+    def vectorize_windows(self, text: Union[str, Document],
+                          bounds: List[Tuple[int, int]], index: Optional[TokenIndex] = None):
+        """
+        TF-IDF vectors for word windows of one transcript.
         
-        # Create overlapping chunks
-        chunks = []
-        stride = int(words_per_chunk * 0.75)  # 75% overlap
+        Uses a single tokenization pass with prefix-difference counts when
+        the vectorizer allows it, falling back to transforming each window.
         
-        for i in range(0, len(words), stride):
-            chunk = ' '.join(words[i:i + words_per_chunk])
-            if len(chunk.split()) >= 20:  # Only include chunks with ≥20 words
-                chunks.append(chunk)
+        Args:
+            text: Transcript text or an already tokenized Document
+            bounds: List of (start, end) word positions
+            index: TokenIndex of the document, to reuse across calls
         
-        # Ensure we don't miss the end
-        if words[-(words_per_chunk//2):]:
-            final_chunk = ' '.join(words[-(words_per_chunk//2):])
-            if final_chunk not in chunks:
-                chunks.append(final_chunk)
+        Returns:
+            Sparse matrix with one row per window
+        """
         
-        return chunks
+        doc = as_document(text).vectorizer_view
+        engine = self._window_engine()
+        
+        if engine is None:
+            return self.classifier.vectorizer.transform([doc.span(start, end) for start, end in bounds])
+        return engine.transform(doc, bounds, index)
+    
     
+    def _window_engine(self) -> Optional[SlidingWindowVectorizer]:
+        """SlidingWindowVectorizer for the current vectorizer, or None if it isn't supported."""
+        
+        # Rebuild the window engine if the classifier's vectorizer was replaced
+        vectorizer = self.classifier.vectorizer
+        if self._window_vectorizer is None or self._window_vectorizer.vectorizer is not vectorizer:
+            self._window_vectorizer = (
+                SlidingWindowVectorizer(vectorizer) if SlidingWindowVectorizer.supports(vectorizer) else None
+            )
+        return self._window_vectorizer
     
-    def predict_long_transcript(self, transcript: str, words_per_chunk: int = 150) -> Dict:
+    
+    def predict_long_transcript(self, transcript: Union[str, Document], words_per_chunk: int = 150,
+                                stride: Optional[int] = None, early_exit: bool = False,
+                                significance: float = 0.05, min_chunks: int = 3) -> Dict:
         """
         Predict interests from a long transcript (e.g., 5-minute conversation).
         
         Process:
         1. Split transcript into chunks (~150 words each with 75% overlap)
-        2. Predict interests for each chunk
+        2. Vectorize all chunks from one token pass and predict them as one batch
         3. Average probabilities across all chunks
         4. Return aggregated profile
         
+        With early_exit, chunks are scored one at a time in a spread-out
+        order (see spread_order) and scoring stops once the top interest
+        beats the runner-up by a significant margin (one-sided t-test on
+        the per-chunk probability difference). Single-topic transcripts
+        usually stop after min_chunks.
+        
         Args:
-            transcript: Long conversation transcript
+            transcript: Long conversation transcript or an already tokenized Document
             words_per_chunk: Words per chunk (100-200 recommended)
+            stride: Words between chunk starts (default: 75% of words_per_chunk)
+            early_exit: Stop scoring chunks once the top interest is clear
+            significance: Test level for early_exit (lower = more chunks scored)
+            min_chunks: Chunks always scored before early_exit may stop
         
         Returns:
-            Dictionary with aggregated predictions
+            Dictionary with aggregated predictions ('chunks_evaluated' says
+            how many chunks were actually scored)
         """
         
-        print(f"\n📝 Processing long transcript ({len(transcript.split())} words)...")
+        doc = as_document(transcript).vectorizer_view
+        print(f"\n📝 Processing long transcript ({len(doc)} words)...")
         
         # Split into chunks
-        chunks = self.split_into_chunks(transcript, words_per_chunk)
+        chunks = self.chunk_bounds(len(doc), words_per_chunk, stride)
         print(f"  ✓ Split into {len(chunks)} chunks (~{words_per_chunk} words each)")
         
-        # Predict for each chunk
-        chunk_predictions = []
-        for i, chunk in enumerate(chunks):
-            pred = self.predict_single(chunk)
-            chunk_predictions.append(pred)
+        if not chunks:
+            raise ValueError("Transcript is empty - nothing to predict.")
+        
+        if early_exit:
+            evaluated, chunk_probs, interval = self._score_until_separated(doc, chunks, significance, min_chunks)
+        else:
+            # Vectorize all chunks in one pass and score them in one call
+            evaluated = list(range(len(chunks)))
+            chunk_probs = self.classifier.model.predict_proba(self.vectorize_windows(doc, chunks))
+        
+        # Per-chunk predictions come straight from the rows of that matrix
+        chunk_predictions = self._format_predictions(chunk_probs)
+        for i, pred in zip(evaluated, chunk_predictions):
             print(f"  Chunk {i+1}: {pred['primary']} ({pred['confidence']:.2%})")
         
         # Average probabilities across chunks
-        all_probs = {}
-        for label_idx, label in self.classifier.label_info['idx_to_label'].items():
-            probs = []
-            for chunk in chunks:
-                chunk_vector = self.classifier.vectorizer.transform([chunk.lower()])
-                chunk_probs = self.classifier.model.predict_proba(chunk_vector)[0]
-                probs.append(chunk_probs[label_idx])
-            all_probs[label] = np.mean(probs)
+        mean_probs = chunk_probs.mean(axis=0)
+        all_probs = {
+            label: mean_probs[label_idx]
+            for label_idx, label in self.classifier.label_info['idx_to_label'].items()
+        }
         
         # Sort by averaged probability
         sorted_interests = sorted(all_probs.items(), key=lambda x: x[1], reverse=True)
@@ -186,8 +604,12 @@ class InterestPredictor:
                 for label, conf in sorted_interests
             ],
             'chunks_analyzed': len(chunks),
-            'total_words': len(transcript.split()),
+            'chunks_evaluated': len(evaluated),
+            'total_words': len(doc),
         }
+        if early_exit:
+            profile['confidence_interval'] = interval
+            print(f"  ✓ Stopped after {len(evaluated)}/{len(chunks)} chunks")
         
         # Check if top confidence meets threshold
         if profile['top_confidence'] < self.confidence_threshold:
@@ -200,6 +622,70 @@ class InterestPredictor:
         return profile
     
     
+    def _score_until_separated(self, doc: Document, chunks: List[Tuple[int, int]], significance: float,
+                               min_chunks: int) -> Tuple[List[int], np.ndarray, Tuple[float, float]]:
+        """
+        Score chunks in spread-out order until the top class is significantly ahead.
+        
+        Returns:
+            (indices of the scored chunks, their probability rows,
+             confidence interval of the top class's mean probability)
+        """
+        
+        # Imported here: only early exit needs the t distribution (stdtrit = its inverse CDF;
+        # a plain ufunc, unlike scipy.stats.t.ppf which costs ~100x more per call)
+        from scipy.special import stdtrit
+        
+        order = spread_order(len(chunks))
+        engine = self._window_engine()
+        index = None
+        
+        def score(positions: List[int]) -> np.ndarray:
+            nonlocal index
+            bounds = [chunks[i] for i in positions]
+            if engine is None or not rows:
+                # The first look only tokenizes its own chunks: when it already
+                # decides, the rest of the transcript is never tokenized
+                matrix = self.classifier.vectorizer.transform([doc.span(start, end) for start, end in bounds])
+            else:
+                # Scoring continues: one pass over the whole transcript serves every later look
+                if index is None:
+                    index = engine.index_document(doc)
+                matrix = engine.transform(doc, bounds, index)
+            return self.classifier.model.predict_proba(matrix)
+        
+        n = min(max(1, min_chunks), len(order))
+        rows = []
+        rows.append(score(order[:n]))
+        
+        while True:
+            probs = np.vstack(rows)
+            mean = probs.mean(axis=0)
+            top, runner_up = top_k(mean, 2)[0] if len(mean) > 1 else (0, 0)
+            
+            # Per-chunk lead of the top class over the runner-up, and its lower bound
+            lead = probs[:, top] - probs[:, runner_up]
+            spread = lead.std(ddof=1) / np.sqrt(n) if n > 1 else np.inf
+            critical = stdtrit(n - 1, 1 - significance) if n > 1 else np.inf
+            separated = top != runner_up and lead.mean() - critical * spread > 0
+            
+            if separated or n == len(order):
+                break
+            
+            # Grow by half each look: few model calls, little overshoot past the stopping point
+            step = min(max(1, n // 2), len(order) - n)
+            rows.append(score(order[n:n + step]))
+            n += step
+        
+        top_spread = probs[:, top].std(ddof=1) / np.sqrt(n) if n > 1 else np.inf
+        two_sided = stdtrit(n - 1, 1 - significance / 2) if n > 1 else np.inf
+        interval = (
+            float(max(0.0, mean[top] - two_sided * top_spread)),
+            float(min(1.0, mean[top] + two_sided * top_spread)),
+        )
+        return order[:n], probs, interval
+    
+    
     def get_user_profile(self, interests_dict: Dict[str, float]) -> Dict[str, str]:
         """
         Generate a readable user profile from interest scores.
@@ -232,50 +718,202 @@ class InterestPredictor:
         }
 
 
-def batch_predict(predictor: InterestPredictor, texts: List[str]) -> List[Dict]:
+def iter_batches(items: Iterable, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[List]:
+    """
+    Split any iterable into lists of at most batch_size items, lazily.
+    
+    Args:
+        items: Iterable of any length (a generator is consumed as it goes)
+        batch_size: Items per batch
+    
+    Returns:
+        Iterator of lists
+    """
+    
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def iter_predictions(predictor: InterestPredictor, texts: Iterable[str],
+                     batch_size: int = DEFAULT_BATCH_SIZE, top_n: int = 3) -> Iterator[Dict]:
+    """
+    Lazily predict an iterable of texts, one vectorize/predict call per batch.
+    
+    Args:
+        predictor: InterestPredictor instance
+        texts: Iterable of text samples (any length)
+        batch_size: Texts vectorized and scored together
+        top_n: Number of top predictions per text
+    
+    Returns:
+        Iterator of prediction dictionaries, in input order
+    """
+    
+    for batch in iter_batches(texts, batch_size):
+        yield from predictor.predict_batch(batch, top_n)
+
+
+def prediction_frame(predictor: InterestPredictor, batch: List[Union[str, Document]],
+                     include_text: bool = True) -> 'pd.DataFrame':
+    """
+    Predict one batch into a DataFrame built from column arrays.
+    
+    Args:
+        predictor: InterestPredictor instance
+        batch: Texts to predict together
+        include_text: Add a 'text' column with the first 100 characters
+    
+    Returns:
+        DataFrame with 'text', 'primary_interest', 'confidence', 'top_3'
+    """
+    
+    # Imported here so serving workers don't pay for pandas
+    import pandas as pd
+    
+    columns = predictor.predict_columns(batch)
+    if include_text:
+        raw = pd.Series([as_document(text).text for text in batch], dtype=object)
+        preview = raw.str.slice(0, 100)
+        columns = {'text': preview.where(raw.str.len() <= 100, preview + '...'), **columns}
+    return pd.DataFrame(columns)
+
+
+def iter_prediction_frames(predictor: InterestPredictor, texts: Iterable[str],
+                           batch_size: int = DEFAULT_BATCH_SIZE,
+                           include_text: bool = True) -> Iterator['pd.DataFrame']:
+    """
+    Lazily predict an iterable of texts as one DataFrame per batch.
+    
+    Columns are built from arrays (see InterestPredictor.predict_columns),
+    never from per-row dicts.
+    
+    Args:
+        predictor: InterestPredictor instance
+        texts: Iterable of text samples (any length)
+        batch_size: Texts per batch (and rows per DataFrame)
+        include_text: Add a 'text' column with the first 100 characters
+    
+    Returns:
+        Iterator of DataFrames with 'text', 'primary_interest', 'confidence', 'top_3'
+    """
+    
+    for batch in iter_batches(texts, batch_size):
+        yield prediction_frame(predictor, batch, include_text)
+
+
+def batch_predict(predictor: InterestPredictor, texts: Iterable[str],
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> List[Dict]:
     """
     Make predictions on multiple texts.
     
     Args:
         predictor: InterestPredictor instance
-        texts: List of text samples
+        texts: Iterable of text samples
+        batch_size: Texts vectorized and scored together
     
     Returns:
         List of prediction dictionaries
     """
     
-    results = []
-    for text in texts:
-        result = predictor.predict_single(text)
-        results.append(result)
-    
-    return results
+    return list(iter_predictions(predictor, texts, batch_size))
 
 
-def create_prediction_dataframe(predictor: InterestPredictor, texts: List[str]) -> pd.DataFrame:
+def create_prediction_dataframe(predictor: InterestPredictor, texts: Iterable[str],
+                                batch_size: int = DEFAULT_BATCH_SIZE) -> 'pd.DataFrame':
     """
     Create a DataFrame of predictions for batch analysis.
     
     Args:
         predictor: InterestPredictor instance
-        texts: List of text samples
+        texts: Iterable of text samples
+        batch_size: Texts vectorized and scored together
     
     Returns:
         DataFrame with predictions
     """
     
-    predictions = batch_predict(predictor, texts)
+    import pandas as pd
+    
+    frames = list(iter_prediction_frames(predictor, texts, batch_size))
+    if not frames:
+        return pd.DataFrame(columns=['text', 'primary_interest', 'confidence', 'top_3'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_predictions_parquet(predictor: InterestPredictor, texts: Iterable[str], path: str,
+                              batch_size: int = DEFAULT_BATCH_SIZE, include_text: bool = True) -> int:
+    """
+    Stream predictions for any number of texts into one Parquet file.
+    
+    Each batch becomes a row group, so memory stays at one batch however
+    many texts there are. Requires pyarrow.
+    
+    Args:
+        predictor: InterestPredictor instance
+        texts: Iterable of text samples (e.g. a generator over an archive)
+        path: Output .parquet file
+        batch_size: Texts per batch / row group
+        include_text: Add a 'text' column with the first 100 characters
+    
+    Returns:
+        Number of texts written
+    """
     
-    data = []
-    for text, pred in zip(texts, predictions):
-        data.append({
-            'text': text[:100] + '...' if len(text) > 100 else text,
-            'primary_interest': pred['primary'],
-            'confidence': pred['confidence'],
-            'top_3': ', '.join([p['interest'] for p in pred['all_predictions'][:3]]),
-        })
+    return write_frames_parquet(iter_prediction_frames(predictor, texts, batch_size, include_text), path)
+
+
+def write_frames_parquet(frames: Iterable['pd.DataFrame'], path: str) -> int:
+    """
+    Write DataFrames with the same columns to one Parquet file, one row group each.
+    
+    Args:
+        frames: Iterable of DataFrames (e.g. iter_prediction_frames)
+        path: Output .parquet file
+    
+    Returns:
+        Number of rows written
+    """
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Writing Parquet needs pyarrow: pip install pyarrow") from e
+    
+    path = Path(path)
+    total = 0
+    writer = None
+    
+    # Write to a temp file first so readers never see a half-written file
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+        pass
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp.name, table.schema)
+            writer.write_table(table)
+            total += len(frame)
+        if writer is None:
+            raise ValueError("No texts to predict.")
+        writer.close()
+        os.chmod(tmp.name, 0o644)  # NamedTemporaryFile is created 0600
+        os.replace(tmp.name, path)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        os.unlink(tmp.name)
+        raise
     
-    return pd.DataFrame(data)
+    print(f"✓ Wrote {total:,} predictions to {path}")
+    return total
 
 
 # Example usage
@@ -7,6 +7,7 @@ This module handles:
 2. Mapping original categories to our 7 interest categories
 3. Data cleaning and validation
 4. Class distribution analysis
+5. Streaming labeled data from disk in mini-batches (CSV / JSON Lines)
 
 Why 20 Newsgroups?
 - Contains real discussion forum posts (conversational)
@@ -23,8 +24,11 @@ Why TF-IDF works for transcripts:
 
 import pandas as pd
 import numpy as np
+from pathlib import Path
 from sklearn.datasets import fetch_20newsgroups
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Iterator
+
+from document import lowercase_text
 
 
 # Category mapping: 20 Newsgroups → 7 Interest Categories
@@ -127,15 +131,16 @@ def clean_text(text: str) -> str:
     """
     Clean text: lowercase, remove extra whitespace.
     
+    Serving reads the same view (Document.vectorizer_view), so training
+    and prediction see identical features.
+    
     Args:
         text: Raw text string
     
     Returns:
         Cleaned text
     """
-    text = str(text).lower()
-    text = ' '.join(text.split())  # Remove extra whitespace
-    return text
+    return lowercase_text(str(text))
 
 
 def preprocess_data(train_df: pd.DataFrame, test_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
@@ -166,6 +171,69 @@ def preprocess_data(train_df: pd.DataFrame, test_df: pd.DataFrame) -> Tuple[pd.D
     return train_df, test_df
 
 
+def iter_labeled_batches(path: str, batch_size: int = 10000) -> Iterator[pd.DataFrame]:
+    """
+    Stream a labeled corpus from disk in cleaned mini-batches.
+    
+    Only one batch is in memory at a time, so the corpus can be far larger
+    than RAM. Rows are cleaned and filtered as in preprocess_data().
+    
+    Args:
+        path: CSV or JSON Lines file (optionally compressed, e.g. .csv.gz)
+              with 'text' and 'label' columns
+        batch_size: Rows per batch
+    
+    Returns:
+        Iterator of DataFrames with columns ['text', 'label']
+    """
+    
+    suffixes = Path(path).suffixes
+    if '.csv' in suffixes:
+        reader = pd.read_csv(path, usecols=['text', 'label'], chunksize=batch_size)
+    elif '.jsonl' in suffixes or '.ndjson' in suffixes:
+        reader = pd.read_json(path, lines=True, chunksize=batch_size)
+    else:
+        raise ValueError(f"Unsupported corpus format: {path} (expected .csv or .jsonl)")
+    
+    with reader:
+        for batch in reader:
+            batch = batch[['text', 'label']].dropna()
+            batch['text'] = batch['text'].apply(clean_text)
+            batch = batch[batch['text'].str.len() > 10].reset_index(drop=True)
+            if len(batch):
+                yield batch
+
+
+def scan_label_info(path: str, batch_size: int = 10000) -> Dict:
+    """
+    Build label metadata for an on-disk corpus with one streaming pass.
+    
+    Args:
+        path: Corpus file (see iter_labeled_batches)
+        batch_size: Rows per batch
+    
+    Returns:
+        Dictionary with label metadata (same format as create_label_info)
+    """
+    
+    label_counts: Dict[str, int] = {}
+    for batch in iter_labeled_batches(path, batch_size):
+        for label, count in batch['label'].value_counts().items():
+            label_counts[label] = label_counts.get(label, 0) + int(count)
+    
+    unique_labels = sorted(label_counts)
+    label_to_idx = {label: idx for idx, label in enumerate(unique_labels)}
+    idx_to_label = {idx: label for label, idx in label_to_idx.items()}
+    
+    return {
+        'unique_labels': unique_labels,
+        'label_to_idx': label_to_idx,
+        'idx_to_label': idx_to_label,
+        'label_distribution': dict(sorted(label_counts.items(), key=lambda item: -item[1])),
+        'num_classes': len(unique_labels),
+    }
+
+
 def create_label_info(df: pd.DataFrame) -> Dict:
     """
     Create metadata about labels (distribution, encoding).
@@ -0,0 +1,305 @@
+"""
+Model Registry Module
+=====================
+
+This module handles:
+1. A registry directory of versioned model artifacts plus an "active" pointer
+2. Publishing a trained classifier (or an existing artifact) as a new version
+3. Activating any published version (promote or roll back) atomically
+4. A serving predictor that follows the active pointer from a background
+   thread and swaps models without a restart
+
+Why?
+- Deploying a retrained model used to mean editing the load_model() path
+  and restarting the app
+- Loading and warming up the new artifact happens on the watcher thread,
+  never on a request
+- The swap is a single reference assignment: a request holds the predictor
+  it started with, so in-flight requests finish on their model while new
+  requests see the new one
+
+Registry layout:
+    {root}/versions/{model_version}.model   (save_artifact format)
+    {root}/ACTIVE                           (name of the active version)
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from ml_inference import DEFAULT_CACHE_SIZE, InterestPredictor
+from ml_runtime import (
+    ARTIFACT_SUFFIX, RuntimeClassifier, RuntimePredictor, artifact_path, model_version, save_artifact,
+)
+
+
+ACTIVE_POINTER = "ACTIVE"
+VERSIONS_DIR = "versions"
+DEFAULT_POLL_INTERVAL = 2.0  # seconds between checks of the active pointer
+
+
+class ModelRegistry:
+    """
+    Directory of versioned model artifacts with one active version.
+
+    Versions are named by the model's content hash (model_version), so
+    publishing the same model twice stores it once.
+    """
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: Registry directory (created if missing)
+        """
+        self.root = Path(root)
+        (self.root / VERSIONS_DIR).mkdir(parents=True, exist_ok=True)
+
+
+    def path(self, version: str) -> str:
+        """Artifact path prefix of a version (as taken by RuntimePredictor / load_model)."""
+        return str(self.root / VERSIONS_DIR / version)
+
+
+    def versions(self) -> List[str]:
+        """Published versions, oldest first."""
+        artifacts = (self.root / VERSIONS_DIR).glob(f"*{ARTIFACT_SUFFIX}")
+        return [p.stem for p in sorted(artifacts, key=lambda p: p.stat().st_mtime)]
+
+
+    def active_version(self) -> Optional[str]:
+        """Version the active pointer names, or None if nothing was activated yet."""
+        try:
+            return (self.root / ACTIVE_POINTER).read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+
+    def publish(self, model, activate: bool = True) -> str:
+        """
+        Add a model to the registry.
+
+        Args:
+            model: Trained InterestClassifier, or the path prefix of an
+                   existing artifact (see save_model)
+            activate: Make it the active version right away
+
+        Returns:
+            The version name
+        """
+
+        if isinstance(model, str):
+            version = RuntimeClassifier.load(model).model_version
+            target = Path(artifact_path(self.path(version)))
+            if not target.exists():
+                # Copy under a temporary name and rename, like save_artifact
+                with tempfile.NamedTemporaryFile(dir=target.parent, suffix=".tmp", delete=False) as tmp:
+                    with open(artifact_path(model), 'rb') as source:
+                        shutil.copyfileobj(source, tmp)
+                os.chmod(tmp.name, 0o644)
+                os.replace(tmp.name, target)
+        else:
+            if not model.is_fitted:
+                raise ValueError("Cannot publish untrained model.")
+            version = model_version(model)
+            if not Path(artifact_path(self.path(version))).exists():
+                save_artifact(model, self.path(version))
+
+        print(f"📦 Published model version {version}")
+        if activate:
+            self.activate(version)
+        return version
+
+
+    def activate(self, version: str) -> None:
+        """
+        Point the registry at a published version (watchers pick it up on their next poll).
+
+        Args:
+            version: A name from versions()
+        """
+
+        if not Path(artifact_path(self.path(version))).exists():
+            raise ValueError(f"Unknown model version {version!r}; published: {self.versions()}")
+
+        # Rename over the old pointer so readers see the old or the new name, never a partial one
+        pointer = self.root / ACTIVE_POINTER
+        with tempfile.NamedTemporaryFile('w', dir=self.root, suffix=".tmp", delete=False) as tmp:
+            tmp.write(version)
+        os.chmod(tmp.name, 0o644)
+        os.replace(tmp.name, pointer)
+        print(f"✓ Active model version: {version}")
+
+
+class RegistryPredictor:
+    """
+    InterestPredictor that serves the registry's active version and hot-swaps it.
+
+    Attribute access is forwarded to the current RuntimePredictor, so it
+    is used like one (predict_single, predict_batch, predict_long_transcript,
+    or wrapped by CascadePredictor). Each call is bound to the predictor
+    current when the call started.
+    """
+
+    def __init__(self, registry: Union[str, ModelRegistry], poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 cache_size: int = DEFAULT_CACHE_SIZE, confidence_threshold: Optional[float] = None,
+                 watch: bool = True):
+        """
+        Args:
+            registry: ModelRegistry or its root directory
+            poll_interval: Seconds between checks of the active pointer
+            cache_size: Prediction cache entries of each loaded version
+            confidence_threshold: Applied to every version loaded (default: the predictor's)
+            watch: Start the background watcher now (otherwise call refresh())
+        """
+        self.registry = registry if isinstance(registry, ModelRegistry) else ModelRegistry(registry)
+        self.poll_interval = poll_interval
+        self.cache_size = cache_size
+        self._confidence_threshold = confidence_threshold
+        self.last_error: Optional[str] = None
+        self.swaps = 0
+        self._swap_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher: Optional[threading.Thread] = None
+
+        version = self.registry.active_version()
+        if version is None:
+            raise ValueError(f"No active model in {self.registry.root}; publish() one first.")
+        self._current = self._load(version)
+        self.version = version
+
+        if watch:
+            self.start()
+
+
+    @property
+    def predictor(self) -> InterestPredictor:
+        """The predictor serving new requests right now."""
+        return self._current
+
+
+    @property
+    def confidence_threshold(self) -> float:
+        return self._current.confidence_threshold
+
+
+    @confidence_threshold.setter
+    def confidence_threshold(self, value: float) -> None:
+        # Kept for the versions loaded later, too
+        self._confidence_threshold = value
+        self._current.confidence_threshold = value
+
+
+    def __getattr__(self, name):
+        # Only reached for attributes RegistryPredictor itself doesn't have
+        if name == '_current':
+            raise AttributeError(name)
+        return getattr(self._current, name)
+
+
+    def _load(self, version: str) -> RuntimePredictor:
+        """Load and warm up a version; raises if the artifact is unusable."""
+        predictor = RuntimePredictor(self.registry.path(version), cache_size=self.cache_size)
+        if self._confidence_threshold is not None:
+            predictor.confidence_threshold = self._confidence_threshold
+        # Fail here rather than on a request, and fault in the pages scoring touches
+        predictor.predict_batch(["warm up"])
+        return predictor
+
+
+    def refresh(self) -> bool:
+        """
+        Load and swap in the active version if it changed.
+
+        Called by the watcher thread; safe to call directly. An unreadable
+        active pointer or a version that fails to load is reported in
+        last_error, and the current model keeps serving.
+
+        Returns:
+            True if a different model is now serving
+        """
+
+        with self._swap_lock:
+            # A pointer that can't be read right now (e.g. a network share
+            # dropping out) must not stop the watcher; the next poll retries
+            try:
+                version = self.registry.active_version()
+            except Exception as e:
+                self._record_error("Could not read the active model version", e)
+                return False
+            if version is None or version == self.version:
+                self.last_error = None
+                return False
+
+            start = time.perf_counter()
+            try:
+                predictor = self._load(version)
+            except Exception as e:  # a bad artifact must not take down the model that is serving
+                self._record_error(f"Could not load model version {version}", e)
+                return False
+
+            previous = self.version
+            # One reference assignment: calls already running keep the old predictor
+            self._current = predictor
+            self.version = version
+            self.swaps += 1
+            self.last_error = None
+
+        print(f"🔄 Model {previous} → {version} (loaded in {(time.perf_counter() - start) * 1000:.0f} ms)")
+        return True
+
+
+    def _record_error(self, context: str, error: Exception) -> None:
+        """Keep the error in last_error, printing it only when it changes between polls."""
+        if self.last_error != str(error):
+            print(f"⚠️  {context}: {error}")
+        self.last_error = str(error)
+
+
+    def start(self) -> None:
+        """Start the background watcher (no-op if it is running)."""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop.clear()
+        self._watcher = threading.Thread(target=self._watch, name="model-registry-watcher", daemon=True)
+        self._watcher.start()
+
+
+    def stop(self) -> None:
+        """Stop the background watcher."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.refresh()
+
+
+    def status(self) -> Dict:
+        """Serving version, swap count, watcher state and the current prediction cache stats."""
+        try:
+            active = self.registry.active_version()
+        except Exception:
+            active = None  # Unreadable right now; the watcher reports why in last_error
+        return {
+            'version': self.version,
+            'active_version': active,
+            'swaps': self.swaps,
+            'watching': self._watcher is not None and self._watcher.is_alive(),
+            'last_error': self.last_error,
+            'cache': self._current.cache_stats(),
+        }
+
+
+    def __enter__(self) -> 'RegistryPredictor':
+        return self
+
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
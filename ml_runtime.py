@@ -0,0 +1,796 @@
+"""
+Runtime Inference Module
+========================
+
+This module handles serving-time inference without scikit-learn:
+1. Saving a trained InterestClassifier as one versioned artifact file
+2. Loading that artifact through mmap (no unpickling, shared pages)
+3. Reproducing TfidfVectorizer.transform with NumPy/SciPy
+4. Reproducing LogisticRegression.predict_proba (softmax over coef_)
+5. A RuntimePredictor with the same API as InterestPredictor
+6. Optional sparse int8 coefficients (QuantizedCoefficients)
+
+Why?
+- At serving time only the vocabulary, IDF vector, coefficients and
+  intercepts are needed
+- Importing sklearn, pandas, matplotlib and seaborn and unpickling full
+  estimator objects makes every worker slow to start and heavy in memory
+- Arrays mapped read-only from the same file share physical pages across
+  worker processes, and unlike pickle, loading runs no code from the file
+
+Artifact layout ({filepath}.model):
+- 16-byte preamble: magic, format version, header length
+- UTF-8 JSON header: vectorizer settings, label names, model version
+  (content hash), array table
+- Raw little-endian arrays, each aligned to 64 bytes:
+  terms (sorted fixed-width UTF-8), term_ids, idf, coef, intercept, classes
+  (hashing models store no terms/term_ids, only the bucket count;
+  quantized models store coef_data/coef_indices/coef_indptr/coef_scales
+  instead of coef)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import tempfile
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.special import expit
+
+from ml_inference import DEFAULT_CACHE_SIZE, InterestPredictor
+from ml_windows import apply_tfidf, lookup_ids
+
+
+ARTIFACT_SUFFIX = ".model"
+ARTIFACT_MAGIC = b"ITMODEL\0"
+ARTIFACT_VERSION = 1
+ARTIFACT_ALIGNMENT = 64
+PREAMBLE = struct.Struct("<8sII")  # magic, version, header length
+QUANTIZED_GATHER_LIMIT = 32768  # Gathered int8 weights above which QuantizedCoefficients.dot uses a sparse matmul
+
+
+def artifact_path(filepath: str) -> str:
+    """Artifact file for a model path prefix."""
+    return f"{filepath}{ARTIFACT_SUFFIX}"
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ARTIFACT_ALIGNMENT) * ARTIFACT_ALIGNMENT
+
+
+class VocabularyTable:
+    """
+    Read-only term -> feature id mapping over a sorted byte table.
+
+    Lookups binary-search the mapped array, so no per-process dict of
+    every term is built. Supports the dict methods the vectorizers use.
+    """
+
+    def __init__(self, terms: np.ndarray, ids: np.ndarray):
+        """
+        Args:
+            terms: Sorted fixed-width UTF-8 terms (numpy 'S' dtype)
+            ids: Feature index of each term
+        """
+        self.terms = terms
+        self.ids = ids
+
+
+    @staticmethod
+    def build(vocabulary) -> Tuple[np.ndarray, np.ndarray]:
+        """Sorted term table and id array for a term -> id mapping."""
+        items = [(term.encode("utf-8"), idx) for term, idx in vocabulary.items()]
+        width = max((len(term) for term, _ in items), default=1)
+        terms = np.array([term for term, _ in items], dtype=f"S{width}")
+        ids = np.array([idx for _, idx in items], dtype=np.int32)
+        order = np.argsort(terms, kind='stable')
+        return terms[order], ids[order]
+
+
+    def lookup(self, grams: List[str]) -> np.ndarray:
+        """
+        Feature ids for many terms at once.
+
+        Args:
+            grams: Terms to look up
+
+        Returns:
+            int64 array of feature ids, -1 where a term is not in the vocabulary
+        """
+        result = np.full(len(grams), -1, dtype=np.int64)
+        if not grams or not len(self.terms):
+            return result
+
+        encoded = [g.encode("utf-8") for g in grams]
+        # Conversion to the table's width truncates, so longer keys can't match
+        fits = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)) <= self.terms.itemsize
+        keys = np.array(encoded, dtype=self.terms.dtype)
+
+        pos = np.minimum(np.searchsorted(self.terms, keys), len(self.terms) - 1)
+        found = fits & (self.terms[pos] == keys)
+        result[found] = self.ids[pos[found]]
+        return result
+
+
+    def get(self, term: str, default=None):
+        idx = self.lookup([term])[0]
+        return default if idx < 0 else int(idx)
+
+
+    def __getitem__(self, term: str) -> int:
+        idx = self.get(term)
+        if idx is None:
+            raise KeyError(term)
+        return idx
+
+
+    def __contains__(self, term: str) -> bool:
+        return self.get(term) is not None
+
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+
+    def items(self) -> Iterator[Tuple[str, int]]:
+        for term, idx in zip(self.terms, self.ids):
+            yield term.decode("utf-8"), int(idx)
+
+
+def murmurhash3_32(keys: List[bytes], seed: int = 0) -> np.ndarray:
+    """
+    Signed 32-bit MurmurHash3 (x86) of many byte strings at once.
+
+    Matches sklearn.utils.murmurhash3_32, which HashingVectorizer uses.
+    Keys are zero-padded into a uint32 block matrix and mixed one block
+    column at a time, so the cost is a few array ops per 4 bytes of the
+    longest key rather than Python work per byte.
+
+    Args:
+        keys: Byte strings to hash
+        seed: Hash seed
+
+    Returns:
+        int32 array of hashes
+    """
+    c1, c2 = np.uint32(0xcc9e2d51), np.uint32(0x1b873593)
+    lengths = np.fromiter(map(len, keys), dtype=np.int64, count=len(keys))
+
+    # Always leave one spare column: it holds the (zero-padded) tail bytes
+    width = (int(lengths.max(initial=0)) // 4 + 1) * 4
+    blocks = np.frombuffer(np.array(keys, dtype=f"S{width}").tobytes(), dtype="<u4").reshape(len(keys), width // 4)
+    num_blocks = lengths // 4
+
+    def scramble(k):
+        k = k * c1
+        k = (k << np.uint32(15)) | (k >> np.uint32(17))
+        return k * c2
+
+    h = np.full(len(keys), seed, dtype=np.uint32)
+    with np.errstate(over='ignore'):
+        for col in range(width // 4 - 1):
+            mixed = h ^ scramble(blocks[:, col])
+            mixed = (mixed << np.uint32(13)) | (mixed >> np.uint32(19))
+            mixed = mixed * np.uint32(5) + np.uint32(0xe6546b64)
+            h = np.where(col < num_blocks, mixed, h)
+
+        # Tail bytes sit in the block after the last full one; an empty tail is 0, a no-op
+        h ^= scramble(blocks[np.arange(len(keys)), num_blocks])
+        h ^= lengths.astype(np.uint32)
+
+        # Final avalanche
+        h ^= h >> np.uint32(16)
+        h *= np.uint32(0x85ebca6b)
+        h ^= h >> np.uint32(13)
+        h *= np.uint32(0xc2b2ae35)
+        h ^= h >> np.uint32(16)
+
+    return h.view(np.int32)
+
+
+class HashedVocabulary:
+    """
+    Stateless term -> feature id mapping by hashing (HashingVectorizer's scheme).
+
+    Nothing is stored per term, so the mapping is the same in every
+    process without shipping a vocabulary; it can't be enumerated.
+    """
+
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+
+
+    def lookup(self, grams: List[str]) -> np.ndarray:
+        """Feature id of each term (every term has one)."""
+        if not grams:
+            return np.zeros(0, dtype=np.int64)
+        hashes = murmurhash3_32([g.encode("utf-8") for g in grams]).astype(np.int64)
+        return np.abs(hashes) % self.n_features
+
+
+    def get(self, term: str, default=None) -> int:
+        return int(self.lookup([term])[0])
+
+
+    def __len__(self) -> int:
+        return self.n_features
+
+
+class QuantizedCoefficients:
+    """
+    Sparse int8 coefficient matrix with one scale per class.
+
+    Stored feature-major (CSR over features, one column per class), so
+    scoring a document reads only the rows of the features it contains:
+    the cost depends on the document, not on the vocabulary size.
+    Weight w of class c is approximately data * scales[c].
+    """
+
+    def __init__(self, data: np.ndarray, indices: np.ndarray, indptr: np.ndarray, scales: np.ndarray):
+        """
+        Args:
+            data: int8 quantized weights
+            indices: Class of each weight
+            indptr: Row pointer over features (length n_features + 1)
+            scales: float64 scale of each class
+        """
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+        self.scales = scales
+        self.shape = (len(scales), len(indptr) - 1)
+        self._matrix: Optional[sp.csr_matrix] = None  # Feature-major CSR view, see _sparse_dot
+
+
+    @staticmethod
+    def from_dense(coef: np.ndarray, min_weight_ratio: float = 0.02) -> 'QuantizedCoefficients':
+        """
+        Quantize a dense (num_classes x num_features) coefficient matrix.
+
+        Args:
+            coef: Dense coefficients
+            min_weight_ratio: Weights smaller than this fraction of their
+                              class's largest |weight| are dropped
+
+        Returns:
+            QuantizedCoefficients instance
+        """
+        coef = np.atleast_2d(np.asarray(coef, dtype=np.float64))
+        max_abs = np.abs(coef).max(axis=1)
+        scales = np.where(max_abs > 0, max_abs / 127, 1.0)
+
+        quantized = np.rint(coef / scales[:, None])
+        quantized[np.abs(coef) < min_weight_ratio * max_abs[:, None]] = 0
+
+        weights = sp.csr_matrix(quantized.T.astype(np.int8))
+        class_dtype = np.min_scalar_type(max(0, coef.shape[0] - 1))
+        return QuantizedCoefficients(
+            weights.data, weights.indices.astype(class_dtype), weights.indptr.astype(np.int32), scales
+        )
+
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self.indices.nbytes + self.indptr.nbytes + self.scales.nbytes
+
+
+    def toarray(self) -> np.ndarray:
+        """Dequantized dense (num_classes x num_features) coefficients."""
+        weights = sp.csr_matrix((self.data, self.indices, self.indptr), shape=self.shape[::-1])
+        return weights.T.toarray() * self.scales[:, None]
+
+
+    def values_at(self, classes: np.ndarray, features: np.ndarray) -> np.ndarray:
+        """
+        Dequantized weights coef[classes[i], features[i]] (0 where dropped).
+
+        Args:
+            classes: Class index of each lookup
+            features: Feature index of each lookup
+
+        Returns:
+            float64 array of weights
+        """
+        classes = np.asarray(classes)
+        features = np.asarray(features)
+        starts = self.indptr[features].astype(np.int64)
+        lengths = self.indptr[features + 1] - starts
+
+        # Expand each feature's stored weights, then keep the one in the wanted class
+        total = int(lengths.sum())
+        slice_offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        weight = slice_offsets + np.arange(total)
+        lookup = np.repeat(np.arange(len(features)), lengths)
+        match = self.indices[weight] == classes[lookup]
+
+        values = np.zeros(len(features))
+        values[lookup[match]] = self.data[weight[match]] * self.scales[classes[lookup[match]]]
+        return values
+
+
+    def dot(self, X) -> np.ndarray:
+        """
+        Decision scores X @ coef.T, without materializing the weights.
+
+        Short inputs (the single-text serving case) gather the weights of
+        the features present in one flat pass; once that gather exceeds
+        QUANTIZED_GATHER_LIMIT weights, SciPy's compiled row slicing and
+        sparse product are cheaper than NumPy's temporaries.
+
+        Args:
+            X: Sparse (num_documents x num_features) matrix
+
+        Returns:
+            Dense (num_documents x num_classes) scores
+        """
+        if not sp.isspmatrix_csr(X):
+            X = sp.csr_matrix(X)
+        num_docs, num_classes = X.shape[0], self.shape[0]
+
+        starts = self.indptr[X.indices].astype(np.int64)
+        lengths = self.indptr[X.indices + 1] - starts
+        ends = np.cumsum(lengths)
+        total = int(ends[-1]) if len(ends) else 0
+        if total > QUANTIZED_GATHER_LIMIT:
+            return self._sparse_dot(X)
+
+        # Every stored weight of every feature present: one flat gather, as in count_windows
+        weight = np.repeat(starts - (ends - lengths), lengths)
+        weight += np.arange(total)
+        cells = self.indices[weight].astype(np.intp)
+        if num_docs > 1:
+            doc_offsets = np.repeat(np.arange(num_docs) * num_classes, np.diff(X.indptr))
+            cells += np.repeat(doc_offsets, lengths)
+        products = np.repeat(X.data, lengths)
+        products *= self.data[weight]
+        scores = np.bincount(cells, weights=products, minlength=num_docs * num_classes)
+        return scores.reshape(num_docs, num_classes) * self.scales
+
+
+    def _sparse_dot(self, X: sp.csr_matrix) -> np.ndarray:
+        """dot() for large gathers: (X entries) @ (their weight rows) as one SciPy product."""
+        if self._matrix is None:
+            # Built on first use only; SciPy needs int32 class indices, a copy of the uint8 ones
+            self._matrix = sp.csr_matrix((self.data, self.indices, self.indptr), shape=self.shape[::-1])
+        rows = self._matrix[X.indices]
+        entries = sp.csr_matrix((X.data, np.arange(len(X.indices)), X.indptr), shape=(X.shape[0], len(X.indices)))
+        return (entries @ rows).toarray() * self.scales
+
+
+def multi_class_mode(model) -> str:
+    """How a fitted linear classifier turns decision scores into probabilities."""
+    if isinstance(model, RuntimeLinearModel):
+        return model.multi_class
+    if model.coef_.shape[0] == 1:
+        return 'binary'
+    # SGDClassifier has no solver and is always one-vs-rest
+    solver = getattr(model, 'solver', None)
+    multi_class = getattr(model, 'multi_class', 'auto')
+    if solver is None or multi_class == 'ovr' or (multi_class in ('auto', 'deprecated') and solver == 'liblinear'):
+        return 'ovr'
+    return 'multinomial'
+
+
+def _artifact_contents(classifier) -> Tuple[Dict[str, np.ndarray], Dict]:
+    """The arrays and header config save_artifact writes for a classifier."""
+
+    vectorizer = classifier.vectorizer
+    model = classifier.model
+    label_info = classifier.label_info
+
+    # Hashed features need no term table, only the number of buckets
+    arrays = {}
+    hash_features = None
+    if isinstance(vectorizer.vocabulary_, HashedVocabulary):
+        hash_features = vectorizer.vocabulary_.n_features
+    else:
+        arrays['terms'], arrays['term_ids'] = VocabularyTable.build(vectorizer.vocabulary_)
+
+    arrays['idf'] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    weights = getattr(model, 'weights', None)
+    if isinstance(weights, QuantizedCoefficients):
+        arrays.update({
+            'coef_data': weights.data,
+            'coef_indices': weights.indices,
+            'coef_indptr': weights.indptr,
+            'coef_scales': weights.scales,
+        })
+    else:
+        arrays['coef'] = np.asarray(model.coef_, dtype=np.float64)
+    arrays['intercept'] = np.asarray(model.intercept_, dtype=np.float64)
+    arrays['classes'] = np.asarray(model.classes_, dtype=np.int64)
+
+    config = {
+        'hash_features': hash_features,
+        'lowercase': vectorizer.lowercase,
+        'token_pattern': vectorizer.token_pattern,
+        'ngram_range': list(vectorizer.ngram_range),
+        'stop_words': sorted(vectorizer.get_stop_words() or ()),
+        'norm': vectorizer.norm,
+        'use_idf': vectorizer.use_idf,
+        'sublinear_tf': vectorizer.sublinear_tf,
+        'binary': vectorizer.binary,
+        'dtype': np.dtype(vectorizer.dtype).name,
+        'multi_class': multi_class_mode(model),
+        'labels': [label_info['idx_to_label'][i] for i in range(len(label_info['idx_to_label']))],
+        'label_distribution': {k: int(v) for k, v in label_info.get('label_distribution', {}).items()},
+    }
+    return arrays, config
+
+
+def _content_version(arrays: Dict[str, np.ndarray], config: Dict) -> str:
+    """Short SHA-256 of a model's arrays and settings; equal models get equal versions."""
+    config = {key: value for key, value in config.items() if key != 'model_version'}
+    digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8"))
+    for name in sorted(arrays):
+        digest.update(name.encode("utf-8"))
+        digest.update(np.ascontiguousarray(arrays[name]))
+    return digest.hexdigest()[:16]
+
+
+def model_version(classifier) -> str:
+    """
+    Version of a trained classifier: the model_version its artifact would carry.
+
+    Args:
+        classifier: Trained InterestClassifier (sklearn- or artifact-backed)
+
+    Returns:
+        16-character hex content hash
+    """
+    return _content_version(*_artifact_contents(classifier))
+
+
+def save_artifact(classifier, filepath: str) -> str:
+    """
+    Write a trained classifier to a single memory-mappable artifact.
+
+    The file is written to a temporary name and renamed into place, so
+    readers never see a partial artifact.
+
+    Args:
+        classifier: Trained InterestClassifier (sklearn- or artifact-backed)
+        filepath: Path prefix (artifact is written to {filepath}.model)
+
+    Returns:
+        Path of the written artifact
+    """
+
+    if not classifier.is_fitted:
+        raise ValueError("Cannot save untrained model.")
+
+    arrays, config = _artifact_contents(classifier)
+    config['model_version'] = _content_version(arrays, config)
+
+    # Array offsets are relative to the (aligned) end of the header
+    table = {}
+    offset = 0
+    for name, array in arrays.items():
+        table[name] = {'offset': offset, 'dtype': array.dtype.str, 'shape': list(array.shape)}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({'config': config, 'arrays': table}).encode("utf-8")
+
+    path = Path(artifact_path(filepath))
+    data_start = _align(PREAMBLE.size + len(header))
+
+    # Write to a temp file first so readers never see a half-written artifact
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+        tmp.write(PREAMBLE.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, len(header)))
+        tmp.write(header)
+        for name, array in arrays.items():
+            tmp.seek(data_start + table[name]['offset'])
+            tmp.write(np.ascontiguousarray(array).tobytes())
+    # NamedTemporaryFile is created 0600; artifacts are meant to be read by other workers
+    os.chmod(tmp.name, 0o644)
+    os.replace(tmp.name, path)
+
+    return str(path)
+
+
+def load_artifact(filepath: str) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """
+    Map an artifact read-only and return its config and arrays.
+
+    The arrays are views into the mapping, so processes loading the same
+    file share its pages; nothing is copied until it is written to.
+
+    Args:
+        filepath: Path prefix used when saving
+
+    Returns:
+        (config dict, {name: read-only array})
+    """
+
+    with open(artifact_path(filepath), 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, header_len = PREAMBLE.unpack_from(buffer, 0)
+    if magic != ARTIFACT_MAGIC:
+        raise ValueError(f"{artifact_path(filepath)} is not a model artifact.")
+    if version != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported model artifact version {version} (expected {ARTIFACT_VERSION}).")
+
+    header = json.loads(bytes(buffer[PREAMBLE.size:PREAMBLE.size + header_len]).decode("utf-8"))
+    data_start = _align(PREAMBLE.size + header_len)
+
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        shape = tuple(spec['shape'])
+        count = int(np.prod(shape, dtype=np.int64))
+        offset = data_start + spec['offset']
+        if offset + count * dtype.itemsize > len(buffer):
+            raise ValueError(f"Model artifact is truncated (array '{name}').")
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+    return header['config'], arrays
+
+
+class RuntimeVectorizer:
+    """
+    NumPy/SciPy reimplementation of a fitted TfidfVectorizer's transform().
+
+    Exposes the attributes InterestPredictor and SlidingWindowVectorizer read
+    (vocabulary_, idf_, ngram_range, token_pattern, ...).
+    """
+
+    analyzer = 'word'
+    tokenizer = None
+    preprocessor = None
+    strip_accents = None
+
+    def __init__(self, vocabulary: Union[VocabularyTable, HashedVocabulary], idf: np.ndarray, config: Dict):
+        self.vocabulary_ = vocabulary
+        self.idf_ = idf
+        self.stop_words_ = frozenset(config['stop_words'])
+        self.lowercase = config['lowercase']
+        self.token_pattern = config['token_pattern']
+        self.ngram_range = tuple(config['ngram_range'])
+        self.norm = config['norm']
+        self.use_idf = config['use_idf']
+        self.sublinear_tf = config['sublinear_tf']
+        self.binary = config['binary']
+        self.dtype = np.dtype(config['dtype'])
+        self._token_re = re.compile(self.token_pattern)
+
+
+    def get_stop_words(self) -> frozenset:
+        return self.stop_words_
+
+
+    def get_feature_names_out(self) -> np.ndarray:
+        if isinstance(self.vocabulary_, HashedVocabulary):
+            raise ValueError("Hashed features have no stored names.")
+        names = np.empty(len(self.vocabulary_), dtype=object)
+        names[self.vocabulary_.ids] = np.char.decode(self.vocabulary_.terms, "utf-8")
+        return names
+
+
+    def _grams(self, text: str) -> List[str]:
+        """Every n-gram in text, as TfidfVectorizer would count them."""
+        if self.lowercase:
+            text = text.lower()
+        tokens = [tok for tok in self._token_re.findall(text) if tok not in self.stop_words_]
+
+        min_n, max_n = self.ngram_range
+        grams = []
+        for n in range(min_n, max_n + 1):
+            grams.extend(tokens if n == 1 else map(" ".join, zip(*(tokens[i:] for i in range(n)))))
+        return grams
+
+
+    def transform(self, raw_documents) -> sp.csr_matrix:
+        """
+        Vectorize documents into TF-IDF rows.
+
+        The n-grams of all documents are looked up in one batch, so the
+        vocabulary search runs once per call rather than once per document.
+
+        Args:
+            raw_documents: Iterable of strings
+
+        Returns:
+            Sparse (num_documents x num_features) matrix
+        """
+        doc_grams = [self._grams(text) for text in raw_documents]
+        lengths = np.fromiter(map(len, doc_grams), dtype=np.int64, count=len(doc_grams))
+
+        ids = lookup_ids(self.vocabulary_, list(chain.from_iterable(doc_grams)))
+        rows = np.repeat(np.arange(len(doc_grams)), lengths)
+        found = ids >= 0
+
+        # Duplicate (row, id) pairs are summed into counts
+        counts = sp.csr_matrix(
+            (np.ones(int(found.sum()), dtype=self.dtype), (rows[found], ids[found])),
+            shape=(len(doc_grams), len(self.vocabulary_)),
+        )
+        counts.sum_duplicates()
+        return apply_tfidf(counts, self)
+
+
+class RuntimeLinearModel:
+    """NumPy reimplementation of a fitted LogisticRegression's predict/predict_proba."""
+
+    def __init__(self, coef: Union[np.ndarray, QuantizedCoefficients], intercept: np.ndarray,
+                 classes: np.ndarray, multi_class: str):
+        """
+        Args:
+            coef: Dense (num_classes x num_features) coefficients, or QuantizedCoefficients
+            intercept: Intercept of each class
+            classes: Class ids
+            multi_class: 'binary', 'ovr' or 'multinomial'
+        """
+        self.weights = coef
+        self.intercept_ = intercept
+        self.classes_ = classes
+        self.multi_class = multi_class
+
+
+    @property
+    def coef_(self) -> np.ndarray:
+        """Dense coefficients (dequantized on access for quantized models)."""
+        if isinstance(self.weights, QuantizedCoefficients):
+            return self.weights.toarray()
+        return self.weights
+
+
+    def coef_at(self, classes: np.ndarray, features: np.ndarray) -> np.ndarray:
+        """coef_[classes[i], features[i]] without building the dense matrix."""
+        if isinstance(self.weights, QuantizedCoefficients):
+            return self.weights.values_at(classes, features)
+        return self.weights[classes, features]
+
+
+    def _dense_scores(self, X) -> np.ndarray:
+        """X @ coef_.T, touching only the coefficient columns of features present in X."""
+        # Multiplying by coef_.T directly makes SciPy copy the whole transposed
+        # matrix on every call - far more work than a few dozen features need
+        X = sp.csr_matrix(X)
+        features, columns = np.unique(X.indices, return_inverse=True)
+        compact = sp.csr_matrix((X.data, columns.ravel(), X.indptr), shape=(X.shape[0], len(features)))
+        return np.asarray(compact @ self.weights.T[features])
+
+
+    def decision_function(self, X) -> np.ndarray:
+        if isinstance(self.weights, QuantizedCoefficients):
+            scores = self.weights.dot(X) + self.intercept_
+        else:
+            scores = self._dense_scores(X) + self.intercept_
+        return scores.ravel() if self.multi_class == 'binary' else scores
+
+
+    def predict_proba(self, X) -> np.ndarray:
+        scores = self.decision_function(X)
+        if self.multi_class == 'binary':
+            positive = expit(scores)
+            return np.column_stack([1 - positive, positive])
+        if self.multi_class == 'ovr':
+            probs = expit(scores)
+            return probs / probs.sum(axis=1, keepdims=True)
+
+        # Multinomial: softmax, shifted by the row max for numerical stability
+        scores = scores - scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        return scores / scores.sum(axis=1, keepdims=True)
+
+
+    def predict(self, X) -> np.ndarray:
+        scores = self.decision_function(X)
+        if self.multi_class == 'binary':
+            return self.classes_[(scores > 0).astype(int)]
+        return self.classes_[scores.argmax(axis=1)]
+
+
+def quantize_model(model, min_weight_ratio: float = 0.02) -> RuntimeLinearModel:
+    """
+    Post-training quantization of a fitted linear classifier.
+
+    Args:
+        model: Fitted LogisticRegression / SGDClassifier (or RuntimeLinearModel)
+        min_weight_ratio: See QuantizedCoefficients.from_dense
+
+    Returns:
+        RuntimeLinearModel scoring with sparse int8 weights
+    """
+    return RuntimeLinearModel(
+        QuantizedCoefficients.from_dense(model.coef_, min_weight_ratio),
+        np.asarray(model.intercept_, dtype=np.float64),
+        np.asarray(model.classes_, dtype=np.int64),
+        multi_class_mode(model),
+    )
+
+
+class RuntimeClassifier:
+    """
+    Stand-in for a trained InterestClassifier, loaded from an artifact.
+
+    Attributes:
+        vectorizer: RuntimeVectorizer instance
+        model: RuntimeLinearModel instance
+        label_info: Dictionary with label encoding/decoding
+        model_version: Content hash of the artifact (see model_version())
+    """
+
+    def __init__(self, vectorizer: RuntimeVectorizer, model: RuntimeLinearModel, label_info: Dict,
+                 model_version: Optional[str] = None):
+        self.vectorizer = vectorizer
+        self.model = model
+        self.label_info = label_info
+        self.model_version = model_version
+        self.is_fitted = True
+
+
+    @staticmethod
+    def load(filepath: str) -> 'RuntimeClassifier':
+        """
+        Load an artifact written by save_artifact.
+
+        Args:
+            filepath: Path prefix used when saving
+
+        Returns:
+            RuntimeClassifier instance
+        """
+
+        config, arrays = load_artifact(filepath)
+
+        if config.get('hash_features'):
+            vocabulary = HashedVocabulary(config['hash_features'])
+        else:
+            vocabulary = VocabularyTable(arrays['terms'], arrays['term_ids'])
+
+        vectorizer = RuntimeVectorizer(vocabulary, arrays['idf'], config)
+        if 'coef_scales' in arrays:
+            coef = QuantizedCoefficients(
+                arrays['coef_data'], arrays['coef_indices'], arrays['coef_indptr'], arrays['coef_scales']
+            )
+        else:
+            coef = arrays['coef']
+        model = RuntimeLinearModel(coef, arrays['intercept'], arrays['classes'], config['multi_class'])
+
+        labels = config['labels']
+        label_info = {
+            'unique_labels': labels,
+            'label_to_idx': {label: idx for idx, label in enumerate(labels)},
+            'idx_to_label': dict(enumerate(labels)),
+            'label_distribution': config['label_distribution'],
+            'num_classes': len(labels),
+        }
+        return RuntimeClassifier(vectorizer, model, label_info, config['model_version'])
+
+
+class RuntimePredictor(InterestPredictor):
+    """
+    InterestPredictor served from a model artifact, using NumPy/SciPy only.
+    """
+
+    def __init__(self, filepath: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            filepath: Path prefix used when saving the model
+            cache_size: Prediction cache entries (0 disables the cache)
+        """
+        super().__init__(RuntimeClassifier.load(filepath), cache_size)
+        self.filepath = filepath
+
+
+    def reload(self, filepath: Optional[str] = None) -> None:
+        """
+        Load the artifact again (e.g. after it was retrained and re-saved).
+
+        Cached predictions of the previous model are dropped.
+
+        Args:
+            filepath: New path prefix (default: the one loaded from)
+        """
+        if filepath is not None:
+            self.filepath = filepath
+        self.classifier = RuntimeClassifier.load(self.filepath)
@@ -0,0 +1,237 @@
+"""
+Hyperparameter Search Module
+============================
+
+This module handles:
+1. Expanding a grid or random search space into candidates
+2. Grouping candidates that share a vectorizer config, so each group
+   vectorizes the data once (and reuses the on-disk feature cache)
+3. Running the groups in a process pool, warm-starting LogisticRegression
+   from the previous solution as C increases
+4. Reporting accuracy vs. single-text inference latency and its Pareto front
+
+Why?
+- Vectorizing dominates a fit and depends only on the vectorizer params
+- Neighbouring C values have nearby optima, so warm starts cut lbfgs
+  iterations
+- The most accurate model isn't always worth its latency; the Pareto front
+  shows which candidates are worth considering at all
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.model_selection import ParameterGrid, ParameterSampler
+
+from ml_classifier import InterestClassifier
+from ml_features import FEATURE_CACHE_DIR, vectorize_cached
+
+
+VECTORIZER_KEYS = frozenset(TfidfVectorizer().get_params())
+MODEL_KEYS = frozenset(LogisticRegression().get_params())
+
+DEFAULT_SEARCH_SPACE = {
+    'C': [0.1, 0.3, 1.0, 3.0, 10.0],
+    'ngram_range': [(1, 1), (1, 2)],
+    'min_df': [1, 2, 5],
+    'max_features': [10000, 50000],
+}
+
+# Filled in each worker by _init_worker, so the dataset is sent once per process
+_WORKER_DATA: Dict = {}
+
+
+def _init_worker(data: Dict) -> None:
+    _WORKER_DATA.clear()
+    _WORKER_DATA.update(data)
+
+
+def split_params(params: Dict) -> Tuple[Dict, Dict]:
+    """
+    Split one candidate into vectorizer and LogisticRegression params.
+
+    Args:
+        params: Mixed parameter dict (e.g. {'C': 1.0, 'min_df': 2})
+
+    Returns:
+        (vectorizer_params, model_params)
+    """
+    unknown = set(params) - VECTORIZER_KEYS - MODEL_KEYS
+    if unknown:
+        raise ValueError(f"Unknown hyperparameters: {sorted(unknown)}")
+
+    vectorizer_params = {k: v for k, v in params.items() if k in VECTORIZER_KEYS}
+    model_params = {k: v for k, v in params.items() if k in MODEL_KEYS}
+    return vectorizer_params, model_params
+
+
+def expand_search_space(space: Dict, n_iter: Optional[int] = None,
+                        random_state: int = 42) -> List[Dict]:
+    """
+    Candidates from a search space.
+
+    Args:
+        space: Parameter name -> list of values (or scipy.stats distribution
+               when sampling)
+        n_iter: Sample this many candidates at random; None for the full grid
+        random_state: Seed for random sampling
+
+    Returns:
+        List of parameter dicts
+    """
+    if n_iter is None:
+        return list(ParameterGrid(space))
+    return list(ParameterSampler(space, n_iter=n_iter, random_state=random_state))
+
+
+def _group_candidates(candidates: List[Dict]) -> List[Tuple[Dict, List[Dict]]]:
+    """Group candidates by everything but C; each group's C values ascend."""
+    groups: Dict[str, Tuple[Dict, Dict, List[Dict]]] = {}
+    for params in candidates:
+        vectorizer_params, model_params = split_params(params)
+        fixed = {k: v for k, v in model_params.items() if k != 'C'}
+        key = repr((sorted(vectorizer_params.items()), sorted(fixed.items())))
+        groups.setdefault(key, (vectorizer_params, fixed, []))[2].append(model_params)
+
+    return [
+        (vectorizer_params, sorted(model_list, key=lambda p: p.get('C', 1.0)))
+        for vectorizer_params, _, model_list in groups.values()
+    ]
+
+
+def _run_group(vectorizer_params: Dict, model_param_list: List[Dict]) -> List[Dict]:
+    """Vectorize once, then fit each C in ascending order from the previous solution."""
+
+    data = _WORKER_DATA
+    classifier = InterestClassifier(
+        data['label_info'], vectorizer_params=vectorizer_params, model_params={'warm_start': True}
+    )
+
+    start = time.perf_counter()
+    X_train, X_val = vectorize_cached(
+        classifier.vectorizer, data['train_texts'], data['val_texts'], cache_dir=data['cache_dir']
+    )
+    vectorize_seconds = time.perf_counter() - start
+
+    rows = []
+    for model_params in model_param_list:
+        classifier.model.set_params(**model_params)
+
+        start = time.perf_counter()
+        classifier.model.fit(X_train, data['y_train'])
+        fit_seconds = time.perf_counter() - start
+
+        y_pred = classifier.model.predict(X_val)
+
+        # Single-text latency: what the app pays per prediction
+        start = time.perf_counter()
+        for text in data['latency_texts']:
+            classifier.model.predict_proba(classifier.vectorizer.transform([text]))
+        latency_ms = (time.perf_counter() - start) * 1000 / max(1, len(data['latency_texts']))
+
+        rows.append({
+            **vectorizer_params,
+            **model_params,
+            'accuracy': accuracy_score(data['y_val'], y_pred),
+            'f1': f1_score(data['y_val'], y_pred, average='weighted', zero_division=0),
+            'latency_ms': latency_ms,
+            'features': X_train.shape[1],
+            'fit_s': fit_seconds,
+            'lbfgs_iters': int(np.max(classifier.model.n_iter_)),
+            'vectorize_s': vectorize_seconds,
+        })
+
+    return rows
+
+
+def pareto_front(results: pd.DataFrame, accuracy_col: str = 'accuracy',
+                 latency_col: str = 'latency_ms') -> np.ndarray:
+    """
+    Mark candidates no other candidate beats on both accuracy and latency.
+
+    Args:
+        results: One row per candidate
+        accuracy_col: Column to maximize
+        latency_col: Column to minimize
+
+    Returns:
+        Boolean array, True for rows on the front
+    """
+    order = results.sort_values([latency_col, accuracy_col], ascending=[True, False]).index
+    best_accuracy = -np.inf
+    front = set()
+    for idx in order:
+        # Walking from fastest to slowest, a row is on the front only if it's more accurate than everything faster
+        if results.at[idx, accuracy_col] > best_accuracy:
+            best_accuracy = results.at[idx, accuracy_col]
+            front.add(idx)
+    return results.index.isin(front)
+
+
+def search_hyperparameters(train_df: pd.DataFrame, val_df: pd.DataFrame, label_info: Dict,
+                           space: Dict = DEFAULT_SEARCH_SPACE, n_iter: Optional[int] = None,
+                           max_workers: Optional[int] = None, latency_samples: int = 100,
+                           cache_dir: Optional[str] = FEATURE_CACHE_DIR,
+                           random_state: int = 42) -> pd.DataFrame:
+    """
+    Grid or random search over vectorizer and classifier hyperparameters.
+
+    Latency is timed inside the workers, so keep max_workers at or below
+    the number of physical cores for comparable numbers.
+
+    Args:
+        train_df: Training DataFrame with 'text' and 'label' columns
+        val_df: Validation DataFrame with 'text' and 'label' columns
+        label_info: Label metadata dictionary
+        space: Parameter name -> values (see expand_search_space)
+        n_iter: Random-search budget; None searches the full grid
+        max_workers: Worker processes (default: one per CPU, at most one per group)
+        latency_samples: Validation texts timed one at a time per candidate
+        cache_dir: Feature cache directory (None to disable)
+        random_state: Seed for random sampling
+
+    Returns:
+        DataFrame of candidates sorted by accuracy, with a 'pareto' column
+    """
+
+    candidates = expand_search_space(space, n_iter, random_state)
+    groups = _group_candidates(candidates)
+
+    data = {
+        'label_info': label_info,
+        'train_texts': train_df['text'],
+        'val_texts': val_df['text'],
+        'y_train': train_df['label'].map(label_info['label_to_idx']),
+        'y_val': val_df['label'].map(label_info['label_to_idx']),
+        'latency_texts': list(val_df['text'][:latency_samples]),
+        'cache_dir': cache_dir,
+    }
+
+    workers = max(1, min(max_workers or os.cpu_count() or 1, len(groups)))
+    print(f"🔎 Searching {len(candidates)} candidates in {len(groups)} vectorizer groups ({workers} workers)...")
+
+    start = time.perf_counter()
+    if workers == 1:
+        _init_worker(data)
+        group_rows = [_run_group(vectorizer_params, model_list) for vectorizer_params, model_list in groups]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data,)) as pool:
+            group_rows = list(pool.map(_run_group, *zip(*groups)))
+    print(f"✓ Search complete in {time.perf_counter() - start:.1f}s")
+
+    results = pd.DataFrame([row for rows in group_rows for row in rows])
+    results['pareto'] = pareto_front(results)
+    results = results.sort_values('accuracy', ascending=False).reset_index(drop=True)
+
+    print("\n📈 Accuracy vs. latency Pareto front:")
+    front = results[results['pareto']].sort_values('latency_ms')
+    print(front.drop(columns='pareto').to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+
+    return results
@@ -0,0 +1,260 @@
+"""
+Sliding-Window Vectorization Module
+===================================
+
+This module handles:
+1. Mapping a transcript's tokens and n-grams to vocabulary ids in one pass
+2. Computing term counts for any window as a difference of two prefixes
+3. Applying the fitted IDF weights and normalization
+
+Why?
+- Overlapping chunks re-tokenize every word once per window they fall in
+  (about 4x with the default 75% stride)
+- Here each word is tokenized exactly once, however many windows cover it;
+  window size and stride only change which prefixes are subtracted
+
+The output matches TfidfVectorizer.transform() on the equivalent chunk
+texts, so it can be fed straight into the trained classifier.
+"""
+
+import re
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import scipy.sparse as sp
+
+from document import Document, as_document
+
+
+def normalize_rows(X: sp.csr_matrix, norm: str) -> sp.csr_matrix:
+    """Scale each row to unit 'l1' or 'l2' norm in place (empty rows stay zero)."""
+    row_of_entry = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+    if norm == 'l2':
+        norms = np.sqrt(np.bincount(row_of_entry, weights=X.data * X.data, minlength=X.shape[0]))
+    elif norm == 'l1':
+        norms = np.bincount(row_of_entry, weights=np.abs(X.data), minlength=X.shape[0])
+    else:
+        raise ValueError(f"Unsupported norm: {norm!r}")
+    norms[norms == 0] = 1.0
+    X.data /= norms[row_of_entry]
+    return X
+
+
+def apply_tfidf(counts: sp.csr_matrix, vectorizer) -> sp.csr_matrix:
+    """Apply a fitted vectorizer's TF-IDF weighting and normalization to raw counts."""
+    # Scale the stored entries directly; a diagonal IDF matrix costs O(n_features) per call
+    X = sp.csr_matrix(counts, dtype=vectorizer.dtype, copy=True)
+    if vectorizer.binary:
+        X.data[:] = 1
+    if vectorizer.sublinear_tf:
+        np.log(X.data, X.data)
+        X.data += 1
+    if vectorizer.use_idf:
+        X.data *= vectorizer.idf_[X.indices]
+    if vectorizer.norm:
+        X = normalize_rows(X, vectorizer.norm)
+    return X
+
+
+def lookup_ids(vocabulary, grams: List[str]) -> np.ndarray:
+    """Vocabulary id of each term (-1 when absent), for a dict or a table with lookup()."""
+    lookup = getattr(vocabulary, 'lookup', None)
+    if lookup is not None:
+        return lookup(grams)
+    return np.fromiter((vocabulary.get(g, -1) for g in grams), dtype=np.int64, count=len(grams))
+
+
+class TokenIndex:
+    """
+    Every vocabulary term occurrence in a document, in reading order.
+
+    Attributes:
+        ids: Vocabulary id of each occurrence
+        starts: Word position of the occurrence's first token
+        ends: Word position of its last token (non-decreasing)
+
+    `ends` is sorted, so the occurrences ending before word b form the
+    prefix ids[:searchsorted(ends, b)] - the cumulative count array for
+    every term at once. A window [a, b) is the difference of two such
+    prefixes, minus the n-grams that straddle its left edge.
+    """
+
+    def __init__(self, ids: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        self.ids = ids
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+class SlidingWindowVectorizer:
+    """
+    Vectorize many windows of one document with a single tokenization pass.
+
+    Wraps a fitted TfidfVectorizer that uses the built-in word analyzer.
+    """
+
+    def __init__(self, vectorizer):
+        """
+        Args:
+            vectorizer: Fitted TfidfVectorizer (see supports())
+        """
+        if not self.supports(vectorizer):
+            raise ValueError("SlidingWindowVectorizer needs a fitted TfidfVectorizer with the default word analyzer.")
+
+        self.vectorizer = vectorizer
+        self.vocabulary = vectorizer.vocabulary_
+        self.stop_words = frozenset(vectorizer.get_stop_words() or ())
+        self.min_n, self.max_n = vectorizer.ngram_range
+        self.token_re = re.compile(vectorizer.token_pattern)
+        self.n_features = len(self.vocabulary)
+
+
+    @staticmethod
+    def supports(vectorizer) -> bool:
+        """Whether the vectorizer's analysis can be reproduced token by token."""
+        return (
+            hasattr(vectorizer, 'vocabulary_')
+            and hasattr(vectorizer, 'idf_')
+            and vectorizer.analyzer == 'word'
+            and vectorizer.tokenizer is None
+            and vectorizer.preprocessor is None
+            and vectorizer.strip_accents is None
+        )
+
+
+    def index_document(self, text: Union[str, Document]) -> TokenIndex:
+        """
+        Map the document's tokens and n-grams to vocabulary ids once.
+
+        Args:
+            text: Transcript text or an already tokenized Document
+
+        Returns:
+            TokenIndex of every in-vocabulary occurrence
+        """
+
+        doc = as_document(text).vectorizer_view
+
+        # The view is already lowercased, so it equals the vectorizer's
+        # preprocessed text and character offsets line up
+        group = 1 if self.token_re.groups == 1 else 0
+        matches = list(self.token_re.finditer(doc.cleaned))
+        word_starts = np.asarray(doc.offsets, dtype=np.int64)
+        char_starts = np.fromiter((m.start(group) for m in matches), dtype=np.int64, count=len(matches))
+        positions = np.searchsorted(word_starts, char_starts, side='right') - 1
+
+        # Stop words are dropped before n-grams are formed, as in sklearn
+        stop_words = self.stop_words
+        kept = [(m.group(group), pos) for m, pos in zip(matches, positions.tolist()) if m.group(group) not in stop_words]
+        tokens = [tok for tok, _ in kept]
+        token_pos = np.fromiter((pos for _, pos in kept), dtype=np.int64, count=len(kept))
+
+        # Look up every n-gram of each order in one batch per order
+        vocabulary = self.vocabulary
+        ids, starts, ends = [], [], []
+        for n in range(self.min_n, self.max_n + 1):
+            if n > len(tokens):
+                break
+            grams = tokens if n == 1 else list(map(" ".join, zip(*(tokens[i:] for i in range(n)))))
+            gram_ids = lookup_ids(vocabulary, grams)
+            found = np.flatnonzero(gram_ids >= 0)
+            ids.append(gram_ids[found])
+            starts.append(token_pos[found])
+            ends.append(token_pos[found + n - 1])
+
+        if not ids:
+            empty = np.zeros(0, dtype=np.int64)
+            return TokenIndex(empty, empty, empty)
+
+        # Order occurrences by where they end so prefixes are contiguous
+        ids, starts, ends = np.concatenate(ids), np.concatenate(starts), np.concatenate(ends)
+        order = np.argsort(ends, kind='stable')
+        return TokenIndex(ids[order], starts[order], ends[order])
+
+
+    def count_windows(self, index: TokenIndex, bounds: Sequence[Tuple[int, int]]) -> sp.csr_matrix:
+        """
+        Term counts for each word window [start, end) as prefix differences.
+
+        Args:
+            index: TokenIndex from index_document()
+            bounds: List of (start, end) word positions
+
+        Returns:
+            Sparse (num_windows x num_features) count matrix
+        """
+
+        bounds = np.asarray(bounds, dtype=np.int64).reshape(-1, 2)
+        window_starts, window_ends = bounds[:, 0], bounds[:, 1]
+
+        # Occurrences ending inside [a, b) are ids[lo:hi]: prefix(hi) - prefix(lo)
+        lo = np.searchsorted(index.ends, window_starts, side='left')
+        hi = np.searchsorted(index.ends, window_ends, side='left')
+        lengths = np.maximum(hi - lo, 0)
+
+        # Flatten all slices into one gather without a Python loop per window
+        total = int(lengths.sum())
+        rows = np.repeat(np.arange(len(bounds)), lengths)
+        slice_offsets = np.repeat(lo - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        occurrence = slice_offsets + np.arange(total)
+
+        # Drop n-grams that began before the window's left edge
+        keep = index.starts[occurrence] >= window_starts[rows]
+        rows = rows[keep]
+        cols = index.ids[occurrence[keep]]
+
+        counts = sp.csr_matrix(
+            (np.ones(len(rows), dtype=self.vectorizer.dtype), (rows, cols)),
+            shape=(len(bounds), self.n_features),
+        )
+        counts.sum_duplicates()
+        return counts
+
+
+    def apply_tfidf(self, counts: sp.csr_matrix) -> sp.csr_matrix:
+        """Apply the fitted TF-IDF weighting and normalization to raw counts."""
+        return apply_tfidf(counts, self.vectorizer)
+
+
+    def transform(self, text: Union[str, Document], bounds: Sequence[Tuple[int, int]],
+                  index: Optional[TokenIndex] = None) -> sp.csr_matrix:
+        """
+        TF-IDF vectors for word windows of one document.
+
+        Args:
+            text: Transcript text or an already tokenized Document
+            bounds: List of (start, end) word positions
+            index: Optional precomputed TokenIndex for the document
+
+        Returns:
+            Sparse matrix equal to vectorizer.transform() on the window texts
+        """
+
+        if index is None:
+            index = self.index_document(text)
+        return self.apply_tfidf(self.count_windows(index, bounds))
+
+
+def window_bounds(num_words: int, window_size: int, stride: int,
+                  min_words: int = 1) -> List[Tuple[int, int]]:
+    """
+    Word ranges for windows of window_size words every stride words.
+
+    Args:
+        num_words: Number of words in the document
+        window_size: Words per window
+        stride: Words between window starts
+        min_words: Skip windows shorter than this
+
+    Returns:
+        List of (start, end) word positions
+    """
+
+    bounds = []
+    for start in range(0, num_words, max(1, stride)):
+        end = min(num_words, start + window_size)
+        if end - start >= min_words:
+            bounds.append((start, end))
+    return bounds
@@ -5,8 +5,12 @@ Generates anonymous user profiles from interest scores.
 Profiles reset daily and include social style, activity preferences, and personalized suggestions.
 """
 
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass, field
+
+from document import Document
+from interests import score_interests, get_taxonomy
+from result_cache import RESULT_CACHE
 
 
 @dataclass
@@ -18,6 +22,7 @@ class UserProfile:
     activity_preference: str  # solo, small group, large group
     reasoning: str  # Explanation of profile derivation
     suggestions: List[str]  # 3 personalized suggestions
+    cache_key: Optional[Tuple] = field(default=None, repr=False, compare=False)  # create_profile's RESULT_CACHE key
 
 
 # Mapping of interest categories to social characteristics
@@ -220,7 +225,7 @@ def build_reasoning(
 
 
 def create_profile(
-    scores: Dict[str, float],
+    scores: Union[Dict[str, float], Document],
     energy_level: Optional[str] = None,
     social_level: Optional[str] = None,
     time_of_day: Optional[str] = None,
@@ -229,14 +234,29 @@ def create_profile(
     Generate an anonymous user profile from interest scores.
     
     Args:
-        scores: Dictionary of interest categories with percentage scores
+        scores: Dictionary of interest categories with percentage scores,
+            or a Document to score first
         energy_level: Optional metadata (not used in current version)
         social_level: Optional metadata (not used in current version)
         time_of_day: Optional metadata (not used in current version)
     
     Returns:
         UserProfile object containing complete profile information
+        (memoized in RESULT_CACHE by input scores or document hash)
     """
+    if isinstance(scores, Document):
+        source = (scores.digest, get_taxonomy().version)
+    else:
+        source = tuple(sorted(scores.items()))
+    key = ("create_profile", source, energy_level, social_level, time_of_day)
+    return RESULT_CACHE.get_or_compute(key, lambda: _create_profile(scores, key))
+
+
+def _create_profile(scores: Union[Dict[str, float], Document], cache_key: Optional[Tuple] = None) -> UserProfile:
+    """Uncached implementation of create_profile."""
+    if isinstance(scores, Document):
+        scores = score_interests(scores)
+    
     # Get top interests
     sorted_interests = sorted(scores.items(), key=lambda x: x[1], reverse=True)
     core_interests = [cat for cat, _ in sorted_interests[:3]]
@@ -259,6 +279,7 @@ def create_profile(
         activity_preference=activity_preference,
         reasoning=reasoning,
         suggestions=suggestions,
+        cache_key=cache_key,
     )
 
 
@@ -270,8 +291,17 @@ def format_profile_for_display(profile: UserProfile) -> Dict:
         profile: UserProfile object
     
     Returns:
-        Dictionary with formatted profile data
+        Dictionary with formatted profile data (memoized under the
+        create_profile key; hand-built profiles are formatted directly)
     """
+    if profile.cache_key is None:
+        return _format_profile_for_display(profile)
+    key = ("format_profile_for_display", profile.cache_key)
+    return RESULT_CACHE.get_or_compute(key, lambda: _format_profile_for_display(profile))
+
+
+def _format_profile_for_display(profile: UserProfile) -> Dict:
+    """Uncached implementation of format_profile_for_display."""
     return {
         "Core Interests": ", ".join(profile.core_interests),
         "Secondary Interests": ", ".join(profile.secondary_interests) if profile.secondary_interests else "None",
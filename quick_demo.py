@@ -125,10 +125,8 @@ print("="*60)
 
 try:
     classifier.save_model("demo_classifier")
-    print("✓ Model saved! Files created:")
-    print("  • demo_classifier_model.pkl")
-    print("  • demo_classifier_vectorizer.pkl")
-    print("  • demo_classifier_labels.pkl")
+    print("✓ Model saved! File created:")
+    print("  • demo_classifier.model")
 except Exception as e:
     print(f"Save error: {e}")
 
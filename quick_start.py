@@ -183,10 +183,8 @@ classifier.save_model("interest_classifier")
 print("""
 ✓ Model saved successfully!
 
-Files created:
-  • interest_classifier_model.pkl     (Logistic Regression)
-  • interest_classifier_vectorizer.pkl (TF-IDF Vectorizer)
-  • interest_classifier_labels.pkl     (Class mappings)
+File created:
+  • interest_classifier.model  (vocabulary, TF-IDF weights, coefficients, labels)
 
 Now you can use in Streamlit:
   from ml_classifier import InterestClassifier
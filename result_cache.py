@@ -0,0 +1,138 @@
+"""
+Result Cache
+
+Bounded LRU memoization for text analysis results. Entries are keyed by a
+content hash of the input (plus whatever else the result depends on, such
+as the taxonomy version), so Streamlit reruns on an unchanged transcript
+skip cleaning, tokenizing and scoring entirely.
+"""
+
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Union
+
+from document import Document
+
+
+# Default budgets (override with RESULT_CACHE.configure)
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024  # 32 MB
+
+_MISSING = object()  # Distinguishes a miss from a cached None
+
+
+def content_key(text: Union[str, Document]) -> str:
+    """Hash raw text (or a Document's raw text) without cleaning it."""
+    if isinstance(text, Document):
+        return text.digest
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache bounded by entry count and byte size.
+
+    Values are stored pickled, which both measures their size exactly and
+    hands every caller a private copy they can't use to corrupt the cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()  # key -> pickled value
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def configure(self, max_entries: int = None, max_bytes: int = None) -> None:
+        """Change the budgets, evicting immediately if the cache is now over them."""
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._evict()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable cache key
+            compute: Zero-argument function producing the value
+
+        Returns:
+            The cached (unpickled copy) or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key (an unpickled copy), or default on a miss."""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        return pickle.loads(blob) if blob is not None else default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting least recently used entries if over budget."""
+        self._put(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _put(self, key: Hashable, blob: bytes) -> None:
+        if len(blob) > self.max_bytes:
+            return  # Would evict everything else; just don't cache it
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = blob
+            self._bytes += len(blob)
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, blob = self._entries.popitem(last=False)
+            self._bytes -= len(blob)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counts, hit rate and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# Shared cache used by interests and profiles
+RESULT_CACHE = ResultCache()
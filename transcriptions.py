@@ -104,13 +104,16 @@ def transcribe_audio_bytes(
             vad_filter=vad_filter,  # Enable/disable voice detection
             language=language or None,  # Set language (None for auto-detect)
         )
+        # Keep segment timestamps so interests can be plotted over time
+        segment_list = [{"start": seg.start, "end": seg.end, "text": seg.text} for seg in segments]
         # Join all transcribed segments into single string
-        transcript = " ".join(seg.text for seg in segments).strip()
+        transcript = " ".join(seg["text"] for seg in segment_list).strip()
         # Extract metadata about transcription
         meta = {
             "language": getattr(info, "language", None),  # Detected language
             "language_probability": getattr(info, "language_probability", None),  # Detection confidence
             "duration": getattr(info, "duration", None),  # Audio duration in seconds
+            "segments": segment_list,  # Timestamped segments ({"start", "end", "text"})
         }
         # Return transcript text and metadata
         return transcript, meta